@@ -0,0 +1,95 @@
+"""
+Micro-benchmark: building the regression dataset from synthetic per-activity records.
+
+Compares FeatureRowBuilder (columnar, one DataFrame at the end) against the old pattern
+of merging one-row DataFrames per activity and pd.concat-ing them onto a growing frame.
+The builder's per-row cost should stay flat from 100 to 10,000 activities; the legacy
+path's per-row cost grows with n.
+
+    python -m back_end.benchmarks.feature_row_builder_benchmark
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from back_end.report_objects.feature_rows import FeatureRowBuilder
+
+_SIZES = [100, 1_000, 10_000]
+# The legacy path is quadratic; past a couple thousand rows it just takes too long to be useful.
+_LEGACY_MAX_SIZE = 2_000
+
+
+def _synthetic_records(n: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1, 6, 30)
+    records = []
+    for i in range(n):
+        start_time = start + timedelta(hours=12 * i)
+        records.append({
+            'activity_id': 10_000_000_000 + i,
+            'activity_name': 'Morning Run',
+            'start_time': pd.Timestamp(start_time),
+            'finish_time': pd.Timestamp(start_time + timedelta(minutes=rng.uniform(25, 120))),
+            'distance_miles': round(rng.uniform(3, 20), 2),
+            'pace': round(rng.uniform(6.5, 10.0), 2),
+            'avg_hr': rng.randint(120, 180),
+            'elevation_gain': rng.uniform(0, 1500),
+            'longitude': -78.6382,
+            'latitude': 35.7796,
+            'temperature': rng.uniform(20, 95),
+            'humidity': rng.randint(20, 100),
+            'hrv': rng.randint(40, 90),
+            'resting_heart_rate': rng.randint(42, 60),
+            'days_since_start': i // 2,
+        })
+    return records
+
+
+def _build_with_builder(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    return FeatureRowBuilder().extend(records).to_dataframe()
+
+
+def _build_with_concat(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    summary_cols = ['activity_id', 'activity_name', 'start_time', 'finish_time', 'distance_miles',
+                    'pace', 'avg_hr', 'elevation_gain', 'longitude', 'latitude']
+    regression_data = pd.DataFrame()
+    for record in records:
+        summary = pd.DataFrame([{col: record[col] for col in summary_cols}])
+        weather = pd.DataFrame([{k: record[k] for k in ('activity_id', 'temperature', 'humidity')}])
+        sleep = pd.DataFrame([{k: record[k] for k in ('activity_id', 'hrv', 'resting_heart_rate')}])
+        days = pd.DataFrame([{k: record[k] for k in ('activity_id', 'days_since_start')}])
+        row = (
+            summary.merge(weather, on=['activity_id'], how='left')
+            .merge(sleep, on=['activity_id'], how='left')
+            .merge(days, on=['activity_id'], how='left')
+        )
+        regression_data = pd.concat([regression_data, row], ignore_index=True)
+    return regression_data
+
+
+def _time(fn, records) -> float:
+    start = time.perf_counter()
+    fn(records)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'activities':>10} | {'builder (s)':>11} | {'us/row':>7} | {'concat (s)':>10} | {'us/row':>7}")
+    print("-" * 58)
+    for n in _SIZES:
+        records = _synthetic_records(n)
+        builder_s = _time(_build_with_builder, records)
+        if n <= _LEGACY_MAX_SIZE:
+            concat_s = _time(_build_with_concat, records)
+            concat_cols = f"{concat_s:>10.3f} | {concat_s / n * 1e6:>7.1f}"
+        else:
+            concat_cols = f"{'skipped':>10} | {'':>7}"
+        print(f"{n:>10} | {builder_s:>11.4f} | {builder_s / n * 1e6:>7.1f} | {concat_cols}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Micro-benchmark: per-keystroke rerender cost of the Marathon Plan editor on a 52-week plan.
+
+Each Streamlit rerun of the editor normalizes the edited frame (MarathonPlan.normalize_plan_df)
+and builds the readable view with weekly totals (MarathonPlan.build_readable_view). This times
+that pair against the previous implementation (copy + per-column coercion, then iterrows and
+per-cell string building), which is kept inline below for comparison. The vectorized path
+should stay well under a few milliseconds per rerender.
+
+    python -m back_end.benchmarks.plan_view_benchmark
+"""
+
+import random
+import time
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from back_end.marathon_objects.marathon_plan_manager import MarathonPlan
+
+_WEEKS = 52
+_REPEATS = 50
+# A rerender should stay interactive; flag anything slower than this.
+_BUDGET_MS = 5.0
+
+
+def _synthetic_plan(weeks: int) -> pd.DataFrame:
+    rng = random.Random(42)
+    start = date(2026, 1, 5)
+    plan = MarathonPlan('Benchmark Plan', start, start + pd.Timedelta(weeks=weeks - 1))
+    for week in plan.weeks:
+        for day in MarathonPlan.DAY_COLUMNS:
+            run = week.get_run(day)
+            run_type = rng.choice(MarathonPlan.RUN_TYPES)
+            run.set_type(run_type)
+            if run_type != 'Rest':
+                run.set_distance(round(rng.uniform(3, 20), 1))
+            if rng.random() < 0.3:
+                run.set_notes(rng.choice(['hills', 'strides', 'tempo 4 mi', 'with group']))
+    return plan.to_dataframe()
+
+
+def _legacy_ensure_columns(df: pd.DataFrame) -> pd.DataFrame:
+    dfc = df.copy()
+    expected = MarathonPlan.plan_columns()
+    for col in expected:
+        if col not in dfc.columns:
+            if col.endswith('_Dist'):
+                dfc[col] = 0.0
+            elif col.endswith('_Type'):
+                dfc[col] = MarathonPlan.RUN_TYPES[0]
+            elif col.endswith('_Notes'):
+                dfc[col] = ''
+    for col in MarathonPlan.distance_columns():
+        dfc[col] = pd.to_numeric(dfc[col], errors='coerce').fillna(0.0)
+    for col in MarathonPlan.type_columns():
+        dfc[col] = dfc[col].fillna(MarathonPlan.RUN_TYPES[0]).astype(str)
+    for col in MarathonPlan.notes_columns():
+        dfc[col] = dfc[col].fillna('').astype(str)
+    return dfc[expected]
+
+
+def _legacy_readable_view(df: pd.DataFrame) -> pd.DataFrame:
+    source = df.copy()
+    source['Weekly Total'] = source[MarathonPlan.distance_columns()].sum(axis=1).round(2)
+    display_rows: List[Dict[str, Any]] = []
+    for _, row in source.iterrows():
+        out: Dict[str, Any] = {'Week': row['Week'], 'First_Monday': row['First_Monday']}
+        for day in MarathonPlan.DAY_COLUMNS:
+            dist, rtype, notes = row.get(f"{day}_Dist", 0.0), row.get(f"{day}_Type", ''), row.get(f"{day}_Notes", '')
+            parts: List[str] = []
+            if isinstance(dist, (int, float)) and float(dist) > 0:
+                parts.append(f"{float(dist):g}")
+            if rtype:
+                parts.append(str(rtype))
+            if notes:
+                parts.append(str(notes))
+            out[day] = ' - '.join(parts) if len(parts) > 2 else ' '.join(parts)
+        out['Weekly Total'] = row.get('Weekly Total', 0.0)
+        display_rows.append(out)
+    return pd.DataFrame(display_rows, columns=['Week', 'First_Monday', *MarathonPlan.DAY_COLUMNS, 'Weekly Total'])
+
+
+def _legacy_rerender(df: pd.DataFrame) -> pd.DataFrame:
+    edited = _legacy_ensure_columns(df)
+    MarathonPlan.compute_weekly_totals_df(edited.copy())
+    return _legacy_readable_view(edited.copy())
+
+
+def _rerender(df: pd.DataFrame) -> pd.DataFrame:
+    return MarathonPlan.build_readable_view(MarathonPlan.normalize_plan_df(df))
+
+
+def _time_ms(fn: Callable[[pd.DataFrame], pd.DataFrame], df: pd.DataFrame) -> float:
+    fn(df)  # warm-up
+    start = time.perf_counter()
+    for _ in range(_REPEATS):
+        fn(df)
+    return (time.perf_counter() - start) / _REPEATS * 1000
+
+
+def main() -> None:
+    df = _synthetic_plan(_WEEKS)
+    pd.testing.assert_frame_equal(_rerender(df), _legacy_rerender(df))
+
+    legacy_ms = _time_ms(_legacy_rerender, df)
+    vectorized_ms = _time_ms(_rerender, df)
+    print(f"{_WEEKS}-week plan, mean of {_REPEATS} rerenders")
+    print(f"{'legacy (ms)':>12} | {'vectorized (ms)':>15} | {'speed-up':>8}")
+    print("-" * 42)
+    print(f"{legacy_ms:>12.2f} | {vectorized_ms:>15.2f} | {legacy_ms / vectorized_ms:>7.1f}x")
+    if vectorized_ms > _BUDGET_MS:
+        print(f"WARNING: rerender exceeds the {_BUDGET_MS:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
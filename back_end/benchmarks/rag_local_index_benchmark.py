@@ -0,0 +1,65 @@
+"""
+Micro-benchmark: top-k search over the offline RAG index (back_end/rag/local_index.py).
+
+Builds a synthetic index of a few thousand 1024-dimensional chunks (voyage-3's size), writes it
+with write_index and loads it back memory-mapped, exactly as rag_search's local fallback does,
+then times LocalIndex.search against a brute-force full sort. A query over a corpus this size
+should stay under a millisecond.
+
+    python -m back_end.benchmarks.rag_local_index_benchmark
+"""
+
+import tempfile
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from back_end.rag.local_index import LocalIndex, write_index
+
+_CHUNKS = 3000
+_DIMENSION = 1024
+_TOP_K = 5
+_REPEATS = 200
+# The local fallback should answer as fast as an in-process lookup; flag anything slower.
+_BUDGET_MS = 1.0
+
+
+def _full_sort_search(index: LocalIndex, query: np.ndarray) -> List[int]:
+    scores = np.asarray(index.matrix) @ (query / np.linalg.norm(query))
+    return list(np.argsort(-scores, kind="stable")[:_TOP_K])
+
+
+def _time_ms(fn: Callable[[], object]) -> float:
+    fn()  # warm-up (also pages the mmap in)
+    start = time.perf_counter()
+    for _ in range(_REPEATS):
+        fn()
+    return (time.perf_counter() - start) / _REPEATS * 1000
+
+
+def main() -> None:
+    rng = np.random.default_rng(42)
+    embeddings = rng.standard_normal((_CHUNKS, _DIMENSION)).astype(np.float32)
+    chunks = [{"source": f"doc{i // 20}.md", "content": f"chunk {i}", "metadata": {}} for i in range(_CHUNKS)]
+    query = rng.standard_normal(_DIMENSION).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_index(directory, embeddings, chunks, "benchmark")
+        index = LocalIndex.load(directory)
+        expected = [chunks[i]["content"] for i in _full_sort_search(index, query)]
+        assert [match["content"] for match in index.search(query, _TOP_K)] == expected
+
+        full_sort_ms = _time_ms(lambda: _full_sort_search(index, query))
+        search_ms = _time_ms(lambda: index.search(query, _TOP_K))
+
+    print(f"{_CHUNKS} chunks x {_DIMENSION} dims, top {_TOP_K}, mean of {_REPEATS} queries")
+    print(f"{'full sort (ms)':>14} | {'argpartition (ms)':>17} | {'speed-up':>8}")
+    print("-" * 46)
+    print(f"{full_sort_ms:>14.3f} | {search_ms:>17.3f} | {full_sort_ms / search_ms:>7.1f}x")
+    if search_ms > _BUDGET_MS:
+        print(f"WARNING: local search exceeds the {_BUDGET_MS:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import os
+
 REGRESSION_START_DATE_YEAR = 2024
 REGRESSION_START_DATE_MONTH = 1
 REGRESSION_START_DATE_DAY = 1
@@ -16,3 +18,81 @@ HR_TARGETS = {
     'Workout': 175,
     'Rest': None,  # Do not predict on Rest
 }
+
+# Feature extraction concurrency (max in-flight Garmin / OpenWeatherMap calls)
+FEATURE_PIPELINE_MAX_GARMIN_CALLS = 4
+FEATURE_PIPELINE_MAX_WEATHER_CALLS = 4
+
+# Local on-disk caches (weather, etc.). Override with GARMIN_ANALYSIS_CACHE_DIR.
+LOCAL_CACHE_DIR = os.path.expanduser(os.getenv("GARMIN_ANALYSIS_CACHE_DIR") or "~/.garmin-analysis")
+
+# Weather cache: readings are keyed by (lat/lon rounded to this many decimals, hour)
+WEATHER_CACHE_COORD_DECIMALS = 2
+WEATHER_CACHE_TTL_SECONDS = 24 * 3600
+
+# HTTP: pooled keep-alive connections, retry with exponential backoff + jitter
+HTTP_POOL_SIZE = 8
+HTTP_TIMEOUT_SECONDS = 30
+HTTP_MAX_RETRIES = 4
+HTTP_BACKOFF_BASE_SECONDS = 0.5
+HTTP_BACKOFF_MAX_SECONDS = 30.0
+
+# Request rate limits (token bucket: sustained requests/second, burst size)
+OPENWEATHERMAP_RATE_PER_SECOND = 1.0  # free tier allows 60 calls/minute
+OPENWEATHERMAP_BURST = 5
+GARMIN_RATE_PER_SECOND = 2.0
+GARMIN_BURST = 8
+
+# Sleep/HRV cache: complete past nights are kept forever; today's (still-changing) entry expires after
+# this. A past night missing HRV or resting HR (not synced yet, or not recorded) is retried after the
+# longer TTL, so it can fill in without re-asking Garmin about every unrecorded night on each run.
+WELLNESS_CACHE_TODAY_TTL_SECONDS = 15 * 60
+WELLNESS_CACHE_INCOMPLETE_TTL_SECONDS = 6 * 60 * 60
+
+# Saved pace models: how long a loaded artifact is trusted before checking Garmin for new activities
+MODEL_FRESHNESS_CHECK_SECONDS = 60 * 60
+
+# Garmin activityType.typeKey values counted as runs
+RUNNING_ACTIVITY_TYPES = ('treadmill_running', 'running', 'manual', 'track_running')
+
+# Weekly mileage rollup: Garmin history is downloaded in chunks of this many weeks
+WEEKLY_MILEAGE_SYNC_CHUNK_WEEKS = 26
+
+# Loaded marathon plans kept in the process-wide plan cache (LRU beyond this)
+PLAN_CACHE_MAX_ENTRIES = 16
+
+# Streamlit data layer (front_end/data_layer.py): how long fetched Garmin data is reused across reruns/tabs
+UI_WEEKLY_MILEAGE_TTL_SECONDS = 15 * 60
+UI_PERSONAL_RECORDS_TTL_SECONDS = 6 * 3600
+
+# MCP server: blocking Garmin work runs on this many threads; each tool call waits at most this long
+MCP_GARMIN_MAX_WORKERS = 4
+MCP_GARMIN_CALL_TIMEOUT_SECONDS = 60.0
+# A first weekly-mileage sync can download months of activities
+MCP_WEEKLY_MILEAGE_TIMEOUT_SECONDS = 300.0
+
+# MCP response cache: details of finished activities and complete past nights are kept until evicted;
+# anything touching today expires after MCP_CACHE_TODAY_TTL_SECONDS. Past date-range listings expire
+# after MCP_ACTIVITY_LIST_TTL_SECONDS, since an activity can sync days after it was recorded.
+MCP_RESPONSE_CACHE_MAX_ENTRIES = 512
+MCP_CACHE_TODAY_TTL_SECONDS = 5 * 60
+MCP_ACTIVITY_LIST_TTL_SECONDS = 30 * 60
+MCP_PERSONAL_RECORDS_TTL_SECONDS = 60 * 60
+
+# RAG ingest pipeline: processes extracting/chunking files, concurrent Voyage embedding requests
+RAG_EXTRACT_MAX_PROCESSES = os.cpu_count() or 2
+RAG_EMBED_MAX_CONCURRENCY = 2
+# Parsed PDF page text, one JSON file per PDF content hash
+RAG_PDF_PAGE_CACHE_DIR = os.path.join(LOCAL_CACHE_DIR, "pdf_pages")
+
+# rag_search caches: persisted query embeddings (LRU), in-memory search results (TTL, cleared by ingest)
+RAG_QUERY_EMBEDDING_CACHE_MAX_ENTRIES = 500
+RAG_RESULT_CACHE_TTL_SECONDS = 5 * 60
+RAG_RESULT_CACHE_MAX_ENTRIES = 256
+
+# rag_search backend: "auto" (pgvector, falling back to the local index when Supabase/Voyage fail),
+# "pgvector" or "local". The local index lives in RAG_LOCAL_INDEX_DIR (python -m back_end.rag.local_index);
+# GARMIN_ANALYSIS_RAG_EMBEDDER ("package.module:factory") embeds queries for an index built locally.
+RAG_SEARCH_BACKEND = os.getenv("GARMIN_ANALYSIS_RAG_BACKEND", "auto")
+RAG_LOCAL_INDEX_DIR = os.path.join(LOCAL_CACHE_DIR, "rag_index")
+RAG_LOCAL_EMBEDDER = os.getenv("GARMIN_ANALYSIS_RAG_EMBEDDER")
@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+_UNSET = object()
+
+
+class JsonFileCache:
+    """
+    Small persistent key -> JSON-serializable value cache backed by a single file.
+
+    Each entry carries its own expiry (ttl_seconds=None keeps it forever). If max_entries is
+    set, the least recently used entries are evicted past that size. Safe to share between
+    threads; every write rewrites the file atomically so a crash never leaves it half-written.
+    """
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None):
+        self.path = os.path.expanduser(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._entries: Optional["OrderedDict[str, Dict[str, Any]]"] = None
+
+    def _load(self) -> "OrderedDict[str, Dict[str, Any]]":
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._entries = OrderedDict(json.load(f))
+            except (FileNotFoundError, ValueError):
+                self._entries = OrderedDict()
+        return self._entries
+
+    def _flush(self) -> None:
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None:
+                return default
+            expires_at = entry.get("expires_at")
+            if expires_at is not None and expires_at <= time.time():
+                del entries[key]
+                return default
+            entries.move_to_end(key)
+            return entry["value"]
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _UNSET) is not _UNSET
+
+    def set(self, key: str, value: Any, ttl_seconds: Any = _UNSET) -> None:
+        self.set_many({key: value}, ttl_seconds)
+
+    def set_many(self, items: Dict[str, Any], ttl_seconds: Any = _UNSET) -> None:
+        """Store several entries with one write to disk."""
+        if not items:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is _UNSET else ttl_seconds
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            entries = self._load()
+            for key, value in items.items():
+                entries[key] = {"value": value, "expires_at": expires_at}
+                entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(entries) > self.max_entries:
+                    entries.popitem(last=False)
+            self._flush()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._flush()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = OrderedDict()
+            self._flush()
@@ -1,10 +1,12 @@
 import re
 from datetime import date, datetime, timedelta
-from typing import Optional, Tuple, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Tuple, Dict, Any, List, Sequence, Union
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from back_end.report_objects.report_reader import ReportReader
+from back_end.report_objects.wellness_cache import get_wellness_cache
 from back_end.constants import (
     REGRESSION_START_DATE_YEAR,
     REGRESSION_START_DATE_MONTH,
@@ -14,7 +16,82 @@ from back_end.constants import (
     ELEVATION_FT_PER_MILE,
     HR_TARGETS,
 )
-from back_end.predictive_models.regression_predictive_model import PredictivePacingModel
+from back_end.predictive_models.linear_predictor import FusedLinearPredictor
+
+if TYPE_CHECKING:
+    from back_end.predictive_models.regression_predictive_model import PredictivePacingModel
+
+
+_DAY_COUNT = 7
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value), '%Y-%m-%d').date()
+
+
+class _PlanGrid:
+    """
+    Columnar storage behind a plan: one row per week, one column per day (Mon..Sun).
+
+    distance is float64, run types are small integer codes into type_names, notes are an object
+    array. Dates are not stored per run; they follow from start_monday and the week number.
+    """
+
+    __slots__ = ('start_monday', 'week_numbers', 'distance', 'type_codes', 'notes', 'type_names', '_type_index')
+
+    def __init__(self, start_monday: date, week_numbers, distance=None, type_codes=None, notes=None,
+                 type_names: Optional[Sequence[str]] = None):
+        n = len(week_numbers)
+        self.start_monday = start_monday
+        self.week_numbers = np.asarray(week_numbers, dtype=np.int32).reshape(n)
+        self.distance = np.zeros((n, _DAY_COUNT)) if distance is None else np.asarray(distance, dtype=np.float64).reshape(n, _DAY_COUNT)
+        self.type_codes = np.zeros((n, _DAY_COUNT), dtype=np.int16) if type_codes is None else np.asarray(type_codes, dtype=np.int16).reshape(n, _DAY_COUNT)
+        self.notes = np.full((n, _DAY_COUNT), '', dtype=object) if notes is None else np.asarray(notes, dtype=object).reshape(n, _DAY_COUNT)
+        self.type_names: List[str] = list(type_names or MarathonPlan.RUN_TYPES)
+        self._type_index = {name: code for code, name in enumerate(self.type_names)}
+
+    def __len__(self) -> int:
+        return len(self.week_numbers)
+
+    def type_code(self, name: str) -> int:
+        code = self._type_index.get(name)
+        if code is None:
+            code = len(self.type_names)
+            self.type_names.append(name)
+            self._type_index[name] = code
+        return code
+
+    def encode_types(self, names: np.ndarray) -> np.ndarray:
+        """Vectorized type_code over an array of type names."""
+        uniques, inverse = np.unique(names.astype(str), return_inverse=True)
+        codes = np.fromiter((self.type_code(name) for name in uniques), dtype=np.int16, count=len(uniques))
+        return codes[inverse].reshape(names.shape)
+
+    def type_labels(self) -> np.ndarray:
+        """(n, 7) object array of run type names."""
+        return np.asarray(self.type_names, dtype=object)[self.type_codes]
+
+    def week_starts(self) -> np.ndarray:
+        return np.datetime64(self.start_monday, 'D') + (self.week_numbers.astype(np.int64) - 1) * 7
+
+    def dates(self) -> np.ndarray:
+        """(n, 7) datetime64[D] array of every run date."""
+        return self.week_starts()[:, None] + np.arange(_DAY_COUNT)
+
+    def week_start(self, row: int) -> date:
+        return self.start_monday + timedelta(days=7 * (int(self.week_numbers[row]) - 1))
+
+    def row_of_week(self, week_number: int) -> Optional[int]:
+        # Weeks are normally numbered 1..n in order, which makes this an index computation.
+        row = week_number - 1
+        if 0 <= row < len(self.week_numbers) and self.week_numbers[row] == week_number:
+            return row
+        matches = np.flatnonzero(self.week_numbers == week_number)
+        return int(matches[0]) if len(matches) else None
 
 
 class PlanRun:
@@ -26,72 +103,124 @@ class PlanRun:
         distance: Planned distance in miles (float)
         run_type: One of the supported run types (str)
         notes: Free-form notes (str)
+
+    A PlanRun returned by PlanWeek.get_run is a view onto the plan's arrays: setters write
+    through to the plan. One built directly holds its own values until it is set on a week.
     """
 
+    __slots__ = ('_grid', '_row', '_col', '_date', '_distance', '_type', '_notes')
+
     def __init__(self, date: date, distance: float = 0.0, run_type: str = 'Rest', notes: str = ''):
+        self._grid = None
+        self._row = self._col = 0
         self._date = date
         self._distance = float(distance) if distance is not None else 0.0
         self._type = str(run_type) if run_type is not None else 'Rest'
         self._notes = str(notes) if notes is not None else ''
 
+    @classmethod
+    def _view(cls, grid: _PlanGrid, row: int, col: int) -> 'PlanRun':
+        run = cls.__new__(cls)
+        run._grid, run._row, run._col = grid, row, col
+        return run
+
     # Getters
     def get_distance(self) -> float:
-        return self._distance
+        if self._grid is None:
+            return self._distance
+        return float(self._grid.distance[self._row, self._col])
 
     def get_type(self) -> str:
-        return self._type
+        if self._grid is None:
+            return self._type
+        return self._grid.type_names[self._grid.type_codes[self._row, self._col]]
 
     def get_notes(self) -> str:
-        return self._notes
+        if self._grid is None:
+            return self._notes
+        return self._grid.notes[self._row, self._col]
 
     def get_date(self) -> date:
-        return self._date
+        if self._grid is None:
+            return self._date
+        return self._grid.week_start(self._row) + timedelta(days=self._col)
 
     # Setters
     def set_distance(self, distance: float) -> None:
-        self._distance = float(distance) if distance is not None else 0.0
+        distance = float(distance) if distance is not None else 0.0
+        if self._grid is None:
+            self._distance = distance
+        else:
+            self._grid.distance[self._row, self._col] = distance
 
     def set_type(self, run_type: str) -> None:
-        self._type = str(run_type) if run_type is not None else 'Rest'
+        run_type = str(run_type) if run_type is not None else 'Rest'
+        if self._grid is None:
+            self._type = run_type
+        else:
+            self._grid.type_codes[self._row, self._col] = self._grid.type_code(run_type)
 
     def set_notes(self, notes: str) -> None:
-        self._notes = str(notes) if notes is not None else ''
+        notes = str(notes) if notes is not None else ''
+        if self._grid is None:
+            self._notes = notes
+        else:
+            self._grid.notes[self._row, self._col] = notes
 
 
 class PlanWeek:
     """
     Represents one training week composed of 7 PlanRun entries.
     Week boundaries are derived from the plan's Monday-aligned start date.
+
+    Weeks obtained from MarathonPlan.weeks are views onto one row of the plan's arrays; a week
+    built directly owns a one-row grid of its own until it is assigned to a plan.
     """
 
-    def __init__(self, week_number: int, plan_start_monday: date, run_types: list[str], runs_by_day: dict | None = None):
-        self.week_number = int(week_number)
-        # Week start/end computed from the plan start Monday
-        self.start_date: date = plan_start_monday + timedelta(days=7 * (self.week_number - 1))
-        self.end_date: date = self.start_date + timedelta(days=6)
-        self._day_names = MarathonPlan.DAY_COLUMNS
-        self._runs: dict[str, PlanRun] = {}
+    __slots__ = ('_grid', '_row')
 
+    def __init__(self, week_number: int, plan_start_monday: date, run_types: list[str], runs_by_day: dict | None = None):
+        self._grid = _PlanGrid(plan_start_monday, [week_number], type_names=run_types)
+        self._row = 0
         if runs_by_day is not None:
             # Expect mapping of day name -> PlanRun
-            for day in self._day_names:
-                self._runs[day] = runs_by_day.get(day) or PlanRun(self._day_date(day), 0.0, run_types[0], '')
-        else:
-            for day in self._day_names:
-                self._runs[day] = PlanRun(self._day_date(day), 0.0, run_types[0], '')
+            for day in MarathonPlan.DAY_COLUMNS:
+                run = runs_by_day.get(day)
+                if run is not None:
+                    self.set_run(day, run)
+
+    @classmethod
+    def _view(cls, grid: _PlanGrid, row: int) -> 'PlanWeek':
+        week = cls.__new__(cls)
+        week._grid, week._row = grid, row
+        return week
+
+    @property
+    def week_number(self) -> int:
+        return int(self._grid.week_numbers[self._row])
+
+    @property
+    def start_date(self) -> date:
+        return self._grid.week_start(self._row)
+
+    @property
+    def end_date(self) -> date:
+        return self.start_date + timedelta(days=6)
 
     def _day_date(self, day_name: str) -> date:
-        idx = self._day_names.index(day_name)
-        return self.start_date + timedelta(days=idx)
+        return self.start_date + timedelta(days=MarathonPlan.DAY_INDEX[day_name])
 
     def get_run(self, day_name: str) -> PlanRun:
-        return self._runs[day_name]
+        return PlanRun._view(self._grid, self._row, MarathonPlan.DAY_INDEX[day_name])
 
     def set_run(self, day_name: str, run: PlanRun) -> None:
-        self._runs[day_name] = run
+        col = MarathonPlan.DAY_INDEX[day_name]
+        self._grid.distance[self._row, col] = run.get_distance()
+        self._grid.type_codes[self._row, col] = self._grid.type_code(run.get_type())
+        self._grid.notes[self._row, col] = run.get_notes()
 
     def weekly_total(self) -> float:
-        return round(sum(self._runs[day].get_distance() for day in self._day_names), 2)
+        return round(float(self._grid.distance[self._row].sum()), 2)
 
     def to_row(self) -> dict:
         """Serialize week to a DataFrame row using Dist/Type/Notes schema."""
@@ -99,27 +228,23 @@ class PlanWeek:
             'Week': self.week_number,
             'First_Monday': self.start_date.strftime('%Y-%m-%d'),
         }
-        for day in self._day_names:
-            run = self._runs[day]
-            row[f"{day}_Dist"] = run.get_distance()
-            row[f"{day}_Type"] = run.get_type()
-            row[f"{day}_Notes"] = run.get_notes()
+        labels = self._grid.type_labels()[self._row]
+        for col, day in enumerate(MarathonPlan.DAY_COLUMNS):
+            row[f"{day}_Dist"] = float(self._grid.distance[self._row, col])
+            row[f"{day}_Type"] = labels[col]
+            row[f"{day}_Notes"] = self._grid.notes[self._row, col]
         return row
 
     @classmethod
     def from_row(cls, row: pd.Series, plan_start_monday: date, run_types: list[str]) -> 'PlanWeek':
-        week_number = int(row['Week'])
-        week = cls(week_number, plan_start_monday, run_types)
+        week = cls(int(row['Week']), plan_start_monday, run_types)
         for day in MarathonPlan.DAY_COLUMNS:
-            rdate = week._day_date(day)
             dist = row.get(f"{day}_Dist", 0.0)
-            rtype = row.get(f"{day}_Type", run_types[0])
-            notes = row.get(f"{day}_Notes", '')
             try:
                 dist = float(dist) if dist is not None else 0.0
             except Exception:
                 dist = 0.0
-            week.set_run(day, PlanRun(rdate, dist, str(rtype), str(notes)))
+            week.set_run(day, PlanRun(week._day_date(day), dist, str(row.get(f"{day}_Type", run_types[0])), str(row.get(f"{day}_Notes", ''))))
         return week
 
 
@@ -131,9 +256,13 @@ class MarathonPlan:
     - Raw Columns: 'Week', 'First_Monday', 'Mon','Tue','Wed','Thu','Fri','Sat','Sun'
     - Day cells are free text, recommended format "<miles>: Description" (e.g., "8: Easy")
     - 'Weekly Total' is a computed-only column for display; it is not stored in the raw plan
+
+    Internally the plan is a _PlanGrid (NumPy arrays, one row per week); `weeks` hands out
+    PlanWeek/PlanRun views onto it, so reading or editing a run never copies the plan.
     """
 
     DAY_COLUMNS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    DAY_INDEX = {day: idx for idx, day in enumerate(DAY_COLUMNS)}
     RUN_TYPES = ['Rest', 'Easy', 'Steady', 'Workout']
     META_KEYS = ['name', 'start_date', 'race_date']
 
@@ -141,11 +270,31 @@ class MarathonPlan:
         self.name = name
         self.start = start
         self.end = end
-        # Object model
-        self.weeks: list[PlanWeek] = []
+        # Columnar object model
+        self._grid = _PlanGrid(self._start_monday(), [])
         # Initialize with generated plan (and keep df in sync for compatibility)
         self.df = self.generate_plan(name, start, end)
 
+    def _start_monday(self) -> date:
+        start = _as_date(self.start)
+        return start - timedelta(days=start.weekday())
+
+    @property
+    def weeks(self) -> List[PlanWeek]:
+        """PlanWeek views in plan order. Assign a list of PlanWeek to replace the plan's weeks."""
+        return [PlanWeek._view(self._grid, row) for row in range(len(self._grid))]
+
+    @weeks.setter
+    def weeks(self, weeks: Sequence[PlanWeek]) -> None:
+        weeks = list(weeks)
+        grid = _PlanGrid(self._start_monday(), [w.week_number for w in weeks])
+        for row, week in enumerate(weeks):
+            source = week._grid
+            grid.distance[row] = source.distance[week._row]
+            grid.notes[row] = source.notes[week._row]
+            grid.type_codes[row] = grid.encode_types(source.type_labels()[week._row])
+        self._grid = grid
+
     # ---------- Public API ----------
     def _dist_col(self, day: str) -> str:
         return f"{day}_Dist"
@@ -176,28 +325,18 @@ class MarathonPlan:
         if not isinstance(start, (date, datetime)) or not isinstance(end, (date, datetime)):
             raise TypeError('start and end must be date or datetime')
 
-        start_d = start.date() if isinstance(start, datetime) else start
-        end_d = end.date() if isinstance(end, datetime) else end
+        start_d = _as_date(start)
+        end_d = _as_date(end)
 
         # Monday of the start week and Monday of the race week
         start_monday = start_d - timedelta(days=start_d.weekday())
         end_monday = end_d - timedelta(days=end_d.weekday())
 
-        # Build weekly rows from start_monday through end_monday inclusive
-        week_starts = []
-        current = start_monday
-        while current <= end_monday:
-            week_starts.append(current)
-            current += timedelta(days=7)
-
-        # Build weeks object list
-        self.weeks = []
-        for idx, monday in enumerate(week_starts, start=1):
-            self.weeks.append(PlanWeek(idx, start_monday, self.RUN_TYPES))
+        # One all-Rest row per week from start_monday through end_monday inclusive
+        week_count = max(0, (end_monday - start_monday).days // 7 + 1)
+        self._grid = _PlanGrid(start_monday, np.arange(1, week_count + 1), type_names=self.RUN_TYPES)
         # Produce DataFrame view
-        df_rows = [w.to_row() for w in self.weeks]
-        df = pd.DataFrame(df_rows, columns=['Week', 'First_Monday', *self.distance_columns(), *self.type_columns(), *self.notes_columns()])
-        return df
+        return self._grid_to_dataframe(self._grid)
 
     def compute_weekly_totals(self) -> pd.DataFrame:
         # Ensure df is synchronized with weeks
@@ -206,52 +345,83 @@ class MarathonPlan:
         self.df['Weekly Total'] = self.df[dist_cols].sum(axis=1).round(2)
         return self.df
 
+    @classmethod
+    def plan_columns(cls) -> List[str]:
+        return ['Week', 'First_Monday', *cls.distance_columns(), *cls.type_columns(), *cls.notes_columns()]
+
+    @classmethod
+    def normalize_plan_df(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return df in the raw plan schema: every Dist/Type/Notes column present, distances numeric
+        (blank -> 0.0), types/notes strings, columns in plan order. A frame that already
+        conforms is returned as-is, so calling this on every editor rerun costs no copy.
+        """
+        expected = cls.plan_columns()
+        dist_cols, type_cols, notes_cols = cls.distance_columns(), cls.type_columns(), cls.notes_columns()
+        if (
+            list(df.columns) == expected
+            and all(pd.api.types.is_float_dtype(df[col]) and not df[col].hasnans for col in dist_cols)
+            and not df[type_cols + notes_cols].isna().any(axis=None)
+        ):
+            return df
+        out = df.reindex(columns=expected)
+        out[dist_cols] = out[dist_cols].apply(pd.to_numeric, errors='coerce').fillna(0.0).astype(float)
+        out[type_cols] = out[type_cols].fillna(cls.RUN_TYPES[0]).astype(str)
+        out[notes_cols] = out[notes_cols].fillna('').astype(str)
+        return out
+
     @classmethod
     def compute_weekly_totals_df(cls, df: pd.DataFrame) -> pd.DataFrame:
-        copy_df = df.copy()
+        """df plus a 'Weekly Total' column (missing distance columns count as 0). df itself is not modified."""
         dist_cols = cls.distance_columns()
-        for col in dist_cols:
-            if col not in copy_df.columns:
-                copy_df[col] = 0.0
-        copy_df['Weekly Total'] = copy_df[dist_cols].sum(axis=1).round(2)
-        return copy_df
+        missing = {col: 0.0 for col in dist_cols if col not in df.columns}
+        totals = df.reindex(columns=dist_cols, fill_value=0.0).sum(axis=1).round(2)
+        return df.assign(**missing, **{'Weekly Total': totals})
+
+    @classmethod
+    def _numeric_block(cls, df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """(n, len(columns)) float array; missing columns and unparseable cells are NaN."""
+        block = df.reindex(columns=columns)
+        if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in block.dtypes):
+            block = block.apply(pd.to_numeric, errors='coerce')
+        return block.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    @classmethod
+    def _text_block(cls, df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """(n, len(columns)) object array of strings; missing columns and nulls are ''."""
+        block = df.reindex(columns=columns).to_numpy(dtype=object)
+        block[pd.isna(block)] = ''
+        return block.astype(str).astype(object)
 
     @classmethod
     def build_readable_view(cls, df: pd.DataFrame) -> pd.DataFrame:
         """
         Return a display DataFrame with columns: Week, First_Monday, Mon..Sun (combined string), Weekly Total
         Combined string per day: "<dist> <type> - <notes>" if dist>0; "Rest - <notes>" if type==Rest and dist==0; notes optional.
-        """
-        source = cls.compute_weekly_totals_df(df)
-        display_rows: List[Dict[str, Any]] = []
-        for _, row in source.iterrows():
-            out: Dict[str, Any] = {
-                'Week': row['Week'],
-                'First_Monday': row['First_Monday'],
-            }
-            for day in cls.DAY_COLUMNS:
-                dist = row.get(f"{day}_Dist", 0.0)
-                rtype = row.get(f"{day}_Type", '')
-                notes = row.get(f"{day}_Notes", '')
-                parts: List[str] = []
-                if (isinstance(dist, (int, float)) and float(dist) > 0) or (isinstance(dist, str) and dist.strip()):
-                    try:
-                        dval = float(dist)
-                    except Exception:
-                        dval = 0.0
-                    if dval > 0:
-                        parts.append(f"{dval:g}")
-                if rtype:
-                    parts.append(str(rtype))
-                if notes:
-                    parts.append(str(notes))
-                if not parts:
-                    parts.append('')
-                out[day] = ' - '.join(parts) if len(parts) > 2 else ' '.join(parts)
-            out['Weekly Total'] = row.get('Weekly Total', 0.0)
-            display_rows.append(out)
-        return pd.DataFrame(display_rows, columns=['Week', 'First_Monday', *cls.DAY_COLUMNS, 'Weekly Total'])
 
+        All seven days are assembled at once from (weeks x 7) arrays; there is no per-row or
+        per-cell Python loop, and df is not copied or modified.
+        """
+        dist = cls._numeric_block(df, cls.distance_columns())
+        rtype = cls._text_block(df, cls.type_columns())
+        notes = cls._text_block(df, cls.notes_columns())
+
+        has_dist = dist > 0
+        has_type, has_notes = rtype != '', notes != ''
+        dist_text = np.where(has_dist, np.char.mod('%g', np.where(has_dist, dist, 0.0)), '').astype(object)
+        # Space-join whichever parts are present; all three present -> "dist - type - notes"
+        cell = np.where(has_dist & has_type, dist_text + ' ' + rtype, np.where(has_type, rtype, dist_text))
+        cell = np.where((has_dist | has_type) & has_notes, cell + ' ' + notes, np.where(has_notes, notes, cell))
+        cell = np.where(has_dist & has_type & has_notes, dist_text + ' - ' + rtype + ' - ' + notes, cell)
+
+        n = len(df)
+        out: Dict[str, Any] = {
+            'Week': df['Week'].to_numpy() if 'Week' in df.columns else np.full(n, None),
+            'First_Monday': df['First_Monday'].to_numpy() if 'First_Monday' in df.columns else np.full(n, None),
+        }
+        out.update({day: cell[:, col] for col, day in enumerate(cls.DAY_COLUMNS)})
+        out['Weekly Total'] = np.round(np.nansum(dist, axis=1), 2)
+        return pd.DataFrame(out, columns=['Week', 'First_Monday', *cls.DAY_COLUMNS, 'Weekly Total'])
 
     def get_plan(self) -> Tuple[str, date, date, pd.DataFrame]:
         # Always return a fresh DataFrame view
@@ -260,45 +430,70 @@ class MarathonPlan:
     # No persistence here; storage is handled by ReportManager via plan_repository
 
     # ---------- Object/DataFrame conversion ----------
+    @classmethod
+    def _grid_to_dataframe(cls, grid: _PlanGrid) -> pd.DataFrame:
+        labels = grid.type_labels()
+        columns: Dict[str, Any] = {
+            'Week': grid.week_numbers.astype(np.int64),
+            'First_Monday': grid.week_starts().astype(str).astype(object),
+        }
+        columns.update({f"{day}_Dist": grid.distance[:, col] for col, day in enumerate(cls.DAY_COLUMNS)})
+        columns.update({f"{day}_Type": labels[:, col] for col, day in enumerate(cls.DAY_COLUMNS)})
+        columns.update({f"{day}_Notes": grid.notes[:, col] for col, day in enumerate(cls.DAY_COLUMNS)})
+        return pd.DataFrame(columns)
+
     def to_dataframe(self) -> pd.DataFrame:
         """Serialize the current weeks to the editor-friendly DataFrame schema."""
-        if not self.weeks:
+        if not len(self._grid):
             return self.df.copy() if isinstance(self.df, pd.DataFrame) else pd.DataFrame()
-        rows = [w.to_row() for w in self.weeks]
-        return pd.DataFrame(rows, columns=['Week', 'First_Monday', *self.distance_columns(), *self.type_columns(), *self.notes_columns()])
+        return self._grid_to_dataframe(self._grid)
 
     def from_dataframe(self, df: pd.DataFrame) -> None:
-        """Populate weeks from a DataFrame produced by the editor."""
+        """Populate weeks from a DataFrame produced by the editor (column-wise, no per-row loop)."""
         if df is None or df.empty:
-            self.weeks = []
+            self._grid = _PlanGrid(self._start_monday(), [])
             return
-        # Plan start Monday is the Monday of self.start
-        plan_start_monday = (self.start - timedelta(days=self.start.weekday())) if isinstance(self.start, date) else datetime.strptime(str(self.start), '%Y-%m-%d').date()
-        self.weeks = []
-        for _, row in df.iterrows():
-            week = PlanWeek.from_row(row, plan_start_monday, self.RUN_TYPES)
-            self.weeks.append(week)
+
+        def block(columns: List[str], default) -> pd.DataFrame:
+            present = df.reindex(columns=columns)
+            return present.where(present.notna(), default)
+
+        distance = block(self.distance_columns(), 0.0).apply(pd.to_numeric, errors='coerce').fillna(0.0).to_numpy(dtype=np.float64)
+        types = block(self.type_columns(), self.RUN_TYPES[0]).astype(str).to_numpy(dtype=object)
+        notes = block(self.notes_columns(), '').astype(str).to_numpy(dtype=object)
+        self.load_arrays(pd.to_numeric(df['Week']).to_numpy(dtype=np.int64), distance, types, notes)
+
+    def load_arrays(self, week_numbers, distance, run_types, notes) -> None:
+        """
+        Replace the plan's weeks from (n,), (n, 7), (n, 7), (n, 7) arrays of week numbers,
+        distances, run type names and notes, Mon..Sun order.
+        """
+        grid = _PlanGrid(self._start_monday(), week_numbers, distance=distance, notes=notes, type_names=self.RUN_TYPES)
+        grid.type_codes = grid.encode_types(np.asarray(run_types, dtype=object).reshape(len(grid), _DAY_COUNT))
+        self._grid = grid
 
     # ---------- Prediction helpers ----------
     def _find_week_and_day_by_date(self, run_date: date) -> Optional[Tuple[PlanWeek, str, PlanRun]]:
-        if not self.weeks:
+        if not len(self._grid):
             # Try to build weeks from df if present
             if isinstance(self.df, pd.DataFrame) and not self.df.empty:
                 self.from_dataframe(self.df)
-        for week in self.weeks:
-            if week.start_date <= run_date <= week.end_date:
-                day_idx = (run_date - week.start_date).days
-                if 0 <= day_idx < len(self.DAY_COLUMNS):
-                    day_name = self.DAY_COLUMNS[day_idx]
-                    run = week.get_run(day_name)
-                    return week, day_name, run
-        return None
+        # Direct index from the plan's start Monday: no scan over weeks
+        offset = (_as_date(run_date) - self._grid.start_monday).days
+        if offset < 0:
+            return None
+        row = self._grid.row_of_week(offset // 7 + 1)
+        if row is None:
+            return None
+        day_name = self.DAY_COLUMNS[offset % 7]
+        week = PlanWeek._view(self._grid, row)
+        return week, day_name, week.get_run(day_name)
 
     def predict_pace_for_run_date(
         self,
         client,
         run_date: date,
-        model: Optional[PredictivePacingModel] = None,
+        model: Optional[Union[FusedLinearPredictor, 'PredictivePacingModel']] = None,
         reader: Optional[ReportReader] = None,
     ) -> Optional[Dict[str, Any]]:
         """
@@ -338,10 +533,9 @@ class MarathonPlan:
         # Sleep for previous night of run_date
         try:
             sleep_date_str = (pd.Timestamp(run_date)).strftime('%Y-%m-%d')
-            sleep_data = client.get_sleep_data(sleep_date_str)
-            hrv_data = client.get_hrv_data(sleep_date_str)
-            hrv = hrv_data['hrvSummary']['lastNightAvg']
-            resting_heart_rate = sleep_data.get('restingHeartRate')
+            wellness = get_wellness_cache().get(client, sleep_date_str)
+            hrv = wellness['hrv']
+            resting_heart_rate = wellness['resting_heart_rate']
         except Exception:
             return None
 
@@ -382,4 +576,90 @@ class MarathonPlan:
         result['predicted_pace_min_per_mile'] = round(pace, 2)
         return result
 
+    def predict_all_runs(
+        self,
+        client,
+        model: Union[FusedLinearPredictor, 'PredictivePacingModel'],
+        reader: Optional[ReportReader] = None,
+    ) -> pd.DataFrame:
+        """
+        Predict pace for every non-Rest run in the plan with a single model call.
+
+        Wellness is prefetched for all eligible dates at once and weather is resolved in bulk,
+        then the (n, 8) feature matrix goes through model.predict_pace_batch. Returns one row per
+        non-Rest run (Week, Day, run_date, type, model inputs, predicted_pace_min_per_mile);
+        runs missing an input (e.g. future dates with no sleep data yet) get a NaN prediction.
+        Failed Garmin or OpenWeatherMap requests (auth, rate limiting, API key) raise.
+        """
+        if model is None:
+            raise ValueError("A trained model is required to predict plan paces.")
+        if not len(self._grid) and isinstance(self.df, pd.DataFrame) and not self.df.empty:
+            self.from_dataframe(self.df)
+
+        # Select every non-Rest, positive-distance run straight from the plan arrays
+        grid = self._grid
+        labels = grid.type_labels()
+        rows_idx, cols_idx = np.nonzero((labels != 'Rest') & (grid.distance > 0))
+        run_dates = grid.dates()[rows_idx, cols_idx]
+        dists = grid.distance[rows_idx, cols_idx]
+        start_date0 = np.datetime64(date(REGRESSION_START_DATE_YEAR, REGRESSION_START_DATE_MONTH, REGRESSION_START_DATE_DAY), 'D')
+        days_since_start = (run_dates - start_date0).astype(np.int64)
+        rows: List[Dict[str, Any]] = [
+            {
+                'Week': int(grid.week_numbers[r]),
+                'Day': self.DAY_COLUMNS[c],
+                'run_date': run_date,
+                'type': rtype,
+                'distance_miles': float(dist),
+                'avg_hr': HR_TARGETS.get(rtype),
+                'temperature': None,
+                'hrv': None,
+                'days_since_start': int(days),
+                'elevation_gain': float(dist) * ELEVATION_FT_PER_MILE,
+                'resting_heart_rate': None,
+                'humidity': None,
+            }
+            for r, c, run_date, rtype, dist, days in zip(
+                rows_idx, cols_idx, run_dates.astype(object), labels[rows_idx, cols_idx], dists, days_since_start
+            )
+        ]
+
+        # Sleep/HRV only exists up to today; one parallel prefetch covers every eligible date.
+        # A night without data comes back as None (NaN prediction); Garmin errors propagate.
+        today = date.today()
+        wellness_dates = sorted({row['run_date'] for row in rows if row['run_date'] <= today})
+        wellness_cache = get_wellness_cache()
+        wellness_cache.prefetch_days(client, wellness_dates)
+        for row in rows:
+            if row['run_date'] > today:
+                continue
+            wellness = wellness_cache.get(client, row['run_date'])
+            row['hrv'] = wellness['hrv']
+            row['resting_heart_rate'] = wellness['resting_heart_rate']
+
+        # Weather at current time on each run date, only for runs that can otherwise be predicted
+        weather_rows = [row for row in rows if row['hrv'] is not None and row['resting_heart_rate'] is not None and row['avg_hr'] is not None]
+        if weather_rows:
+            if reader is None:
+                reader = ReportReader()
+            now_time = datetime.now().time()
+            # Unavailable readings come back as None; API-key and rate-limit errors propagate
+            readings = reader.fetch_weather_bulk(
+                [(DEFAULT_LATITUDE, DEFAULT_LONGITUDE, pd.Timestamp(datetime.combine(row['run_date'], now_time))) for row in weather_rows]
+            )
+            for row, item in zip(weather_rows, readings):
+                main = item.get('main', {}) if isinstance(item, dict) else {}
+                row['temperature'] = main.get('temp')
+                row['humidity'] = main.get('humidity')
+
+        predictors = list(model.original_predictors if hasattr(model, 'original_predictors') else model.predictors)
+        plan_df = pd.DataFrame(rows, columns=['Week', 'Day', 'run_date', 'type'] + predictors)
+        plan_df[predictors] = plan_df[predictors].apply(pd.to_numeric, errors='coerce').astype(float)
+        plan_df['predicted_pace_min_per_mile'] = float('nan')
+        complete = plan_df[predictors].notna().all(axis=1)
+        if complete.any():
+            paces = model.predict_pace_batch(plan_df.loc[complete, predictors].to_numpy())
+            plan_df.loc[complete, 'predicted_pace_min_per_mile'] = paces.round(2)
+        return plan_df
+
 
@@ -0,0 +1,77 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+from sqlalchemy.engine import Engine
+
+from back_end.constants import PLAN_CACHE_MAX_ENTRIES
+from back_end.marathon_objects import plan_repository
+from back_end.marathon_objects.marathon_plan_manager import MarathonPlan
+
+
+class PlanCache:
+    """
+    Process-wide LRU cache of loaded MarathonPlan objects keyed by plan name.
+
+    Every lookup validates the cached copies against marathon_plans.updated_at with one small
+    query; only plans whose timestamp moved (or that were never loaded) are re-read, together,
+    through plan_repository.load_plans. Plans deleted from the database are evicted.
+    """
+
+    def __init__(self, max_entries: int = PLAN_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[datetime, MarathonPlan]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, engine: Engine, name: str) -> Optional[MarathonPlan]:
+        return self.get_many(engine, [name]).get(name)
+
+    def get_many(self, engine: Engine, names: Sequence[str]) -> Dict[str, MarathonPlan]:
+        """Current versions of the named plans that exist, loading only stale or missing ones."""
+        versions = plan_repository.plan_versions(engine, names)
+        with self._lock:
+            for name in names:
+                if name not in versions:
+                    self._entries.pop(name, None)
+            stale = [
+                name for name, updated_at in versions.items()
+                if name not in self._entries or self._entries[name][0] != updated_at
+            ]
+        loaded = plan_repository.load_plans(engine, stale) if stale else {}
+
+        plans: Dict[str, MarathonPlan] = {}
+        with self._lock:
+            for name, plan in loaded.items():
+                self._store(name, versions[name], plan)
+            for name in names:
+                entry = self._entries.get(name)
+                if entry is not None and name in versions:
+                    self._entries.move_to_end(name)
+                    plans[name] = entry[1]
+        return plans
+
+    def put(self, name: str, plan: MarathonPlan, updated_at: datetime) -> None:
+        """Record a plan that was just written (save_plan returns its new updated_at)."""
+        with self._lock:
+            self._store(name, updated_at, plan)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def _store(self, name: str, updated_at: datetime, plan: MarathonPlan) -> None:
+        self._entries[name] = (updated_at, plan)
+        self._entries.move_to_end(name)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_plan_cache() -> PlanCache:
+    """Shared by every ReportManager in the process (Streamlit reruns, the MCP server)."""
+    return PlanCache()
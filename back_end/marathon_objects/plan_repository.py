@@ -1,54 +1,10 @@
-from datetime import date, datetime, timedelta
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
-from back_end.marathon_objects.marathon_plan_manager import MarathonPlan, PlanRun, PlanWeek
-
-_SCHEMA_STATEMENTS = [
-    "create extension if not exists pgcrypto",
-    """
-    create table if not exists marathon_plans (
-        id uuid primary key default gen_random_uuid(),
-        name text unique not null,
-        start_date date not null,
-        race_date date not null,
-        created_at timestamptz not null default now(),
-        updated_at timestamptz not null default now()
-    )
-    """,
-    """
-    create table if not exists plan_weeks (
-        id uuid primary key default gen_random_uuid(),
-        plan_id uuid not null references marathon_plans(id) on delete cascade,
-        week_number int not null,
-        start_date date not null,
-        unique (plan_id, week_number)
-    )
-    """,
-    """
-    create table if not exists plan_runs (
-        id uuid primary key default gen_random_uuid(),
-        week_id uuid not null references plan_weeks(id) on delete cascade,
-        day_name text not null,
-        run_date date not null,
-        distance numeric not null default 0,
-        run_type text not null default 'Rest',
-        notes text not null default '',
-        unique (week_id, day_name)
-    )
-    """,
-    "create index if not exists idx_plan_weeks_plan_id on plan_weeks(plan_id)",
-    "create index if not exists idx_plan_runs_week_id on plan_runs(week_id)",
-    "create index if not exists idx_plan_runs_run_date on plan_runs(run_date)",
-]
-
-
-def ensure_schema(engine: Engine) -> None:
-    with engine.begin() as conn:
-        for statement in _SCHEMA_STATEMENTS:
-            conn.execute(text(statement))
+from back_end.marathon_objects.marathon_plan_manager import MarathonPlan
 
 
 def list_plan_names(engine: Engine) -> List[str]:
@@ -57,50 +13,108 @@ def list_plan_names(engine: Engine) -> List[str]:
     return [row[0] for row in rows]
 
 
-def load_plan(engine: Engine, name: str) -> Optional[MarathonPlan]:
+def plan_versions(engine: Engine, names: Sequence[str]) -> Dict[str, datetime]:
+    """updated_at for each named plan that exists — the cheap check behind PlanCache."""
     with engine.connect() as conn:
-        plan_row = conn.execute(
-            text("select id, name, start_date, race_date from marathon_plans where name = :name"),
-            {"name": name},
-        ).mappings().first()
-        if plan_row is None:
-            return None
-
-        week_rows = conn.execute(
+        rows = conn.execute(
+            text("select name, updated_at from marathon_plans where name = any((:names)::text[])"),
+            {"names": list(names)},
+        ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def load_plans(engine: Engine, names: Sequence[str]) -> Dict[str, MarathonPlan]:
+    """
+    Load several plans by name with one joined query (plan -> weeks -> runs) and build their
+    plan arrays in a single pass over the result set. Missing names are left out.
+    """
+    names = list(dict.fromkeys(names))
+    if not names:
+        return {}
+    with engine.connect() as conn:
+        rows = conn.execute(
             text(
-                "select id, week_number from plan_weeks where plan_id = :plan_id order by week_number"
+                """
+                select p.name, p.start_date, p.race_date, w.week_number,
+                       r.day_name, r.run_date, r.distance, r.run_type, r.notes
+                from marathon_plans p
+                left join plan_weeks w on w.plan_id = p.id
+                left join plan_runs r on r.week_id = w.id
+                where p.name = any((:names)::text[])
+                order by p.name, w.week_number
+                """
             ),
-            {"plan_id": plan_row["id"]},
+            {"names": names},
         ).mappings().all()
 
-        plan = MarathonPlan(plan_row["name"], plan_row["start_date"], plan_row["race_date"])
-        plan_start = plan_row["start_date"]
-        if isinstance(plan_start, datetime):
-            plan_start = plan_start.date()
-        plan_start_monday = plan_start - timedelta(days=plan_start.weekday())
-
-        plan.weeks = []
-        for week_row in week_rows:
-            run_rows = conn.execute(
-                text(
-                    "select day_name, run_date, distance, run_type, notes "
-                    "from plan_runs where week_id = :week_id"
-                ),
-                {"week_id": week_row["id"]},
-            ).mappings().all()
-            runs_by_day = {
-                r["day_name"]: PlanRun(r["run_date"], float(r["distance"]), r["run_type"], r["notes"])
-                for r in run_rows
-            }
-            week = PlanWeek(week_row["week_number"], plan_start_monday, MarathonPlan.RUN_TYPES, runs_by_day)
-            plan.weeks.append(week)
+    # One pass over the rows straight into each plan's (weeks x 7) arrays
+    plans: Dict[str, MarathonPlan] = {}
+    weeks: Dict[str, Dict[int, Tuple[List[float], List[str], List[str]]]] = {}
+    for row in rows:
+        name = row["name"]
+        if name not in plans:
+            plans[name] = MarathonPlan(name, row["start_date"], row["race_date"])
+            weeks[name] = {}
+        if row["week_number"] is None:
+            continue
+        week = weeks[name].get(row["week_number"])
+        if week is None:
+            week = weeks[name][row["week_number"]] = (
+                [0.0] * len(MarathonPlan.DAY_COLUMNS),
+                [MarathonPlan.RUN_TYPES[0]] * len(MarathonPlan.DAY_COLUMNS),
+                [''] * len(MarathonPlan.DAY_COLUMNS),
+            )
+        col = MarathonPlan.DAY_INDEX.get(row["day_name"])
+        if col is not None:
+            week[0][col] = float(row["distance"])
+            week[1][col] = row["run_type"]
+            week[2][col] = row["notes"]
+
+    for name, plan in plans.items():
+        plan_weeks = weeks[name]
+        plan.load_arrays(
+            list(plan_weeks),
+            [w[0] for w in plan_weeks.values()],
+            [w[1] for w in plan_weeks.values()],
+            [w[2] for w in plan_weeks.values()],
+        )
         plan.df = plan.to_dataframe()
-    return plan
+    return plans
+
+
+def load_plan(engine: Engine, name: str) -> Optional[MarathonPlan]:
+    return load_plans(engine, [name]).get(name)
+
 
+def save_plan(engine: Engine, plan: MarathonPlan) -> datetime:
+    """
+    Write a plan and return its new updated_at. Uses four set-based statements, whatever its length: upsert the plan row, upsert
+    all weeks, drop weeks past the end of the plan, and upsert all runs. Week and run rows are
+    passed as parallel arrays and expanded with unnest(); rows whose values did not change are
+    skipped by the `is distinct from` guards, so an edit to one day rewrites one run row.
+    """
+    week_numbers: List[int] = []
+    week_starts: List[date] = []
+    run_week_numbers: List[int] = []
+    day_names: List[str] = []
+    run_dates: List[date] = []
+    distances: List[float] = []
+    run_types: List[str] = []
+    notes: List[str] = []
+    for week in plan.weeks:
+        week_numbers.append(week.week_number)
+        week_starts.append(week.start_date)
+        for day in MarathonPlan.DAY_COLUMNS:
+            run = week.get_run(day)
+            run_week_numbers.append(week.week_number)
+            day_names.append(day)
+            run_dates.append(run.get_date())
+            distances.append(float(run.get_distance() or 0.0))
+            run_types.append(run.get_type())
+            notes.append(run.get_notes() or '')
 
-def save_plan(engine: Engine, plan: MarathonPlan) -> None:
     with engine.begin() as conn:
-        plan_id = conn.execute(
+        plan_id, updated_at = conn.execute(
             text(
                 """
                 insert into marathon_plans (name, start_date, race_date)
@@ -109,42 +123,58 @@ def save_plan(engine: Engine, plan: MarathonPlan) -> None:
                     start_date = excluded.start_date,
                     race_date = excluded.race_date,
                     updated_at = now()
-                returning id
+                returning id, updated_at
                 """
             ),
             {"name": plan.name, "start_date": plan.start, "race_date": plan.end},
-        ).scalar_one()
-
-        # Full replace of weeks/runs on every save, mirroring the prior CSV-overwrite behavior.
-        conn.execute(text("delete from plan_weeks where plan_id = :plan_id"), {"plan_id": plan_id})
-
-        for week in plan.weeks:
-            week_id = conn.execute(
-                text(
-                    """
-                    insert into plan_weeks (plan_id, week_number, start_date)
-                    values (:plan_id, :week_number, :start_date)
-                    returning id
-                    """
-                ),
-                {"plan_id": plan_id, "week_number": week.week_number, "start_date": week.start_date},
-            ).scalar_one()
-
-            for day in MarathonPlan.DAY_COLUMNS:
-                run = week.get_run(day)
-                conn.execute(
-                    text(
-                        """
-                        insert into plan_runs (week_id, day_name, run_date, distance, run_type, notes)
-                        values (:week_id, :day_name, :run_date, :distance, :run_type, :notes)
-                        """
-                    ),
-                    {
-                        "week_id": week_id,
-                        "day_name": day,
-                        "run_date": run.get_date(),
-                        "distance": run.get_distance(),
-                        "run_type": run.get_type(),
-                        "notes": run.get_notes(),
-                    },
-                )
+        ).one()
+
+        conn.execute(
+            text(
+                """
+                insert into plan_weeks (plan_id, week_number, start_date)
+                select :plan_id, w.week_number, w.start_date
+                from unnest((:week_numbers)::int[], (:week_starts)::date[]) as w(week_number, start_date)
+                on conflict (plan_id, week_number) do update set start_date = excluded.start_date
+                where plan_weeks.start_date is distinct from excluded.start_date
+                """
+            ),
+            {"plan_id": plan_id, "week_numbers": week_numbers, "week_starts": week_starts},
+        )
+
+        # Weeks no longer in the plan (e.g. the race date moved earlier); their runs cascade.
+        conn.execute(
+            text("delete from plan_weeks where plan_id = :plan_id and week_number <> all((:week_numbers)::int[])"),
+            {"plan_id": plan_id, "week_numbers": week_numbers},
+        )
+
+        conn.execute(
+            text(
+                """
+                insert into plan_runs (week_id, day_name, run_date, distance, run_type, notes)
+                select w.id, r.day_name, r.run_date, r.distance, r.run_type, r.notes
+                from unnest(
+                    (:week_numbers)::int[], (:day_names)::text[], (:run_dates)::date[],
+                    (:distances)::numeric[], (:run_types)::text[], (:notes)::text[]
+                ) as r(week_number, day_name, run_date, distance, run_type, notes)
+                join plan_weeks w on w.plan_id = :plan_id and w.week_number = r.week_number
+                on conflict (week_id, day_name) do update set
+                    run_date = excluded.run_date,
+                    distance = excluded.distance,
+                    run_type = excluded.run_type,
+                    notes = excluded.notes
+                where (plan_runs.run_date, plan_runs.distance, plan_runs.run_type, plan_runs.notes)
+                    is distinct from (excluded.run_date, excluded.distance, excluded.run_type, excluded.notes)
+                """
+            ),
+            {
+                "plan_id": plan_id,
+                "week_numbers": run_week_numbers,
+                "day_names": day_names,
+                "run_dates": run_dates,
+                "distances": distances,
+                "run_types": run_types,
+                "notes": notes,
+            },
+        )
+    return updated_at
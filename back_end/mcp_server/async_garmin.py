@@ -0,0 +1,106 @@
+"""
+Async facade over the blocking Garmin client, for the MCP server's tools.
+
+FastMCP runs tools on one asyncio event loop, so a blocking garminconnect call inside a tool stalls
+every other tool call until it returns. AsyncGarmin moves that work off the loop:
+
+- Bounded executor: blocking work runs on at most MCP_GARMIN_MAX_WORKERS threads, so a burst of
+  tool calls cannot open an unbounded number of Garmin requests (ThrottledGarminClient still
+  applies the request rate limit underneath).
+- Single-flight: identical calls that are already in flight share one execution and its result,
+  so an agent asking for the same week twice in parallel costs one download.
+- Per-call timeout: each await gives up after `timeout` seconds with a TimeoutError. The shared
+  call keeps running for any other waiters, and its result still lands in the lower-level caches.
+
+Pass run() a module-level function that looks up its singletons itself. The lookup, and any first
+construction, then happens on the worker thread, and a stable callable lets identical calls share.
+
+    def _list_activities(client, start_date, end_date):
+        return get_report_builder().list_activities(client, start_date, end_date)
+
+    garmin = get_async_garmin()
+    df = await garmin.run(_list_activities, start_date, end_date)
+    stats = await garmin.get_stats('2026-10-01')  # any Garmin client method, awaited
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from back_end.constants import MCP_GARMIN_CALL_TIMEOUT_SECONDS, MCP_GARMIN_MAX_WORKERS
+from back_end.mcp_server.context import get_garmin_client
+
+
+class AsyncGarmin:
+    def __init__(
+        self,
+        client_factory: Callable[[], Any] = get_garmin_client,
+        max_workers: int = MCP_GARMIN_MAX_WORKERS,
+        timeout: float = MCP_GARMIN_CALL_TIMEOUT_SECONDS,
+    ):
+        self._client_factory = client_factory
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="garmin")
+        self.timeout = timeout
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, func: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Await func(client, *args, **kwargs) on the executor. The client is resolved on the worker
+        thread too, so the first call's Garmin login never blocks the event loop.
+        """
+        return await self._submit(func, lambda client: func(client, *args, **kwargs), args, kwargs, timeout)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """`await garmin.<method>(...)` calls the Garmin client method of that name on the executor."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def call(*args, timeout: Optional[float] = None, **kwargs):
+            return await self._submit(name, lambda client: getattr(client, name)(*args, **kwargs), args, kwargs, timeout)
+
+        return call
+
+    async def _submit(self, target: Any, work: Callable[[Any], Any], args, kwargs, timeout: Optional[float]) -> Any:
+        loop = asyncio.get_running_loop()
+        key = self._key(target, args, kwargs)
+        future = self._inflight.get(key) if key is not None else None
+        if future is None:
+            future = loop.run_in_executor(self._executor, partial(self._call, work))
+            if key is not None:
+                self._inflight[key] = future
+            future.add_done_callback(partial(self._forget, key))
+        limit = self.timeout if timeout is None else timeout
+        try:
+            # shield: one caller timing out must not cancel the call other callers are sharing
+            return await asyncio.wait_for(asyncio.shield(future), timeout=limit)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Garmin call {self._name(target)} timed out after {limit:g}s") from None
+
+    def _forget(self, key: Optional[Hashable], future: asyncio.Future) -> None:
+        if key is not None and self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()  # mark retrieved even if every waiter timed out
+
+    def _call(self, work: Callable[[Any], Any]) -> Any:
+        return work(self._client_factory())
+
+    @staticmethod
+    def _key(target: Any, args, kwargs) -> Optional[Hashable]:
+        """Identity of a call for single-flight; None (no sharing) when an argument is unhashable."""
+        key = (target, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def _name(target: Any) -> str:
+        return target if isinstance(target, str) else getattr(target, "__qualname__", repr(target))
+
+
+@lru_cache(maxsize=1)
+def get_async_garmin() -> AsyncGarmin:
+    return AsyncGarmin()
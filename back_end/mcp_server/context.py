@@ -1,3 +1,4 @@
+import threading
 from functools import lru_cache
 
 from back_end.report_objects.report_builder import ReportBuilder
@@ -5,13 +6,17 @@ from back_end.report_objects.report_manager import ReportManager
 from back_end.report_objects.report_reader import ReportReader
 
 _garmin_client = None
+_garmin_client_lock = threading.Lock()
 
 
 def get_garmin_client():
     """Authenticate with Garmin on first call; reuse the client for the life of the process."""
     global _garmin_client
     if _garmin_client is None:
-        _garmin_client = ReportReader().fetch_garmin_data()
+        # Tool calls run on several executor threads (async_garmin); log in only once
+        with _garmin_client_lock:
+            if _garmin_client is None:
+                _garmin_client = ReportReader().fetch_garmin_data()
     return _garmin_client
 
 
@@ -1,58 +1,105 @@
 from typing import Any, Dict, List
 
+from back_end.constants import (
+    MCP_ACTIVITY_LIST_TTL_SECONDS,
+    MCP_PERSONAL_RECORDS_TTL_SECONDS,
+    MCP_WEEKLY_MILEAGE_TIMEOUT_SECONDS,
+)
 from back_end.mcp_server.app import mcp
-from back_end.mcp_server.context import get_garmin_client, get_report_builder
+from back_end.mcp_server.async_garmin import get_async_garmin
+from back_end.mcp_server.context import get_report_builder, get_report_manager
+from back_end.mcp_server.response_cache import (
+    cached_tool,
+    get_response_cache,
+    past_complete_forever,
+    past_dates_for,
+    past_result_forever,
+)
 from back_end.mcp_server.serialization import df_to_record, df_to_records
 
 
+# Executor-side entry points. The ReportManager/ReportBuilder singletons are resolved on the worker
+# thread, so their first construction (migrations, client setup) never blocks the event loop, and
+# each stays one stable callable for AsyncGarmin's single-flight key.
+def _weekly_mileage(client, start_date: str, end_date: str):
+    return get_report_manager().get_weekly_mileage(client, start_date, end_date)
+
+
+def _all_time_prs(client):
+    return get_report_builder().get_all_time_prs(client)
+
+
+def _list_activities(client, start_date: str, end_date: str):
+    return get_report_builder().list_activities(client, start_date, end_date)
+
+
+def _activity_summary(client, activity_id: int):
+    return get_report_builder().get_activity_summary(client, activity_id)
+
+
+def _health_snapshot(client, target_date: str):
+    return get_report_builder().get_health_snapshot(client, target_date)
+
+
 @mcp.tool()
-def get_weekly_mileage(start_date: str, end_date: str) -> List[Dict[str, Any]]:
-    """Get weekly running mileage totals between two dates (YYYY-MM-DD)."""
-    client = get_garmin_client()
-    df = get_report_builder().aggregate_weekly_mileage(client, start_date, end_date)
+async def get_weekly_mileage(start_date: str, end_date: str) -> List[Dict[str, Any]]:
+    """
+    Get weekly running mileage (Monday-Sunday weeks) between two dates (YYYY-MM-DD): total miles,
+    activity count and longest run per week.
+    """
+    df = await get_async_garmin().run(
+        _weekly_mileage, start_date, end_date, timeout=MCP_WEEKLY_MILEAGE_TIMEOUT_SECONDS,
+    )
     if df.empty:
         return []
     df = df.reset_index().rename(columns={
         'Total_Miles': 'total_miles',
         'Activity_Count': 'activity_count',
+        'Longest_Run_Miles': 'longest_run_miles',
     })
     return df_to_records(df)
 
 
 @mcp.tool()
-def get_personal_records() -> List[Dict[str, str]]:
+@cached_tool(ttl=MCP_PERSONAL_RECORDS_TTL_SECONDS)
+async def get_personal_records() -> List[Dict[str, str]]:
     """Get all-time personal records (5K, 10K, Half Marathon, Marathon) with time and pace."""
-    client = get_garmin_client()
-    df = get_report_builder().get_all_time_prs(client)
+    df = await get_async_garmin().run(_all_time_prs)
     df = df.rename(columns={'Distance': 'distance', 'Time': 'time', 'Pace': 'pace'})
     return df_to_records(df)
 
 
 @mcp.tool()
-def list_activities(start_date: str, end_date: str) -> List[Dict[str, Any]]:
+@cached_tool(ttl=past_dates_for('end_date', MCP_ACTIVITY_LIST_TTL_SECONDS))
+async def list_activities(start_date: str, end_date: str) -> List[Dict[str, Any]]:
     """
     List individual running activities between two dates (YYYY-MM-DD), with
     activity_id, name, date, type, distance, average heart rate, and pace.
     """
-    client = get_garmin_client()
-    df = get_report_builder().list_activities(client, start_date, end_date)
+    df = await get_async_garmin().run(_list_activities, start_date, end_date)
     return df_to_records(df)
 
 
 @mcp.tool()
-def get_activity_detail(activity_id: int) -> Dict[str, Any]:
+@cached_tool(ttl=past_result_forever('start_time'))
+async def get_activity_detail(activity_id: int) -> Dict[str, Any]:
     """
     Get details for a single activity by its Garmin activity ID: distance,
     pace, average heart rate, elevation gain, start/finish time.
     """
-    client = get_garmin_client()
-    df = get_report_builder().get_activity_summary(client, activity_id)
+    df = await get_async_garmin().run(_activity_summary, activity_id)
     return df_to_record(df)
 
 
 @mcp.tool()
-def get_health_snapshot(target_date: str) -> Dict[str, Any]:
+@cached_tool(ttl=past_complete_forever('target_date', ('hrv', 'resting_heart_rate')))
+async def get_health_snapshot(target_date: str) -> Dict[str, Any]:
     """Get sleep score, HRV, and resting heart rate for a given date (YYYY-MM-DD)."""
-    client = get_garmin_client()
-    df = get_report_builder().get_health_snapshot(client, target_date)
+    df = await get_async_garmin().run(_health_snapshot, target_date)
     return df_to_record(df)
+
+
+@mcp.tool()
+def get_response_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counts per Garmin tool and the size of the MCP server's response cache (diagnostics)."""
+    return get_response_cache().stats()
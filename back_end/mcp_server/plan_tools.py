@@ -20,8 +20,20 @@ def get_marathon_plan(name: str) -> Dict[str, Any]:
     result = get_report_manager().load_plan(name)
     if result is None:
         return {'found': False, 'name': name}
-    plan_name, start, end, df = result
+    return _plan_to_dict(*result)
 
+
+@mcp.tool()
+def get_marathon_plans(names: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get several marathon plans by name in one call (same shape as get_marathon_plan for each).
+    Pass the output of list_marathon_plans to fetch every saved plan at once.
+    """
+    plans = get_report_manager().load_plans(names)
+    return [_plan_to_dict(*plans[name]) if name in plans else {'found': False, 'name': name} for name in names]
+
+
+def _plan_to_dict(plan_name: str, start, end, df) -> Dict[str, Any]:
     weeks = []
     for _, row in df.iterrows():
         days = {}
@@ -1,9 +1,7 @@
 from typing import Any, Dict, List
 
-from back_end.db import get_engine
 from back_end.mcp_server.app import mcp
-from back_end.rag import rag_repository
-from back_end.rag.voyage_client import EMBEDDING_MODEL, get_voyage_client
+from back_end.rag import search
 
 
 @mcp.tool()
@@ -15,9 +13,4 @@ def rag_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
     higher is more relevant). Returns an empty list if no documents have been
     ingested yet — run `python -m back_end.rag.ingest` first.
     """
-    engine = get_engine()
-    rag_repository.ensure_schema(engine)
-    embedding = get_voyage_client().embed(
-        [query], model=EMBEDDING_MODEL, input_type="query"
-    ).embeddings[0]
-    return rag_repository.search(engine, embedding, top_k)
+    return search.search(query, top_k)
@@ -0,0 +1,156 @@
+"""
+In-process response cache for the MCP Garmin tools.
+
+Agents ask the same question several times in one conversation. cached_tool memoizes a tool's
+JSON result per argument set, so a repeat is answered from memory without touching Garmin:
+
+    @mcp.tool()
+    @cached_tool(ttl=past_dates_for('end_date', MCP_ACTIVITY_LIST_TTL_SECONDS))
+    async def list_activities(start_date: str, end_date: str) -> List[Dict[str, Any]]: ...
+
+`ttl` is seconds, None (never expires) or a policy function (result, arguments) -> seconds/None/0
+that decides per call; 0 means "don't cache". Only data that cannot change is kept until evicted:
+a finished activity, or a past night with every field synced. A past night that is still missing
+a field is retried after WELLNESS_CACHE_INCOMPLETE_TTL_SECONDS, like the wellness cache. Anything
+touching today expires after MCP_CACHE_TODAY_TTL_SECONDS. The cache
+holds at most MCP_RESPONSE_CACHE_MAX_ENTRIES results (least recently used evicted first) and
+counts hits and misses per tool. Cached results are shared: treat them as read-only.
+"""
+
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple, Union
+
+from back_end.constants import (
+    MCP_CACHE_TODAY_TTL_SECONDS,
+    MCP_RESPONSE_CACHE_MAX_ENTRIES,
+    WELLNESS_CACHE_INCOMPLETE_TTL_SECONDS,
+)
+
+TtlPolicy = Union[None, float, Callable[[Any, Dict[str, Any]], Optional[float]]]
+
+_MISSING = object()
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = MCP_RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tool: str, key: Hashable) -> Any:
+        """The cached value, or _MISSING. Counts a hit or miss for `tool`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            counters = self._counters.setdefault(tool, {'hits': 0, 'misses': 0})
+            if entry is None:
+                counters['misses'] += 1
+                return _MISSING
+            counters['hits'] += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: Optional[float]) -> None:
+        expires_at = None if ttl_seconds is None else time.monotonic() + ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'tools': {tool: dict(counters) for tool, counters in sorted(self._counters.items())},
+            }
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    return ResponseCache()
+
+
+def cached_tool(ttl: TtlPolicy) -> Callable:
+    """Memoize an async tool's result per argument set (apply below @mcp.tool())."""
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            try:
+                key = (func.__name__, tuple(sorted(arguments.items())))
+                hash(key)
+            except TypeError:
+                return await func(*args, **kwargs)
+
+            cache = get_response_cache()
+            value = cache.get(func.__name__, key)
+            if value is not _MISSING:
+                return value
+            value = await func(*args, **kwargs)
+            ttl_seconds = ttl(value, arguments) if callable(ttl) else ttl
+            if ttl_seconds is None or ttl_seconds > 0:
+                cache.put(key, value, ttl_seconds)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _is_past(day: Any) -> bool:
+    """True when `day` (a date or a string starting with YYYY-MM-DD) is before today."""
+    try:
+        return date.fromisoformat(str(day)[:10]) < date.today()
+    except ValueError:
+        return False
+
+
+def past_dates_for(argument: str, ttl_seconds: float) -> Callable[[Any, Dict[str, Any]], Optional[float]]:
+    """TTL policy: ttl_seconds when the named date argument is before today, else briefly."""
+    return lambda result, arguments: ttl_seconds if _is_past(arguments.get(argument)) else MCP_CACHE_TODAY_TTL_SECONDS
+
+
+def past_complete_forever(argument: str, fields: Sequence[str]) -> Callable[[Any, Dict[str, Any]], Optional[float]]:
+    """
+    TTL policy: forever when the named date argument is before today and the result has every one
+    of `fields`; a past result missing one may still sync, so it expires after the incomplete TTL.
+    """
+
+    def policy(result: Any, arguments: Dict[str, Any]) -> Optional[float]:
+        if not _is_past(arguments.get(argument)):
+            return MCP_CACHE_TODAY_TTL_SECONDS
+        if not result or any(result.get(field) is None for field in fields):
+            return WELLNESS_CACHE_INCOMPLETE_TTL_SECONDS
+        return None
+
+    return policy
+
+
+def past_result_forever(field: str) -> Callable[[Any, Dict[str, Any]], Optional[float]]:
+    """TTL policy: forever when the result's date field is before today, else briefly; never cache an empty result."""
+
+    def policy(result: Any, arguments: Dict[str, Any]) -> Optional[float]:
+        if not result:
+            return 0
+        return None if _is_past(result.get(field)) else MCP_CACHE_TODAY_TTL_SECONDS
+
+    return policy
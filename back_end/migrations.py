@@ -0,0 +1,254 @@
+"""
+Versioned schema migrations for the Supabase Postgres database.
+
+Each migration is a numbered list of DDL statements. Applied versions are recorded in the
+`schema_version` table, so a migration runs exactly once per database. To change the schema,
+append a new migration; never edit one that has already shipped.
+
+Apply pending migrations from the command line (also done automatically, once per process, by
+ensure_migrated):
+
+    python -m back_end.migrations           # apply pending migrations
+    python -m back_end.migrations --status  # show applied / pending versions
+"""
+
+import argparse
+import threading
+from typing import List, NamedTuple, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from back_end.db import get_engine
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    statements: List[str]
+
+
+# Serializes concurrent startups (Streamlit + MCP server) applying the same migrations.
+_MIGRATION_LOCK_ID = 74_251_001
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "marathon plans, weeks and runs", [
+        "create extension if not exists pgcrypto",
+        """
+        create table if not exists marathon_plans (
+            id uuid primary key default gen_random_uuid(),
+            name text unique not null,
+            start_date date not null,
+            race_date date not null,
+            created_at timestamptz not null default now(),
+            updated_at timestamptz not null default now()
+        )
+        """,
+        """
+        create table if not exists plan_weeks (
+            id uuid primary key default gen_random_uuid(),
+            plan_id uuid not null references marathon_plans(id) on delete cascade,
+            week_number int not null,
+            start_date date not null,
+            unique (plan_id, week_number)
+        )
+        """,
+        """
+        create table if not exists plan_runs (
+            id uuid primary key default gen_random_uuid(),
+            week_id uuid not null references plan_weeks(id) on delete cascade,
+            day_name text not null,
+            run_date date not null,
+            distance numeric not null default 0,
+            run_type text not null default 'Rest',
+            notes text not null default '',
+            unique (week_id, day_name)
+        )
+        """,
+        "create index if not exists idx_plan_weeks_plan_id on plan_weeks(plan_id)",
+        "create index if not exists idx_plan_runs_week_id on plan_runs(week_id)",
+        "create index if not exists idx_plan_runs_run_date on plan_runs(run_date)",
+    ]),
+    # vector(1024) is voyage-3's output size (rag/voyage_client.EMBEDDING_DIMENSION). It is
+    # spelled out here so migrations don't need the voyageai package; a new embedding model
+    # means a new migration.
+    Migration(2, "RAG document chunks (pgvector)", [
+        "create extension if not exists vector",
+        """
+        create table if not exists document_chunks (
+            id bigint generated always as identity primary key,
+            source text not null,
+            content text not null,
+            embedding vector(1024) not null,
+            metadata jsonb not null default '{}'::jsonb,
+            created_at timestamptz not null default now()
+        )
+        """,
+        "create index if not exists idx_document_chunks_source on document_chunks(source)",
+        "create index if not exists idx_document_chunks_embedding "
+        "on document_chunks using hnsw (embedding vector_cosine_ops)",
+    ]),
+    # Per-activity regression features, one row per Garmin activity. Filled incrementally by
+    # ReportManager.get_regression_data so a retrain only downloads activities it hasn't seen.
+    Migration(3, "activity regression features", [
+        """
+        create table if not exists activity_features (
+            activity_id bigint primary key,
+            activity_name text,
+            start_time timestamp not null,
+            finish_time timestamp,
+            distance_miles double precision,
+            pace double precision,
+            avg_hr double precision,
+            elevation_gain double precision,
+            longitude double precision,
+            latitude double precision,
+            temperature double precision,
+            humidity double precision,
+            hrv double precision,
+            resting_heart_rate double precision,
+            days_since_start int,
+            created_at timestamptz not null default now(),
+            updated_at timestamptz not null default now()
+        )
+        """,
+        "create index if not exists idx_activity_features_start_time on activity_features(start_time)",
+    ]),
+    # Weekly running totals per W-SUN week (week_start is the Monday), plus a single-row record of
+    # the contiguous day range [covered_from, covered_to] that has been synced from Garmin. Weeks
+    # inside that range are answered from here; only days outside it are downloaded.
+    Migration(4, "weekly mileage rollup", [
+        """
+        create table if not exists weekly_mileage (
+            week_start date primary key,
+            total_miles double precision not null,
+            activity_count int not null,
+            longest_run_miles double precision not null,
+            updated_at timestamptz not null default now()
+        )
+        """,
+        """
+        create table if not exists weekly_mileage_coverage (
+            id smallint primary key default 1 check (id = 1),
+            covered_from date not null,
+            covered_to date not null,
+            updated_at timestamptz not null default now()
+        )
+        """,
+    ]),
+    # Incremental RAG ingest. document_sources is the per-file manifest (content hash plus the
+    # size/mtime seen when it was hashed); chunk_hash is sha256 of the chunk text, so unchanged
+    # chunks keep their embeddings. Existing rows are hashed in place, duplicate chunks within a
+    # file are dropped, and every existing source gets a manifest row with an unknown file hash.
+    Migration(5, "RAG content-hash manifest", [
+        """
+        create table if not exists document_sources (
+            source text primary key,
+            file_hash text not null,
+            file_size bigint not null,
+            file_mtime_ns bigint not null,
+            chunk_count int not null,
+            ingested_at timestamptz not null default now()
+        )
+        """,
+        "alter table document_chunks add column if not exists chunk_hash text",
+        "update document_chunks set chunk_hash = encode(sha256(convert_to(content, 'UTF8')), 'hex') where chunk_hash is null",
+        """
+        delete from document_chunks a
+        using document_chunks b
+        where a.source = b.source and a.chunk_hash = b.chunk_hash and a.id > b.id
+        """,
+        "alter table document_chunks alter column chunk_hash set not null",
+        "create unique index if not exists idx_document_chunks_source_hash on document_chunks(source, chunk_hash)",
+        "create index if not exists idx_document_chunks_chunk_hash on document_chunks(chunk_hash)",
+        """
+        insert into document_sources (source, file_hash, file_size, file_mtime_ns, chunk_count)
+        select source, '', -1, -1, count(*) from document_chunks group by source
+        on conflict (source) do nothing
+        """,
+    ]),
+]
+
+_SCHEMA_VERSION_DDL = """
+    create table if not exists schema_version (
+        version int primary key,
+        description text not null,
+        applied_at timestamptz not null default now()
+    )
+"""
+
+_migrated_urls: Set[str] = set()
+_migrated_lock = threading.Lock()
+
+
+def applied_versions(engine: Engine) -> Set[int]:
+    with engine.connect() as conn:
+        exists = conn.execute(text("select to_regclass('schema_version') is not null")).scalar()
+        if not exists:
+            return set()
+        return {row[0] for row in conn.execute(text("select version from schema_version")).fetchall()}
+
+
+def migrate(engine: Engine) -> List[int]:
+    """
+    Apply every pending migration in order, in one transaction (Postgres DDL is transactional, so
+    a failure leaves the schema as it was). Returns the versions applied.
+    """
+    applied: List[int] = []
+    latest = MIGRATIONS[-1].version
+    if latest in applied_versions(engine):
+        return applied
+    with engine.begin() as conn:
+        conn.execute(text("select pg_advisory_xact_lock(:lock_id)"), {"lock_id": _MIGRATION_LOCK_ID})
+        conn.execute(text(_SCHEMA_VERSION_DDL))
+        done = {row[0] for row in conn.execute(text("select version from schema_version")).fetchall()}
+        for migration in MIGRATIONS:
+            if migration.version in done:
+                continue
+            for statement in migration.statements:
+                conn.execute(text(statement))
+            conn.execute(
+                text("insert into schema_version (version, description) values (:version, :description)"),
+                {"version": migration.version, "description": migration.description},
+            )
+            applied.append(migration.version)
+    return applied
+
+
+def ensure_migrated(engine: Engine) -> None:
+    """
+    Bring the database up to date the first time it is used in this process; later calls are
+    free (no query). Hot paths call this instead of running DDL themselves.
+    """
+    url = str(engine.url)
+    if url in _migrated_urls:
+        return
+    with _migrated_lock:
+        if url in _migrated_urls:
+            return
+        migrate(engine)
+        _migrated_urls.add(url)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply or inspect database schema migrations.")
+    parser.add_argument("--status", action="store_true", help="list applied and pending migrations without applying")
+    args = parser.parse_args()
+
+    engine = get_engine()
+    if args.status:
+        done = applied_versions(engine)
+        for migration in MIGRATIONS:
+            state = "applied" if migration.version in done else "pending"
+            print(f"{migration.version:>4}  {state:<8} {migration.description}")
+        return
+
+    applied = migrate(engine)
+    if applied:
+        print(f"Applied migrations: {', '.join(str(v) for v in applied)}")
+    else:
+        print("Schema is up to date.")
+
+
+if __name__ == "__main__":
+    main()
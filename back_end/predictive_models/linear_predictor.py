@@ -0,0 +1,90 @@
+"""
+NumPy-only inference for the trained pace models.
+
+Every inference step of PredictivePacingModel (StandardScaler -> Ridge -> inverse StandardScaler)
+and PredictivePacingModelPCA (StandardScaler -> PCA -> LinearRegression -> inverse StandardScaler)
+is linear, so the whole pipeline collapses to a single weight vector and intercept in raw
+feature units:
+
+    pace = X @ weights + intercept
+
+FusedLinearPredictor holds that result. It imports nothing but NumPy, so the app and MCP
+server can serve predictions without loading scikit-learn or statsmodels.
+"""
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+
+class FusedLinearPredictor:
+    """Closed-form pace predictor: one dot product per run."""
+
+    def __init__(self, predictors: Sequence[str], weights, intercept: float):
+        self.predictors: List[str] = list(predictors)
+        self.weights = np.asarray(weights, dtype=np.float64).reshape(-1)
+        self.intercept = float(intercept)
+        if self.weights.shape[0] != len(self.predictors):
+            raise ValueError("weights must have one entry per predictor")
+
+    @classmethod
+    def from_model(cls, model: Any) -> 'FusedLinearPredictor':
+        """
+        Fold a trained PredictivePacingModel or PredictivePacingModelPCA into raw-unit weights.
+        Works off the fitted attributes only, so sklearn is never imported here.
+        """
+        if getattr(model, 'model', None) is None or getattr(model, 'scaler_X', None) is None:
+            raise ValueError("Model not trained yet. Run train_model() first.")
+        predictors = getattr(model, 'original_predictors', None) or model.predictors
+
+        # Regression in the space the estimator was fit on (scaled features or PCA scores)
+        beta = np.asarray(model.model.coef_, dtype=np.float64).reshape(-1)
+        bias = float(np.asarray(model.model.intercept_, dtype=np.float64).reshape(-1)[0])
+
+        pca = getattr(model, 'pca', None)
+        if pca is not None:
+            # scores = (z - pca.mean_) @ components_.T  (optionally divided by sqrt(variance) when whitened)
+            components = np.asarray(pca.components_, dtype=np.float64)
+            if getattr(pca, 'whiten', False):
+                components = components / np.sqrt(np.asarray(pca.explained_variance_, dtype=np.float64))[:, None]
+            beta_z = components.T @ beta
+            bias = bias - float(np.asarray(pca.mean_, dtype=np.float64) @ beta_z)
+        else:
+            beta_z = beta
+
+        # z = (x - mean_x) / scale_x
+        mean_x = np.asarray(model.scaler_X.mean_, dtype=np.float64)
+        scale_x = np.asarray(model.scaler_X.scale_, dtype=np.float64)
+        weights = beta_z / scale_x
+        bias = bias - float((mean_x / scale_x) @ beta_z)
+
+        # pace = pace_scaled * scale_y + mean_y
+        mean_y = float(np.asarray(model.scaler_Y.mean_).reshape(-1)[0])
+        scale_y = float(np.asarray(model.scaler_Y.scale_).reshape(-1)[0])
+        return cls(predictors, weights * scale_y, bias * scale_y + mean_y)
+
+    def predict_pace(self, current_data: Dict[str, Any]) -> float:
+        """Predict pace (min/mile) for one run given a dict of the predictor values."""
+        x = np.fromiter((float(current_data[name]) for name in self.predictors), dtype=np.float64, count=len(self.predictors))
+        return float(x @ self.weights + self.intercept)
+
+    def predict_pace_batch(self, X) -> np.ndarray:
+        """
+        Predict pace for many runs. X is an (n, 8) array in self.predictors order, or anything
+        with named columns (e.g. a DataFrame) containing the predictors.
+        """
+        if hasattr(X, 'columns'):
+            X = X[self.predictors].to_numpy(dtype=np.float64)
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != len(self.predictors):
+            raise ValueError(f"X must have shape (n, {len(self.predictors)}) in the order {self.predictors}")
+        return X @ self.weights + self.intercept
+
+    def save(self, file) -> None:
+        """Write to an .npz file (path or binary file object)."""
+        np.savez(file, predictors=np.array(self.predictors), weights=self.weights, intercept=np.array(self.intercept))
+
+    @classmethod
+    def load(cls, file) -> 'FusedLinearPredictor':
+        with np.load(file, allow_pickle=False) as data:
+            return cls([str(name) for name in data['predictors']], data['weights'], float(data['intercept']))
@@ -0,0 +1,150 @@
+"""
+Versioned on-disk artifacts for trained pace models.
+
+Each artifact is a pickle of the fitted model (scalers, coefficients, PCA components and
+the held-out test split its metrics came from) plus a JSON sidecar recording the artifact
+format version, the scikit-learn version it was pickled with, the fingerprint of the
+training data, and the metrics computed at train time. An artifact only loads if all of
+those still match, so a library upgrade or new activities fall through to a retrain.
+
+Linear models are also saved in fused form (see linear_predictor.py) as a NumPy .npz next to
+the pickle. That file needs neither scikit-learn nor a matching library version to load, so
+prediction-only callers use load_predictor.
+"""
+
+import io
+import json
+import os
+import pickle
+import tempfile
+import time
+from importlib import metadata
+from typing import Any, Dict, Optional, Tuple
+
+from back_end.constants import LOCAL_CACHE_DIR
+from back_end.predictive_models.linear_predictor import FusedLinearPredictor
+
+MODEL_ARTIFACT_VERSION = 1
+_MODELS_DIR = os.path.join(LOCAL_CACHE_DIR, "models")
+
+
+def _sklearn_version() -> Optional[str]:
+    try:
+        return metadata.version("scikit-learn")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _paths(name: str) -> Tuple[str, str]:
+    base = os.path.join(_MODELS_DIR, f"{name}.v{MODEL_ARTIFACT_VERSION}")
+    return base + ".pkl", base + ".json"
+
+
+def _predictor_path(name: str) -> str:
+    return os.path.join(_MODELS_DIR, f"{name}.v{MODEL_ARTIFACT_VERSION}.npz")
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def save_model(name: str, model: Any, fingerprint: str, metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Persist a trained model under `name`; returns the metadata written alongside it."""
+    model_path, meta_path = _paths(name)
+    now = time.time()
+    meta = {
+        "artifact_version": MODEL_ARTIFACT_VERSION,
+        "model_class": type(model).__name__,
+        "sklearn_version": _sklearn_version(),
+        "fingerprint": fingerprint,
+        "trained_at": now,
+        "checked_at": now,
+        "metrics": metrics or {},
+    }
+    _atomic_write(model_path, pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+    try:
+        predictor = FusedLinearPredictor.from_model(model)
+    except (AttributeError, ValueError):
+        predictor = None
+    if predictor is not None:
+        buffer = io.BytesIO()
+        predictor.save(buffer)
+        _atomic_write(_predictor_path(name), buffer.getvalue())
+    _atomic_write(meta_path, json.dumps(meta, default=str).encode("utf-8"))
+    return meta
+
+
+def _read_metadata(name: str) -> Optional[Dict[str, Any]]:
+    _, meta_path = _paths(name)
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return meta if meta.get("artifact_version") == MODEL_ARTIFACT_VERSION else None
+
+
+def load_metadata(name: str) -> Optional[Dict[str, Any]]:
+    """Metadata for a saved artifact, or None if there is no compatible one."""
+    meta = _read_metadata(name)
+    if meta is None or meta.get("sklearn_version") != _sklearn_version():
+        return None
+    return meta
+
+
+def load_predictor_metadata(name: str) -> Optional[Dict[str, Any]]:
+    """Metadata for a saved fused predictor; unlike load_metadata, any scikit-learn version is fine."""
+    meta = _read_metadata(name)
+    if meta is None or not os.path.exists(_predictor_path(name)):
+        return None
+    return meta
+
+
+def load_model(name: str, fingerprint: Optional[str] = None) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    """
+    Load (model, metadata) for `name`. Returns None if the artifact is missing, was written by a
+    different artifact/scikit-learn version, or — when `fingerprint` is given — was trained on
+    different data.
+    """
+    meta = load_metadata(name)
+    if meta is None or (fingerprint is not None and meta.get("fingerprint") != fingerprint):
+        return None
+    model_path, _ = _paths(name)
+    try:
+        with open(model_path, "rb") as f:
+            model = pickle.load(f)
+    except (FileNotFoundError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    return model, meta
+
+
+def load_predictor(name: str, fingerprint: Optional[str] = None) -> Optional[Tuple[FusedLinearPredictor, Dict[str, Any]]]:
+    """
+    Load (FusedLinearPredictor, metadata) for `name` without unpickling (or importing) scikit-learn.
+    Returns None if there is no fused artifact or — when `fingerprint` is given — it was trained
+    on different data.
+    """
+    meta = load_predictor_metadata(name)
+    if meta is None or (fingerprint is not None and meta.get("fingerprint") != fingerprint):
+        return None
+    try:
+        return FusedLinearPredictor.load(_predictor_path(name)), meta
+    except (FileNotFoundError, ValueError, KeyError, OSError):
+        return None
+
+
+def mark_checked(name: str) -> None:
+    """Record that the artifact was just confirmed current against the training data."""
+    meta = _read_metadata(name)
+    if meta is None:
+        return
+    meta["checked_at"] = time.time()
+    _atomic_write(_paths(name)[1], json.dumps(meta, default=str).encode("utf-8"))
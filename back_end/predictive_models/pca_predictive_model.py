@@ -188,21 +188,33 @@ class PredictivePacingModelPCA: # Renamed class slightly
         
         # 1. Convert input dictionary to a DataFrame in the correct original feature order
         input_df = pd.DataFrame([current_data])[self.original_predictors]
-        
-        # 2. Scale the input data using the saved historical scales
+
+        # 2-5. Scale, PCA-transform, predict, and inverse transform (shared with the batch path)
+        return self.predict_pace_batch(input_df)[0]
+
+    def predict_pace_batch(self, X) -> np.ndarray:
+        """
+        Predicts pace for many runs in one pass (scale -> PCA -> predict -> inverse transform).
+
+        X is either an (n, 8) array whose columns follow self.original_predictors, or a
+        DataFrame containing those columns. Returns an array of n paces in min/mile.
+        """
+        if self.model is None or self.scaler_X is None or self.pca is None:
+            raise Exception("Model not trained yet. Run train_model() first.")
+
+        if isinstance(X, pd.DataFrame):
+            input_df = X[self.original_predictors]
+        else:
+            X = np.asarray(X, dtype=float)
+            if X.ndim != 2 or X.shape[1] != len(self.original_predictors):
+                raise ValueError(f"X must have shape (n, {len(self.original_predictors)}) in the order {self.original_predictors}")
+            # Scalers were fit on named columns; keep the names so sklearn doesn't warn
+            input_df = pd.DataFrame(X, columns=self.original_predictors)
+
         input_scaled = self.scaler_X.transform(input_df)
-        
-        # --- 3. Transform the scaled data using the fitted PCA model ---
         input_pca = self.pca.transform(input_scaled)
-        
-        # 4. Predict the scaled Pace (Y) using the principal components
-        predicted_pace_scaled = self.model.predict(input_pca)
-        predicted_pace_scaled = predicted_pace_scaled.reshape(-1, 1) 
-        
-        # 5. Inverse transform to get the Pace in min/mile
-        predicted_pace = self.scaler_Y.inverse_transform(predicted_pace_scaled)[0][0]
-        
-        return predicted_pace
+        predicted_pace_scaled = self.model.predict(input_pca).reshape(-1, 1)
+        return self.scaler_Y.inverse_transform(predicted_pace_scaled).ravel()
 
     def generate_test_results_csv(self, filename="model_pca_test_results.csv"): # Updated filename
         """
@@ -164,19 +164,35 @@ class PredictivePacingModel:
         
         # 1. Convert input dictionary to a DataFrame in the correct order
         input_df = pd.DataFrame([current_data])[self.predictors]
-        
-        # 2. Scale the input data using the saved historical scales (CRITICAL!)
+
+        # 2-4. Scale, predict, and inverse transform (shared with the batch path)
+        return self.predict_pace_batch(input_df)[0]
+
+    def predict_pace_batch(self, X) -> np.ndarray:
+        """
+        Predicts pace for many runs in one pass: one scale, one matrix multiply, one inverse transform.
+
+        X is either an (n, 8) array whose columns follow self.predictors, or a DataFrame
+        containing those columns. Returns an array of n paces in min/mile.
+        """
+        if self.model is None or self.scaler_X is None:
+            raise Exception("Model not trained yet. Run train_model() first.")
+
+        if isinstance(X, pd.DataFrame):
+            input_df = X[self.predictors]
+        else:
+            X = np.asarray(X, dtype=float)
+            if X.ndim != 2 or X.shape[1] != len(self.predictors):
+                raise ValueError(f"X must have shape (n, {len(self.predictors)}) in the order {self.predictors}")
+            # Scalers were fit on named columns; keep the names so sklearn doesn't warn
+            input_df = pd.DataFrame(X, columns=self.predictors)
+
+        # Scale the input data using the saved historical scales (CRITICAL!)
         input_scaled = self.scaler_X.transform(input_df)
-        
-        # 3. Predict the scaled Pace (Y)
-        predicted_pace_scaled = self.model.predict(input_scaled)
 
-        predicted_pace_scaled = predicted_pace_scaled.reshape(-1, 1) 
-        
-        # 4. Inverse transform to get the Pace in min/mile (the real world value)
-        predicted_pace = self.scaler_Y.inverse_transform(predicted_pace_scaled)[0][0]
-        
-        return predicted_pace
+        # Predict the scaled Pace (Y) and inverse transform to min/mile
+        predicted_pace_scaled = self.model.predict(input_scaled).reshape(-1, 1)
+        return self.scaler_Y.inverse_transform(predicted_pace_scaled).ravel()
 
     def generate_test_results_csv(self, filename="model_test_results.csv"):
         """
@@ -0,0 +1,91 @@
+"""
+CPU-bound half of RAG ingestion: read a file, extract its text, chunk and hash the chunks.
+
+prepare_file is a plain module-level function over plain data, so ingest.py can run it in a
+ProcessPoolExecutor (one file per task) and keep the network-bound embedding stage on threads.
+
+PDF text is cached per page in LOCAL_CACHE_DIR/pdf_pages/<file sha256>.json. The key is the
+file's content hash, so an edited PDF is simply a different entry; a re-run (after a chunker
+change, a rename, or a rebuilt database) never parses the same PDF twice.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from PyPDF2 import PdfReader
+
+from back_end.constants import RAG_PDF_PAGE_CACHE_DIR
+from back_end.rag.chunking import chunk_text
+
+
+def chunk_hash(content: str) -> str:
+    """sha256 of the chunk text; matches the SQL backfill in migration 5."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _page_cache_path(file_hash: str) -> str:
+    return os.path.join(RAG_PDF_PAGE_CACHE_DIR, f"{file_hash}.json")
+
+
+def _load_cached_pages(file_hash: str) -> Optional[List[str]]:
+    try:
+        with open(_page_cache_path(file_hash), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _save_cached_pages(file_hash: str, pages: List[str]) -> None:
+    # Written atomically: several worker processes may finish the same PDF at once
+    os.makedirs(RAG_PDF_PAGE_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=RAG_PDF_PAGE_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(pages, f)
+        os.replace(tmp_path, _page_cache_path(file_hash))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def extract_pdf_pages(data: bytes, file_hash: str) -> List[str]:
+    """Text of each page, from the page cache when this exact PDF was parsed before."""
+    pages = _load_cached_pages(file_hash)
+    if pages is None:
+        reader = PdfReader(io.BytesIO(data))
+        pages = [page.extract_text() or "" for page in reader.pages]
+        _save_cached_pages(file_hash, pages)
+    return pages
+
+
+def read_text(path: Path, data: bytes, file_hash: str) -> str:
+    if path.suffix.lower() == ".pdf":
+        return "\n\n".join(extract_pdf_pages(data, file_hash))
+    return data.decode("utf-8")
+
+
+def prepare_file(path: str, source: str, known_file_hash: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Read and hash one file; unless its hash equals known_file_hash, extract and chunk it.
+    Returns {source, file_hash, file_size, file_mtime_ns, chunks} where chunks maps
+    chunk_hash -> text (a chunk repeated within the file is kept once), or None when unchanged.
+    """
+    file_path = Path(path)
+    stat = file_path.stat()
+    data = file_path.read_bytes()
+    file_hash = hashlib.sha256(data).hexdigest()
+    prepared: Dict[str, Any] = {
+        "source": source,
+        "file_hash": file_hash,
+        "file_size": stat.st_size,
+        "file_mtime_ns": stat.st_mtime_ns,
+        "chunks": None,
+    }
+    if file_hash != known_file_hash:
+        prepared["chunks"] = {chunk_hash(chunk): chunk for chunk in chunk_text(read_text(file_path, data, file_hash))}
+    return prepared
@@ -2,22 +2,36 @@
 Embed reference documents into Supabase pgvector.
 
 Reads every .txt/.md/.pdf file under rag_docs/ (relative to the project root),
-chunks it, embeds the chunks with Voyage AI, and upserts into the
-`document_chunks` table — replacing any existing chunks for that file. Run
-this manually after adding or editing documents; it is not part of the MCP
-server's runtime.
+chunks it, embeds the chunks with Voyage AI, and syncs them into the
+`document_chunks` table. Run this manually after adding or editing documents;
+it is not part of the MCP server's runtime.
+
+Ingest is incremental, driven by the `document_sources` manifest:
+- a file whose size and mtime match the manifest is skipped without being read;
+- a file whose sha256 matches is skipped without being chunked;
+- for a changed file, only chunks whose text hash is not stored anywhere yet are
+  embedded (moved/renamed text reuses its embedding), and removed chunks are deleted;
+- chunks of files that no longer exist are deleted.
+So re-running with nothing changed makes one query and zero embedding calls.
+
+Changed files go through a two-stage pipeline. Reading, PDF extraction (see
+extraction.py, which caches parsed pages) and chunking run in a process pool;
+as each file comes out, its new chunks are handed to a small thread pool that
+calls Voyage, so network waits overlap with the remaining extraction. Results
+are written to the database from the main thread as they arrive.
 
     uv run --project /Users/matthewlazur/garmin-performance/garmin-analysis python -m back_end.rag.ingest
 """
 
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List
-
-from PyPDF2 import PdfReader
+from typing import Any, Dict, List, Optional, Tuple
 
+from back_end.constants import RAG_EMBED_MAX_CONCURRENCY, RAG_EXTRACT_MAX_PROCESSES
 from back_end.db import get_engine
-from back_end.rag import rag_repository
-from back_end.rag.chunking import chunk_text
+from back_end.migrations import ensure_migrated
+from back_end.rag import query_cache, rag_repository
+from back_end.rag.extraction import prepare_file
 from back_end.rag.voyage_client import EMBEDDING_MODEL, get_voyage_client
 
 _DOCS_DIR = Path(__file__).resolve().parents[2] / "rag_docs"
@@ -25,13 +39,6 @@ _SUPPORTED_SUFFIXES = {".txt", ".md", ".pdf"}
 _EMBED_BATCH_SIZE = 32
 
 
-def _read_text(path: Path) -> str:
-    if path.suffix.lower() == ".pdf":
-        reader = PdfReader(str(path))
-        return "\n\n".join(page.extract_text() or "" for page in reader.pages)
-    return path.read_text(encoding="utf-8")
-
-
 def _embed_chunks(chunks: List[str]) -> List[List[float]]:
     client = get_voyage_client()
     embeddings: List[List[float]] = []
@@ -42,18 +49,63 @@ def _embed_chunks(chunks: List[str]) -> List[List[float]]:
     return embeddings
 
 
-def ingest_file(engine, path: Path) -> int:
-    chunks = chunk_text(_read_text(path))
-    if not chunks:
-        return 0
-    embeddings = _embed_chunks(chunks)
-    source = str(path.relative_to(_DOCS_DIR))
-    rows = [
-        {"content": chunk, "embedding": embedding, "metadata": {"file": source}}
-        for chunk, embedding in zip(chunks, embeddings)
-    ]
-    rag_repository.replace_source_chunks(engine, source, rows)
-    return len(rows)
+def _is_unchanged(path: Path, manifest_entry: Optional[Dict[str, Any]]) -> bool:
+    if manifest_entry is None:
+        return False
+    stat = path.stat()
+    return (manifest_entry["file_size"], manifest_entry["file_mtime_ns"]) == (stat.st_size, stat.st_mtime_ns)
+
+
+def _store(engine, prepared: Dict[str, Any], to_embed: List[str], embeddings: List[List[float]]) -> None:
+    rag_repository.sync_source_chunks(
+        engine, prepared["source"], prepared["chunks"], dict(zip(to_embed, embeddings)),
+        {"file": prepared["source"]}, prepared["file_hash"], prepared["file_size"], prepared["file_mtime_ns"],
+    )
+    print(f"{prepared['source']}: {len(to_embed)} chunks embedded")
+
+
+def ingest_files(engine, paths: List[Path], manifest: Dict[str, Dict[str, Any]]) -> int:
+    """
+    Bring the given files' chunks up to date (extract in processes, embed on threads).
+    Returns how many files had their chunks rewritten.
+    """
+    candidates = [path for path in paths if not _is_unchanged(path, manifest.get(str(path.relative_to(_DOCS_DIR))))]
+    stored = 0
+    if not candidates:
+        return stored
+
+    with ProcessPoolExecutor(max_workers=min(RAG_EXTRACT_MAX_PROCESSES, len(candidates))) as extractors, \
+            ThreadPoolExecutor(max_workers=RAG_EMBED_MAX_CONCURRENCY) as embedders:
+        extracting: Dict[Future, Path] = {}
+        for path in candidates:
+            source = str(path.relative_to(_DOCS_DIR))
+            known_hash = manifest[source]["file_hash"] if source in manifest else None
+            extracting[extractors.submit(prepare_file, str(path), source, known_hash)] = path
+        embedding: Dict[Future, Tuple[Dict[str, Any], List[str]]] = {}
+
+        while extracting or embedding:
+            done, _ = wait([*extracting, *embedding], return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in extracting:
+                    del extracting[future]
+                    prepared = future.result()
+                    if prepared["chunks"] is None:
+                        # Same content, new mtime: remember it so the next run skips the read
+                        rag_repository.touch_source(engine, prepared["source"], prepared["file_size"], prepared["file_mtime_ns"])
+                        continue
+                    known = rag_repository.known_chunk_hashes(engine, list(prepared["chunks"]))
+                    to_embed = [hash_ for hash_ in prepared["chunks"] if hash_ not in known]
+                    if not to_embed:
+                        _store(engine, prepared, [], [])
+                        stored += 1
+                        continue
+                    texts = [prepared["chunks"][hash_] for hash_ in to_embed]
+                    embedding[embedders.submit(_embed_chunks, texts)] = (prepared, to_embed)
+                else:
+                    prepared, to_embed = embedding.pop(future)
+                    _store(engine, prepared, to_embed, future.result())
+                    stored += 1
+    return stored
 
 
 def main() -> None:
@@ -61,7 +113,7 @@ def main() -> None:
         raise SystemExit(f"No {_DOCS_DIR} directory found — add reference docs there first.")
 
     engine = get_engine()
-    rag_repository.ensure_schema(engine)
+    ensure_migrated(engine)
 
     paths = sorted(
         p for p in _DOCS_DIR.rglob("*")
@@ -69,11 +121,18 @@ def main() -> None:
     )
     if not paths:
         print(f"No .txt/.md/.pdf files found under {_DOCS_DIR}")
-        return
 
-    for path in paths:
-        count = ingest_file(engine, path)
-        print(f"{path.relative_to(_DOCS_DIR)}: {count} chunks")
+    manifest = rag_repository.load_manifest(engine)
+    stored = ingest_files(engine, paths, manifest)
+
+    orphans = sorted(set(manifest) - {str(p.relative_to(_DOCS_DIR)) for p in paths})
+    rag_repository.delete_sources(engine, orphans)
+    for source in orphans:
+        print(f"{source}: removed (file no longer exists)")
+
+    if stored or orphans:
+        # Running MCP servers drop their cached rag_search results
+        query_cache.bump_ingest_generation()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,228 @@
+"""
+Local, offline vector index for rag_search.
+
+The index is a directory (RAG_LOCAL_INDEX_DIR by default) holding:
+
+- embeddings-<stamp>.npy: float32 matrix, one L2-normalized row per chunk, memory-mapped on load
+- chunks-<stamp>.json:    source/content/metadata per row, in the same order
+- meta.json:              which files are current, plus the embedding model and row count
+
+Search is one matrix-vector product plus argpartition, so a few-thousand-chunk corpus answers in
+well under a millisecond with no network. Export writes new stamped files and swaps meta.json
+last, so a running server never reads a half-written index.
+
+Queries must be embedded in the same space as the rows. An index exported as-is from
+document_chunks holds Voyage (voyage-3) vectors; its queries go through the Voyage query cache,
+so only repeated questions work fully offline. For real offline use, export with a local embedder:
+any object with `name`, `embed_documents(texts)` and `embed_query(text)`, named as
+"package.module:factory" (--embedder, or GARMIN_ANALYSIS_RAG_EMBEDDER for the search side).
+
+    python -m back_end.rag.local_index                                  # copy vectors from document_chunks
+    python -m back_end.rag.local_index --embedder my_pkg.embed:make     # re-embed chunks locally
+"""
+
+import argparse
+import importlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Protocol, Sequence
+
+import numpy as np
+from pgvector.psycopg import register_vector
+from sqlalchemy.engine import Engine
+
+from back_end.constants import RAG_LOCAL_EMBEDDER, RAG_LOCAL_INDEX_DIR
+from back_end.db import get_engine
+from back_end.migrations import ensure_migrated
+from back_end.rag.query_cache import get_query_embedding
+from back_end.rag.voyage_client import EMBEDDING_DIMENSION, EMBEDDING_MODEL, get_voyage_client
+
+_META_FILE = "meta.json"
+_EMBED_BATCH_SIZE = 32
+
+
+class Embedder(Protocol):
+    name: str
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]: ...
+
+    def embed_query(self, text: str) -> List[float]: ...
+
+
+class VoyageEmbedder:
+    """The embedder document_chunks was built with; queries use the persisted query-embedding cache."""
+
+    name = EMBEDDING_MODEL
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), _EMBED_BATCH_SIZE):
+            batch = texts[start:start + _EMBED_BATCH_SIZE]
+            embeddings.extend(get_voyage_client().embed(batch, model=EMBEDDING_MODEL, input_type="document").embeddings)
+        return embeddings
+
+    def embed_query(self, text: str) -> List[float]:
+        return get_query_embedding(text)
+
+
+def load_embedder(spec: Optional[str] = None) -> Embedder:
+    """VoyageEmbedder when spec is empty, else the result of calling "package.module:factory"."""
+    if not spec:
+        return VoyageEmbedder()
+    module_name, _, factory_name = spec.partition(":")
+    if not factory_name:
+        raise ValueError(f"Embedder spec must look like 'package.module:factory', got {spec!r}")
+    return getattr(importlib.import_module(module_name), factory_name)()
+
+
+class LocalIndex:
+    def __init__(self, matrix: np.ndarray, chunks: List[Dict[str, Any]], model: str):
+        if matrix.ndim != 2 or matrix.shape[0] != len(chunks):
+            raise ValueError("Local index is inconsistent: embedding rows and chunks differ")
+        self.matrix = matrix
+        self.chunks = chunks
+        self.model = model
+
+    @classmethod
+    def load(cls, directory: str = RAG_LOCAL_INDEX_DIR) -> 'LocalIndex':
+        with open(os.path.join(directory, _META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        matrix = np.load(os.path.join(directory, meta["embeddings_file"]), mmap_mode="r")
+        with open(os.path.join(directory, meta["chunks_file"]), encoding="utf-8") as f:
+            chunks = json.load(f)
+        return cls(matrix, chunks, meta["model"])
+
+    def search(self, query_embedding: Sequence[float], top_k: int = 5) -> List[Dict[str, Any]]:
+        """Cosine top-k; same result shape as rag_repository.search."""
+        k = min(int(top_k), len(self.chunks))
+        if k <= 0:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (self.matrix.shape[1],):
+            raise ValueError(f"Query embedding has shape {query.shape}; the index expects ({self.matrix.shape[1]},)")
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        scores = self.matrix @ query  # rows are unit length, so this is cosine similarity
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            {
+                "source": self.chunks[i]["source"],
+                "content": self.chunks[i]["content"],
+                "metadata": self.chunks[i]["metadata"],
+                "similarity": round(float(scores[i]), 4),
+            }
+            for i in top
+        ]
+
+
+def write_index(directory: str, embeddings: np.ndarray, chunks: List[Dict[str, Any]], model: str) -> None:
+    """
+    Write a new index generation (normalized float32 rows) and make it current. An empty corpus
+    is written as a (0, EMBEDDING_DIMENSION) matrix, which searches to [].
+    """
+    if chunks:
+        matrix = np.asarray(embeddings, dtype=np.float32).reshape(len(chunks), -1)
+    else:
+        matrix = np.zeros((0, EMBEDDING_DIMENSION), dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = matrix / np.maximum(norms, 1e-12)
+
+    os.makedirs(directory, exist_ok=True)
+    stamp = str(time.time_ns())
+    embeddings_file, chunks_file = f"embeddings-{stamp}.npy", f"chunks-{stamp}.json"
+    np.save(os.path.join(directory, embeddings_file), matrix)
+    with open(os.path.join(directory, chunks_file), "w", encoding="utf-8") as f:
+        json.dump(chunks, f)
+    meta = {
+        "model": model,
+        "dimension": int(matrix.shape[1]),
+        "count": len(chunks),
+        "embeddings_file": embeddings_file,
+        "chunks_file": chunks_file,
+    }
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, os.path.join(directory, _META_FILE))
+
+    # Older generations; a reader that already mapped one keeps its open file
+    for name in os.listdir(directory):
+        if name.startswith(("embeddings-", "chunks-")) and name not in (embeddings_file, chunks_file):
+            os.unlink(os.path.join(directory, name))
+
+
+def export_index(engine: Engine, directory: str = RAG_LOCAL_INDEX_DIR, embedder: Optional[Embedder] = None) -> int:
+    """
+    Export document_chunks to a local index. Without an embedder the stored Voyage vectors are
+    copied (read in pgvector's binary format); with one, chunk texts are re-embedded locally.
+    Returns the number of chunks exported.
+    """
+    with engine.connect() as conn:
+        raw = conn.connection.driver_connection
+        register_vector(raw)
+        with raw.cursor(binary=True) as cur:
+            cur.execute("select source, content, metadata, embedding from document_chunks order by id")
+            rows = cur.fetchall()
+    chunks = [{"source": source, "content": content, "metadata": metadata} for source, content, metadata, _ in rows]
+    if embedder is None:
+        model = EMBEDDING_MODEL
+        # pgvector >= 0.5 loads a Vector, older releases a plain ndarray
+        embeddings = np.array(
+            [embedding.to_numpy() if hasattr(embedding, "to_numpy") else embedding for *_, embedding in rows],
+            dtype=np.float32,
+        )
+    else:
+        model = embedder.name
+        embeddings = np.array(embedder.embed_documents([chunk["content"] for chunk in chunks]), dtype=np.float32)
+    write_index(directory, embeddings, chunks, model)
+    return len(chunks)
+
+
+def index_exists(directory: str = RAG_LOCAL_INDEX_DIR) -> bool:
+    return os.path.exists(os.path.join(directory, _META_FILE))
+
+
+_loaded: Dict[str, Any] = {"version": None, "index": None}
+_loaded_lock = threading.Lock()
+
+
+def get_local_index(directory: str = RAG_LOCAL_INDEX_DIR) -> LocalIndex:
+    """The current index, reloaded only when an export has replaced meta.json."""
+    version = (directory, os.stat(os.path.join(directory, _META_FILE)).st_mtime_ns)
+    with _loaded_lock:
+        if _loaded["version"] != version:
+            _loaded["index"] = LocalIndex.load(directory)
+            _loaded["version"] = version
+        return _loaded["index"]
+
+
+def search_local(query: str, top_k: int = 5, embedder: Optional[Embedder] = None) -> List[Dict[str, Any]]:
+    """Embed `query` with the index's embedder (GARMIN_ANALYSIS_RAG_EMBEDDER by default) and search."""
+    index = get_local_index()
+    embedder = embedder or load_embedder(RAG_LOCAL_EMBEDDER)
+    if embedder.name != index.model:
+        raise ValueError(
+            f"The local index was built with {index.model!r} but queries would use {embedder.name!r}; "
+            "re-export it with the same embedder"
+        )
+    return index.search(embedder.embed_query(query), top_k)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export document_chunks to the local offline RAG index.")
+    parser.add_argument("--embedder", default=None, help="'package.module:factory' to re-embed chunks locally (default: copy Voyage vectors)")
+    parser.add_argument("--dir", default=RAG_LOCAL_INDEX_DIR, help="index directory")
+    args = parser.parse_args()
+
+    engine = get_engine()
+    ensure_migrated(engine)
+    embedder = load_embedder(args.embedder) if args.embedder else None
+    count = export_index(engine, args.dir, embedder)
+    print(f"Exported {count} chunks to {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Caches in front of rag_search.
+
+- Query embeddings: query text -> Voyage query embedding, LRU-bounded and persisted in
+  LOCAL_CACHE_DIR/rag_query_embeddings.json, so a repeated question (also across server restarts)
+  skips the Voyage round trip. Embeddings are stored as base64 float32, the precision
+  document_chunks keeps anyway.
+- Search results: (embedding hash, top_k) -> matches, in memory for RAG_RESULT_CACHE_TTL_SECONDS.
+  Ingest bumps an on-disk generation marker (LOCAL_CACHE_DIR/rag_ingest_generation) when it
+  changes document_chunks; a changed marker drops every cached result, so a running MCP server
+  never serves matches from before an ingest on this machine. The TTL bounds staleness otherwise.
+"""
+
+import base64
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.engine import Engine
+
+from back_end.constants import (
+    LOCAL_CACHE_DIR,
+    RAG_QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+    RAG_RESULT_CACHE_MAX_ENTRIES,
+    RAG_RESULT_CACHE_TTL_SECONDS,
+)
+from back_end.json_cache import JsonFileCache
+from back_end.rag import rag_repository
+from back_end.rag.voyage_client import EMBEDDING_MODEL, get_voyage_client
+
+_GENERATION_PATH = os.path.join(LOCAL_CACHE_DIR, "rag_ingest_generation")
+
+
+@lru_cache(maxsize=1)
+def get_query_embedding_cache() -> JsonFileCache:
+    return JsonFileCache(
+        os.path.join(LOCAL_CACHE_DIR, "rag_query_embeddings.json"),
+        max_entries=RAG_QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+    )
+
+
+def _normalize(query: str) -> str:
+    return " ".join(query.split())
+
+
+def get_query_embedding(query: str) -> List[float]:
+    """Voyage query embedding for `query` (whitespace-normalized), from cache when seen before."""
+    text = _normalize(query)
+    key = f"{EMBEDDING_MODEL}:{text}"
+    cache = get_query_embedding_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        return np.frombuffer(base64.b64decode(cached), dtype=np.float32).tolist()
+    embedding = get_voyage_client().embed([text], model=EMBEDDING_MODEL, input_type="query").embeddings[0]
+    cache.set(key, base64.b64encode(np.asarray(embedding, dtype=np.float32).tobytes()).decode("ascii"))
+    return embedding
+
+
+def ingest_generation() -> int:
+    """The marker's value (a time_ns stamp); 0 before the first ingest. One tiny file read."""
+    try:
+        with open(_GENERATION_PATH, encoding="utf-8") as f:
+            return int(f.read() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def bump_ingest_generation() -> None:
+    """Called by ingest after it changes document_chunks; invalidates cached search results."""
+    os.makedirs(LOCAL_CACHE_DIR, exist_ok=True)
+    with open(_GENERATION_PATH, "w", encoding="utf-8") as f:
+        f.write(str(time.time_ns()))
+
+
+class SearchResultCache:
+    def __init__(self, ttl_seconds: float = RAG_RESULT_CACHE_TTL_SECONDS, max_entries: int = RAG_RESULT_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._generation = ingest_generation()
+        self._lock = threading.Lock()
+
+    def search(self, engine: Engine, embedding: Sequence[float], top_k: int) -> List[Dict[str, Any]]:
+        key = (hashlib.sha256(np.asarray(embedding, dtype=np.float32).tobytes()).hexdigest(), top_k)
+        generation = ingest_generation()
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+        results = rag_repository.search(engine, embedding, top_k)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, results)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_search_result_cache() -> SearchResultCache:
+    return SearchResultCache()
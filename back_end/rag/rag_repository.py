@@ -1,58 +1,116 @@
 import json
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Sequence, Set
 
+import numpy as np
+from pgvector.psycopg import register_vector
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
-from back_end.rag.voyage_client import EMBEDDING_DIMENSION
 
-_SCHEMA_STATEMENTS = [
-    "create extension if not exists vector",
-    f"""
-    create table if not exists document_chunks (
-        id bigint generated always as identity primary key,
-        source text not null,
-        content text not null,
-        embedding vector({EMBEDDING_DIMENSION}) not null,
-        metadata jsonb not null default '{{}}'::jsonb,
-        created_at timestamptz not null default now()
-    )
-    """,
-    "create index if not exists idx_document_chunks_source on document_chunks(source)",
-    "create index if not exists idx_document_chunks_embedding "
-    "on document_chunks using hnsw (embedding vector_cosine_ops)",
-]
+def _to_vector_literal(embedding: Sequence[float]) -> str:
+    return "[" + ",".join(repr(float(x)) for x in embedding) + "]"
+
+
+def load_manifest(engine: Engine) -> Dict[str, Dict[str, Any]]:
+    """Per-source manifest rows (file_hash, file_size, file_mtime_ns, chunk_count), keyed by source."""
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("select source, file_hash, file_size, file_mtime_ns, chunk_count from document_sources")
+        ).mappings().all()
+    return {row["source"]: dict(row) for row in rows}
+
+
+def known_chunk_hashes(engine: Engine, hashes: Sequence[str]) -> Set[str]:
+    """The subset of `hashes` already embedded under any source."""
+    if not hashes:
+        return set()
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("select distinct chunk_hash from document_chunks where chunk_hash = any((:hashes)::text[])"),
+            {"hashes": list(hashes)},
+        ).fetchall()
+    return {row[0] for row in rows}
 
 
-def ensure_schema(engine: Engine) -> None:
+def touch_source(engine: Engine, source: str, file_size: int, file_mtime_ns: int) -> None:
+    """Record a new size/mtime for a file whose content hash did not change."""
     with engine.begin() as conn:
-        for statement in _SCHEMA_STATEMENTS:
-            conn.execute(text(statement))
+        conn.execute(
+            text("update document_sources set file_size = :size, file_mtime_ns = :mtime where source = :source"),
+            {"source": source, "size": file_size, "mtime": file_mtime_ns},
+        )
 
 
-def _to_vector_literal(embedding: Sequence[float]) -> str:
-    return "[" + ",".join(repr(float(x)) for x in embedding) + "]"
+def sync_source_chunks(
+    engine: Engine,
+    source: str,
+    chunks: Dict[str, str],
+    new_embeddings: Dict[str, Sequence[float]],
+    metadata: Dict[str, Any],
+    file_hash: str,
+    file_size: int,
+    file_mtime_ns: int,
+) -> None:
+    """
+    Make `source`'s stored chunks equal `chunks` (chunk_hash -> content) in one transaction:
+    chunks no longer in the file are deleted, chunks already stored (under this or any other
+    source) keep/copy their embeddings, and only `new_embeddings` (chunk_hash -> embedding) are
+    inserted, with one binary COPY. The manifest row is updated last.
+    """
+    hashes = list(chunks)
+    with engine.begin() as conn:
+        conn.execute(
+            text("delete from document_chunks where source = :source and chunk_hash <> all((:hashes)::text[])"),
+            {"source": source, "hashes": hashes},
+        )
+        conn.execute(
+            text(
+                """
+                insert into document_chunks (source, content, embedding, metadata, chunk_hash)
+                select distinct on (chunk_hash) :source, content, embedding, (:metadata)::jsonb, chunk_hash
+                from document_chunks
+                where chunk_hash = any((:hashes)::text[]) and source <> :source
+                on conflict (source, chunk_hash) do nothing
+                """
+            ),
+            {"source": source, "hashes": hashes, "metadata": json.dumps(metadata)},
+        )
+        if new_embeddings:
+            raw = conn.connection.driver_connection  # the psycopg connection behind this transaction
+            register_vector(raw)
+            with raw.cursor() as cur:
+                # Embeddings go as float32 in pgvector's binary format, metadata as binary jsonb
+                with cur.copy(
+                    "copy document_chunks (source, content, embedding, metadata, chunk_hash) from stdin (format binary)"
+                ) as copy:
+                    copy.set_types(["text", "text", "vector", "jsonb", "text"])
+                    for hash_, embedding in new_embeddings.items():
+                        copy.write_row((source, chunks[hash_], np.asarray(embedding, dtype=np.float32), metadata, hash_))
+        conn.execute(
+            text(
+                """
+                insert into document_sources (source, file_hash, file_size, file_mtime_ns, chunk_count)
+                values (:source, :file_hash, :size, :mtime, :chunk_count)
+                on conflict (source) do update set
+                    file_hash = excluded.file_hash,
+                    file_size = excluded.file_size,
+                    file_mtime_ns = excluded.file_mtime_ns,
+                    chunk_count = excluded.chunk_count,
+                    ingested_at = now()
+                """
+            ),
+            {"source": source, "file_hash": file_hash, "size": file_size, "mtime": file_mtime_ns, "chunk_count": len(hashes)},
+        )
 
 
-def replace_source_chunks(engine: Engine, source: str, rows: List[Dict[str, Any]]) -> None:
-    """Delete any existing chunks for `source`, then insert `rows` — a full replace on re-ingest."""
+def delete_sources(engine: Engine, sources: Sequence[str]) -> None:
+    """Remove the chunks and manifest rows of files that no longer exist."""
+    if not sources:
+        return
     with engine.begin() as conn:
-        conn.execute(text("delete from document_chunks where source = :source"), {"source": source})
-        for row in rows:
-            conn.execute(
-                text(
-                    """
-                    insert into document_chunks (source, content, embedding, metadata)
-                    values (:source, :content, (:embedding)::vector, (:metadata)::jsonb)
-                    """
-                ),
-                {
-                    "source": source,
-                    "content": row["content"],
-                    "embedding": _to_vector_literal(row["embedding"]),
-                    "metadata": json.dumps(row.get("metadata", {})),
-                },
-            )
+        params = {"sources": list(sources)}
+        conn.execute(text("delete from document_chunks where source = any((:sources)::text[])"), params)
+        conn.execute(text("delete from document_sources where source = any((:sources)::text[])"), params)
 
 
 def search(engine: Engine, query_embedding: Sequence[float], top_k: int = 5) -> List[Dict[str, Any]]:
@@ -0,0 +1,52 @@
+"""
+rag_search's backend choice: Supabase pgvector (with the query-embedding and result caches) or the
+offline index in local_index.py. RAG_SEARCH_BACKEND (GARMIN_ANALYSIS_RAG_BACKEND) picks one.
+"""
+
+import sys
+from typing import Any, Dict, List
+
+from sqlalchemy import exc as sa_exc
+from voyageai import error as voyage_error
+
+from back_end.constants import RAG_SEARCH_BACKEND
+from back_end.db import get_engine
+from back_end.migrations import ensure_migrated
+from back_end.rag import local_index
+from back_end.rag.query_cache import get_query_embedding, get_search_result_cache
+
+# Supabase or Voyage being unreachable (or throttling). Anything else is a bug and propagates.
+_UNAVAILABLE_ERRORS = (
+    sa_exc.OperationalError,
+    sa_exc.InterfaceError,
+    voyage_error.APIConnectionError,
+    voyage_error.Timeout,
+    voyage_error.TryAgain,
+    voyage_error.RateLimitError,
+    voyage_error.ServerError,
+    voyage_error.ServiceUnavailableError,
+)
+
+
+def search(query: str, top_k: int = 5, backend: str = RAG_SEARCH_BACKEND) -> List[Dict[str, Any]]:
+    """
+    Top-k reference passages for `query`. backend "pgvector" uses Voyage + Supabase, "local" the
+    offline index (local_index.py), and "auto" tries pgvector first and falls back to the local
+    index, when one has been exported, if Supabase or Voyage cannot be reached.
+    """
+    if backend not in ("auto", "pgvector", "local"):
+        raise ValueError(f"Unknown RAG search backend {backend!r}; use 'auto', 'pgvector' or 'local'")
+    if backend != "local":
+        try:
+            engine = get_engine()
+            ensure_migrated(engine)
+            # Repeated questions skip Voyage (persisted query embeddings) and, until the next
+            # ingest, the vector search itself (short-TTL result cache)
+            embedding = get_query_embedding(query)
+            return get_search_result_cache().search(engine, embedding, top_k)
+        except _UNAVAILABLE_ERRORS as e:
+            if backend == "pgvector" or not local_index.index_exists():
+                raise
+            # stderr: under the stdio MCP server, stdout is the JSON-RPC stream
+            print(f"pgvector search unavailable ({e}); using the local index", file=sys.stderr)
+    return local_index.search_local(query, top_k)
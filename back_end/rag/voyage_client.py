@@ -3,7 +3,7 @@ import os
 import voyageai
 
 # voyage-3's native output dimension. Keep this in sync with the `vector(N)`
-# column width in rag_repository._SCHEMA_STATEMENTS if the model ever changes.
+# column width in back_end/migrations.py (add a new migration) if the model ever changes.
 EMBEDDING_MODEL = "voyage-3"
 EMBEDDING_DIMENSION = 1024
 
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Optional, Set
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from back_end.report_objects.feature_rows import FEATURE_COLUMNS, FeatureRowBuilder
+
+
+def latest_start_time(engine: Engine) -> Optional[datetime]:
+    with engine.connect() as conn:
+        return conn.execute(text("select max(start_time) from activity_features")).scalar()
+
+
+def features_fingerprint(engine: Engine) -> str:
+    """Cheap identity of the stored training data: row count, newest activity id and last write time."""
+    with engine.connect() as conn:
+        count, max_id, last_write = conn.execute(
+            text("select count(*), max(activity_id), max(updated_at) from activity_features")
+        ).one()
+    return f"{count}:{max_id}:{last_write.isoformat() if last_write is not None else None}"
+
+
+def list_activity_ids_since(engine: Engine, since: datetime) -> Set[int]:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("select activity_id from activity_features where start_time >= :since"),
+            {"since": since},
+        ).fetchall()
+    return {int(row[0]) for row in rows}
+
+
+def load_features(engine: Engine) -> pd.DataFrame:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(f"select {', '.join(FEATURE_COLUMNS)} from activity_features order by start_time")
+        ).mappings().all()
+    return FeatureRowBuilder().extend(rows).to_dataframe()
+
+
+def save_features(engine: Engine, df: pd.DataFrame) -> None:
+    """Upsert feature rows keyed by activity_id (re-fetched activities overwrite their old row)."""
+    if df is None or df.empty:
+        return
+    # NaN/NaT -> None so the driver writes SQL nulls.
+    records = df[FEATURE_COLUMNS].astype(object).where(df[FEATURE_COLUMNS].notna(), None).to_dict(orient='records')
+    assignments = ", ".join(f"{col} = excluded.{col}" for col in FEATURE_COLUMNS if col != 'activity_id')
+    assignments += ", updated_at = now()"
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f"""
+                insert into activity_features ({', '.join(FEATURE_COLUMNS)})
+                values ({', '.join(':' + col for col in FEATURE_COLUMNS)})
+                on conflict (activity_id) do update set {assignments}
+                """
+            ),
+            records,
+        )
+
@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from back_end.report_objects.report_builder import ReportBuilder
+from back_end.report_objects.wellness_cache import get_wellness_cache
+from back_end.constants import FEATURE_PIPELINE_MAX_GARMIN_CALLS, FEATURE_PIPELINE_MAX_WEATHER_CALLS
+
+
+class FeaturePipeline:
+    """
+    Bounded-concurrency feature extraction for many activities at once.
+
+    Each activity still needs its summary, weather and sleep/HRV calls, but activities are
+    fanned out over a thread pool. Separate semaphores cap how many Garmin and how many
+    OpenWeatherMap requests are in flight, so a cold build scales with those limits rather
+    than with the sum of every request's latency. Results come back in input order.
+    """
+
+    def __init__(
+        self,
+        report_builder: Optional[ReportBuilder] = None,
+        max_garmin_calls: int = FEATURE_PIPELINE_MAX_GARMIN_CALLS,
+        max_weather_calls: int = FEATURE_PIPELINE_MAX_WEATHER_CALLS,
+    ):
+        if max_garmin_calls < 1 or max_weather_calls < 1:
+            raise ValueError("max_garmin_calls and max_weather_calls must be at least 1")
+        self.report_builder = report_builder or ReportBuilder()
+        self.max_garmin_calls = max_garmin_calls
+        self.max_weather_calls = max_weather_calls
+        self._garmin_slots = threading.BoundedSemaphore(max_garmin_calls)
+        self._weather_slots = threading.BoundedSemaphore(max_weather_calls)
+
+    def extract(self, client, activity_id) -> pd.DataFrame:
+        """Build the one-row feature frame (summary + weather + sleep + days since start) for one activity."""
+        return pd.DataFrame([self.extract_record(client, activity_id)])
+
+    def extract_record(self, client, activity_id) -> Dict[str, Any]:
+        """Feature record for one activity as a plain dict (see feature_rows.FEATURE_COLUMNS)."""
+        record = self._summary_record(client, activity_id)
+        with self._weather_slots:
+            record.update(self.report_builder.get_activity_weather_record(record))
+        return self._add_sleep_and_days(client, record)
+
+    def run(self, client, activity_ids: Sequence) -> List[Dict[str, Any]]:
+        """
+        Extract feature records for every activity id; results are in the same order as activity_ids.
+
+        Runs in three stages: summaries (concurrent, Garmin-bounded), weather for all activities
+        in one bulk pass (distinct location/hours only, weather-bounded), then sleep/HRV
+        (distinct nights prefetched into the wellness cache, Garmin-bounded).
+        """
+        if not activity_ids:
+            return []
+        # Enough workers to saturate both limits at once; the semaphores do the actual bounding.
+        pool = ThreadPoolExecutor(max_workers=self.max_garmin_calls + self.max_weather_calls)
+        try:
+            records = list(pool.map(lambda activity_id: self._summary_record(client, activity_id), activity_ids))
+            weather = self.report_builder.get_activity_weather_records(records, max_workers=self.max_weather_calls)
+            for record, weather_record in zip(records, weather):
+                record.update(weather_record)
+            # One pass over the distinct nights so two runs on the same day share a fetch.
+            get_wellness_cache().prefetch_days(
+                client,
+                (r['start_time'] for r in records if r['start_time'] is not None),
+                max_workers=self.max_garmin_calls,
+            )
+            return list(pool.map(lambda record: self._add_sleep_and_days(client, record), records))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _summary_record(self, client, activity_id) -> Dict[str, Any]:
+        with self._garmin_slots:
+            return self.report_builder.get_activity_summary_record(client, activity_id)
+
+    def _add_sleep_and_days(self, client, record: Dict[str, Any]) -> Dict[str, Any]:
+        with self._garmin_slots:
+            record.update(self.report_builder.get_sleep_record(record, client))
+        record.update(self.report_builder.get_days_since_start_record(record))
+        return record
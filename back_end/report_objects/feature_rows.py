@@ -0,0 +1,54 @@
+from typing import Any, Dict, Iterable, List
+
+import pandas as pd
+
+# Column order and dtypes of a per-activity feature row (see FeaturePipeline.extract_record).
+FEATURE_DTYPES = {
+    'activity_id': 'int64',
+    'activity_name': 'object',
+    'start_time': 'datetime64[ns]',
+    'finish_time': 'datetime64[ns]',
+    'distance_miles': 'float64',
+    'pace': 'float64',
+    'avg_hr': 'float64',
+    'elevation_gain': 'float64',
+    'longitude': 'float64',
+    'latitude': 'float64',
+    'temperature': 'float64',
+    'humidity': 'float64',
+    'hrv': 'float64',
+    'resting_heart_rate': 'float64',
+    'days_since_start': 'Int64',
+}
+FEATURE_COLUMNS = list(FEATURE_DTYPES)
+
+
+class FeatureRowBuilder:
+    """
+    Columnar accumulator for feature rows.
+
+    Rows are appended as plain dicts into one Python list per column, and a single typed
+    DataFrame is materialized at the end — so building n rows is O(n), unlike growing a
+    DataFrame with pd.concat inside the loop (which copies everything built so far each time).
+    """
+
+    def __init__(self, columns: List[str] = FEATURE_COLUMNS):
+        self.columns = list(columns)
+        self._data: Dict[str, List[Any]] = {col: [] for col in self.columns}
+
+    def __len__(self) -> int:
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    def append(self, record: Dict[str, Any]) -> None:
+        for col in self.columns:
+            self._data[col].append(record.get(col))
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> 'FeatureRowBuilder':
+        for record in records:
+            self.append(record)
+        return self
+
+    def to_dataframe(self) -> pd.DataFrame:
+        df = pd.DataFrame(self._data, columns=self.columns)
+        dtypes = {col: FEATURE_DTYPES[col] for col in self.columns if col in FEATURE_DTYPES}
+        return df.astype(dtypes)
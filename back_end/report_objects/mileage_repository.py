@@ -0,0 +1,83 @@
+from datetime import date
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+
+def get_coverage(engine: Engine) -> Optional[Tuple[date, date]]:
+    with engine.connect() as conn:
+        row = conn.execute(text("select covered_from, covered_to from weekly_mileage_coverage where id = 1")).first()
+    return (row[0], row[1]) if row else None
+
+
+def load_weeks(engine: Engine, start_monday: date, end_day: date) -> pd.DataFrame:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                select week_start, total_miles, activity_count, longest_run_miles
+                from weekly_mileage
+                where week_start between :start and :end
+                order by week_start
+                """
+            ),
+            {"start": start_monday, "end": end_day},
+        ).mappings().all()
+    return pd.DataFrame(rows, columns=['week_start', 'total_miles', 'activity_count', 'longest_run_miles'])
+
+
+def save_weeks(
+    engine: Engine,
+    start_monday: date,
+    end_day: date,
+    weeks: Dict[date, Dict[str, Any]],
+    reset_coverage: bool = False,
+) -> None:
+    """
+    Replace the rollup rows for the weeks in [start_monday, end_day] with `weeks` and extend the
+    covered range to include those days (or set it to exactly them when reset_coverage is True),
+    all in one transaction. The synced range must touch the current coverage to keep it contiguous.
+    """
+    records = [
+        {
+            "week_start": week_start,
+            "total_miles": float(week["total_miles"]),
+            "activity_count": int(week["activity_count"]),
+            "longest_run_miles": float(week["longest_run_miles"]),
+        }
+        for week_start, week in sorted(weeks.items())
+    ]
+    with engine.begin() as conn:
+        conn.execute(
+            text("delete from weekly_mileage where week_start between :start and :end"),
+            {"start": start_monday, "end": end_day},
+        )
+        if records:
+            conn.execute(
+                text(
+                    """
+                    insert into weekly_mileage (week_start, total_miles, activity_count, longest_run_miles)
+                    values (:week_start, :total_miles, :activity_count, :longest_run_miles)
+                    """
+                ),
+                records,
+            )
+        if reset_coverage:
+            conflict_update = "covered_from = excluded.covered_from, covered_to = excluded.covered_to"
+        else:
+            conflict_update = (
+                "covered_from = least(weekly_mileage_coverage.covered_from, excluded.covered_from), "
+                "covered_to = greatest(weekly_mileage_coverage.covered_to, excluded.covered_to)"
+            )
+        conn.execute(
+            text(
+                f"""
+                insert into weekly_mileage_coverage (id, covered_from, covered_to)
+                values (1, :start, :end)
+                on conflict (id) do update set {conflict_update}, updated_at = now()
+                """
+            ),
+            {"start": start_monday, "end": end_day},
+        )
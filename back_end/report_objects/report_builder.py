@@ -1,8 +1,10 @@
 import pandas as pd
 from datetime import datetime, timedelta, date
 import json
+from typing import Any, Dict, List
 from back_end.report_objects.report_reader import ReportReader
-from back_end.constants import REGRESSION_START_DATE_YEAR, REGRESSION_START_DATE_MONTH, REGRESSION_START_DATE_DAY
+from back_end.report_objects.wellness_cache import get_wellness_cache
+from back_end.constants import REGRESSION_START_DATE_YEAR, REGRESSION_START_DATE_MONTH, REGRESSION_START_DATE_DAY, RUNNING_ACTIVITY_TYPES
 
 class ReportBuilder:
     def __init__(self):
@@ -53,7 +55,7 @@ class ReportBuilder:
         running_activities = []
         for activity in activities:
             activity_type = activity.get('activityType', {}).get('typeKey', '').lower()
-            if activity_type in ['treadmill_running', 'running', 'manual', 'track_running']:
+            if activity_type in RUNNING_ACTIVITY_TYPES:
                 running_activities.append(activity)
         
         # Convert to DataFrame
@@ -92,6 +94,27 @@ class ReportBuilder:
         
         return weekly_mileage
     
+    def rollup_weekly_mileage(self, client, start_day: date, end_day: date) -> Dict[date, Dict[str, Any]]:
+        """
+        Stream running activities between start_day and end_day (inclusive) into per-week totals,
+        keyed by the Monday of each W-SUN week: {'total_miles', 'activity_count', 'longest_run_miles'}.
+        Activities are folded in one at a time, so no per-activity DataFrame is built.
+        """
+        weeks: Dict[date, Dict[str, Any]] = {}
+        activities = client.get_activities_by_date(start_day.strftime('%Y-%m-%d'), end_day.strftime('%Y-%m-%d'))
+        for activity in activities:
+            activity_type = activity.get('activityType', {}).get('typeKey', '').lower()
+            if activity_type not in RUNNING_ACTIVITY_TYPES or not activity.get('startTimeLocal'):
+                continue
+            run_day = pd.Timestamp(activity['startTimeLocal']).date()
+            week_start = run_day - timedelta(days=run_day.weekday())
+            miles = (activity.get('distance') or 0.0) / 1609.34
+            week = weeks.setdefault(week_start, {'total_miles': 0.0, 'activity_count': 0, 'longest_run_miles': 0.0})
+            week['total_miles'] += miles
+            week['activity_count'] += 1
+            week['longest_run_miles'] = max(week['longest_run_miles'], miles)
+        return weeks
+
     def get_all_time_prs(self, client):
         """
             Returns all time personal records for the user
@@ -164,6 +187,10 @@ class ReportBuilder:
         Fetch a single Garmin activity and return a one-row DataFrame with:
         - avg_hr, start_time, finish_time, pace (min/mile), distance (miles), elevation_gain, location
         """
+        return pd.DataFrame([self.get_activity_summary_record(client, activity_id)])
+
+    def get_activity_summary_record(self, client, activity_id) -> Dict[str, Any]:
+        """Same fields as get_activity_summary, as a plain dict (no DataFrame construction)."""
         activity = client.get_activity(activity_id)
         summary = activity.get('summaryDTO', {}) if isinstance(activity, dict) else {}
 
@@ -187,7 +214,7 @@ class ReportBuilder:
         elevation_gain = (summary.get('elevationGain') or 0.0) * 3.28084 # Convert to feet
         longitude = summary.get('startLongitude') or None
         latitude = summary.get('startLatitude') or None
-        row = {
+        return {
             'activity_id': activity.get('activityId') if isinstance(activity, dict) else activity_id,
             'activity_name': activity.get('activityName') if isinstance(activity, dict) else None,
             'start_time': start_time,
@@ -199,40 +226,53 @@ class ReportBuilder:
             'longitude': longitude,
             'latitude': latitude,
         }
-        return pd.DataFrame([row])
-    
-    def get_activity_weather(self, activity_summary):
 
+    def get_activity_weather(self, activity_summary):
+        return pd.DataFrame([self.get_activity_weather_record(activity_summary.iloc[0].to_dict())])
 
-        activity_id = activity_summary.iloc[0]['activity_id']
-        if activity_summary.iloc[0]['latitude'] is None or activity_summary.iloc[0]['longitude'] is None:
+    def get_activity_weather_record(self, activity_summary: Dict[str, Any]) -> Dict[str, Any]:
+        if activity_summary['latitude'] is None or activity_summary['longitude'] is None:
             raise Exception("Latitude or longitude is None")
-        latitude = activity_summary.iloc[0]['latitude']
-        longitude = activity_summary.iloc[0]['longitude']
-        start = activity_summary.iloc[0]['start_time']
-        end = activity_summary.iloc[0]['finish_time']
+        latitude = activity_summary['latitude']
+        longitude = activity_summary['longitude']
+        start = activity_summary['start_time']
+        end = activity_summary['finish_time']
         data = self.report_reader.fetch_weather_data_openweathermap(latitude, longitude, start, end)
-       
-        item = data[0] if isinstance(data, list) else data
+        return self._weather_record(activity_summary['activity_id'], data)
+
+    def get_activity_weather_records(self, activity_summaries: List[Dict[str, Any]], max_workers: int = 1) -> List[Dict[str, Any]]:
+        """
+        Weather for many activities in one pass: activities sharing a (location, hour) share a
+        single reading, and only readings missing from the weather cache are fetched.
+        """
+        for activity_summary in activity_summaries:
+            if activity_summary['latitude'] is None or activity_summary['longitude'] is None:
+                raise Exception("Latitude or longitude is None")
+        data = self.report_reader.fetch_weather_bulk(
+            [(s['latitude'], s['longitude'], s['start_time']) for s in activity_summaries],
+            max_workers=max_workers,
+        )
+        return [self._weather_record(s['activity_id'], item) for s, item in zip(activity_summaries, data)]
+
+    def _weather_record(self, activity_id, data) -> Dict[str, Any]:
+        item = data[0] if isinstance(data, list) and data else data
         if not isinstance(item, dict):
             raise Exception("Item is not a dictionary")
 
         main = item.get('main', {})
-        temperatures = main['temp']
-        humidities = main['humidity']
-
-        weather = pd.DataFrame([{
+        return {
             'activity_id': activity_id,
-            'temperature': temperatures,
-            'humidity': humidities
-    }])
+            'temperature': main['temp'],
+            'humidity': main['humidity'],
+        }
 
-        return weather
-    
     def get_sleep_data(self, activity_summary, client):
-        activity_id = activity_summary.iloc[0]['activity_id']
-        start_time = activity_summary.iloc[0]['start_time']
-        
+        return pd.DataFrame([self.get_sleep_record(activity_summary.iloc[0].to_dict(), client)])
+
+    def get_sleep_record(self, activity_summary: Dict[str, Any], client) -> Dict[str, Any]:
+        activity_id = activity_summary['activity_id']
+        start_time = activity_summary['start_time']
+
         # Garmin client expects a 'YYYY-MM-DD' string
         try:
             start_date_str = start_time.date().isoformat()
@@ -240,26 +280,15 @@ class ReportBuilder:
         except Exception:
             # Fallback if already a string or not a Timestamp/date
             start_date_str = str(start_time)
-        sleep_data = client.get_sleep_data(start_date_str)
-        
-        try:
-            hrv_data = client.get_hrv_data(start_date_str)
-            hrv = hrv_data['hrvSummary']['lastNightAvg']
-            
-        except Exception:
-            hrv = None
+        wellness = get_wellness_cache().get(client, start_date_str)
+        hrv = wellness['hrv']
+        resting_heart_rate = wellness['resting_heart_rate']
 
-        try:
-            resting_heart_rate = sleep_data['restingHeartRate']
-        except Exception:
-            resting_heart_rate = None
-        
-        sleep = pd.DataFrame([{
+        return {
             'activity_id': activity_id,
             'hrv': hrv,
             'resting_heart_rate': resting_heart_rate
-        }])
-        return sleep
+        }
 
     def list_activities(self, client, start_date, end_date) -> pd.DataFrame:
         """
@@ -293,7 +322,7 @@ class ReportBuilder:
         rows = []
         for activity in activities:
             activity_type = activity.get('activityType', {}).get('typeKey', '').lower()
-            if activity_type not in ['treadmill_running', 'running', 'manual', 'track_running']:
+            if activity_type not in RUNNING_ACTIVITY_TYPES:
                 continue
             distance_m = activity.get('distance') or 0.0
             distance_miles = distance_m / 1609.34 if distance_m else 0.0
@@ -323,39 +352,25 @@ class ReportBuilder:
         else:
             raise TypeError("target_date must be a datetime, date, or 'YYYY-MM-DD' string")
 
-        sleep_data = client.get_sleep_data(date_str)
-        try:
-            hrv_data = client.get_hrv_data(date_str)
-            hrv = hrv_data['hrvSummary']['lastNightAvg']
-        except Exception:
-            hrv = None
-
-        resting_heart_rate = sleep_data.get('restingHeartRate') if isinstance(sleep_data, dict) else None
-        sleep_score = None
-        if isinstance(sleep_data, dict):
-            sleep_score = (
-                sleep_data.get('dailySleepDTO', {})
-                .get('sleepScores', {})
-                .get('overall', {})
-                .get('value')
-            )
+        wellness = get_wellness_cache().get(client, date_str)
 
         return pd.DataFrame([{
             'date': date_str,
-            'sleep_score': sleep_score,
-            'hrv': hrv,
-            'resting_heart_rate': resting_heart_rate,
+            'sleep_score': wellness['sleep_score'],
+            'hrv': wellness['hrv'],
+            'resting_heart_rate': wellness['resting_heart_rate'],
         }])
 
     def get_days_since_start(self, activity_summary):
-        activity_id = activity_summary.iloc[0]['activity_id']
-        activity_start_time = activity_summary.iloc[0]['start_time'].date()
+        return pd.DataFrame([self.get_days_since_start_record(activity_summary.iloc[0].to_dict())])
+
+    def get_days_since_start_record(self, activity_summary: Dict[str, Any]) -> Dict[str, Any]:
+        activity_start_time = activity_summary['start_time'].date()
         start_date = datetime(REGRESSION_START_DATE_YEAR, REGRESSION_START_DATE_MONTH, REGRESSION_START_DATE_DAY).date()
-        days_since_start = (activity_start_time - start_date).days
-        return pd.DataFrame([{
-            'activity_id': activity_id,
-            'days_since_start': days_since_start
-        }])
+        return {
+            'activity_id': activity_summary['activity_id'],
+            'days_since_start': (activity_start_time - start_date).days,
+        }
 
 
 
@@ -1,15 +1,23 @@
-from datetime import date, datetime
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 import pandas as pd
 
 from back_end.db import get_engine
+from back_end.migrations import ensure_migrated
 from back_end.report_objects.report_builder import ReportBuilder
+from back_end.report_objects.feature_pipeline import FeaturePipeline
+from back_end.report_objects.feature_rows import FeatureRowBuilder
 from back_end.marathon_objects.marathon_plan_manager import MarathonPlan
 from back_end.marathon_objects import plan_repository
+from back_end.marathon_objects.plan_cache import get_plan_cache
+from back_end.report_objects import activity_repository, mileage_repository
 from back_end.report_objects.report_reader import ReportReader
-from back_end.predictive_models.regression_predictive_model import PredictivePacingModel
-from back_end.predictive_models.pca_predictive_model import PredictivePacingModelPCA
+from back_end.report_objects.wellness_cache import get_wellness_cache
+from back_end.predictive_models.linear_predictor import FusedLinearPredictor
+from back_end.predictive_models import model_store
 from back_end.constants import (
     REGRESSION_START_DATE_YEAR,
     REGRESSION_START_DATE_MONTH,
@@ -18,18 +26,35 @@ from back_end.constants import (
     DEFAULT_LONGITUDE,
     ELEVATION_FT_PER_MILE,
     HR_TARGETS,
+    MODEL_FRESHNESS_CHECK_SECONDS,
+    WEEKLY_MILEAGE_SYNC_CHUNK_WEEKS,
 )
 
+if TYPE_CHECKING:
+    # scikit-learn/statsmodels are only imported when a model is actually trained or unpickled
+    from back_end.predictive_models.regression_predictive_model import PredictivePacingModel
+    from back_end.predictive_models.pca_predictive_model import PredictivePacingModelPCA
+
+# Saved-artifact names for the two pace model variants (see predictive_models/model_store.py)
+PACING_MODEL_ARTIFACT = 'pacing_ridge'
+PACING_MODEL_PCA_ARTIFACT = 'pacing_pca'
+
 class ReportManager:
     def __init__(self):
         self.report_builder = ReportBuilder()
         self.report_reader = ReportReader()
-        self.marathon_plans = {}
+        self.feature_pipeline = FeaturePipeline(self.report_builder)
         self._engine = get_engine()
-        plan_repository.ensure_schema(self._engine)
+        ensure_migrated(self._engine)
         # Predictive model holder
-        self.pacing_model: Optional[PredictivePacingModel] = None
-        self.pacing_model_pca: Optional[PredictivePacingModelPCA] = None
+        self.pacing_model: Optional['PredictivePacingModel'] = None
+        self.pacing_model_pca: Optional['PredictivePacingModelPCA'] = None
+        # sklearn-free fused form of pacing_model, used for serving predictions
+        self.pacing_predictor: Optional[FusedLinearPredictor] = None
+        self.pacing_model_metrics: Dict[str, Any] = {}
+        self.pacing_model_pca_metrics: Dict[str, Any] = {}
+        # One load/train at a time when a shared manager is used from several threads (UI + warm-up)
+        self._pacing_lock = threading.RLock()
 
     def get_activity_statistics(self, client, start_date, end_date, week_period_days=7):
         """
@@ -39,54 +64,135 @@ class ReportManager:
         - 'weekly_mileage': DataFrame with weekly mileage aggregates
         - 'personal_records': DataFrame with all-time personal records
         """
-        weekly_mileage = self.report_builder.aggregate_weekly_mileage(
-            client=client,
-            start_date=start_date,
-            end_date=end_date,
-            time_delta=week_period_days,
-        )
+        weekly_mileage = self.get_weekly_mileage(client, start_date, end_date)
 
-        personal_records = self.report_builder.get_all_time_prs(client)
+        personal_records = self.get_personal_records(client)
 
         return {
             'weekly_mileage': weekly_mileage,
             'personal_records': personal_records,
         }
     
+    def get_personal_records(self, client) -> pd.DataFrame:
+        """All-time personal records (one Garmin call; no activity downloads)."""
+        return self.report_builder.get_all_time_prs(client)
+
+    def get_weekly_mileage(self, client, start_date, end_date, refresh: bool = False) -> pd.DataFrame:
+        """
+        Weekly running mileage for the W-SUN weeks overlapping [start_date, end_date], served
+        from the weekly_mileage rollup table.
+
+        Only days outside the rollup's covered range are downloaded from Garmin, plus the most
+        recent covered week (it may still be gaining runs); refresh=True re-downloads the whole
+        range. Returns the same shape as ReportBuilder.aggregate_weekly_mileage (whole weeks,
+        index 'Week of YYYY-MM-DD') with an extra Longest_Run_Miles column.
+        """
+        start_day, end_day = self._to_date(start_date), self._to_date(end_date)
+        first_monday = start_day - timedelta(days=start_day.weekday())
+        sync_end = min(end_day + timedelta(days=6 - end_day.weekday()), date.today())
+
+        coverage = None if refresh else mileage_repository.get_coverage(self._engine)
+        if coverage is None:
+            self._sync_weekly_mileage(client, first_monday, sync_end, reset_coverage=True)
+        else:
+            covered_from, covered_to = coverage
+            if first_monday < covered_from:
+                self._sync_weekly_mileage(client, first_monday, covered_from - timedelta(days=1), backwards=True)
+            resume_monday = covered_to - timedelta(days=covered_to.weekday())
+            if sync_end >= resume_monday:
+                self._sync_weekly_mileage(client, resume_monday, max(sync_end, covered_to))
+
+        weeks = mileage_repository.load_weeks(self._engine, first_monday, end_day)
+        if weeks.empty:
+            return pd.DataFrame()
+        weekly_mileage = pd.DataFrame(
+            {
+                'Total_Miles': weeks['total_miles'].astype(float).round(2).to_numpy(),
+                'Activity_Count': weeks['activity_count'].astype(int).to_numpy(),
+                'Longest_Run_Miles': weeks['longest_run_miles'].astype(float).round(2).to_numpy(),
+            },
+            index=pd.Index([f"Week of {week_start:%Y-%m-%d}" for week_start in weeks['week_start']], name='week_start'),
+        )
+        return weekly_mileage
+
+    def _sync_weekly_mileage(self, client, start_monday: date, end_day: date, reset_coverage: bool = False, backwards: bool = False) -> None:
+        """
+        Download [start_monday, end_day] in chunks of WEEKLY_MILEAGE_SYNC_CHUNK_WEEKS weeks and write
+        each chunk's rollup as it arrives. Chunks run towards the existing coverage (backwards
+        for a backfill) so an interrupted sync still leaves one contiguous covered range.
+        """
+        chunk = timedelta(weeks=WEEKLY_MILEAGE_SYNC_CHUNK_WEEKS)
+        ranges = []
+        cursor = start_monday
+        while cursor <= end_day:
+            ranges.append((cursor, min(cursor + chunk - timedelta(days=1), end_day)))
+            cursor += chunk
+        if backwards:
+            ranges.reverse()
+        for i, (chunk_start, chunk_end) in enumerate(ranges):
+            weeks = self.report_builder.rollup_weekly_mileage(client, chunk_start, chunk_end)
+            mileage_repository.save_weeks(self._engine, chunk_start, chunk_end, weeks, reset_coverage=reset_coverage and i == 0)
+
+    @staticmethod
+    def _to_date(value) -> date:
+        if isinstance(value, str):
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        raise TypeError("date must be a datetime, date, or 'YYYY-MM-DD' string")
+
     def get_activity_data(self, client, activity_id):
-        activity_summary = self.report_builder.get_activity_summary(client, activity_id)
-        weather_data = self.report_builder.get_activity_weather(activity_summary)
-        activity_summary_weather = activity_summary.merge(weather_data, on=['activity_id'], how='left')
-        sleep_data = self.report_builder.get_sleep_data(activity_summary_weather, client)
-        activity_summary_weather_sleep = activity_summary_weather.merge(sleep_data, on=['activity_id'], how='left')
-        days_since_start = self.report_builder.get_days_since_start(activity_summary_weather_sleep)
-        activity_summary_weather_sleep_days = activity_summary_weather_sleep.merge(days_since_start, on=['activity_id'], how='left')
-        return activity_summary_weather_sleep_days
-    
-    def get_regression_data(self, client):
-        print("Getting regression data")
+        return self.feature_pipeline.extract(client, activity_id)
+
+    def sync_activity_features(self, client, refresh: bool = False) -> int:
+        """
+        Fetch features for running activities not yet in the local activity_features store.
+        Only activities since the last stored start_time are listed; refresh=True re-fetches
+        everything since the regression start date. Returns the number of activities stored.
+        """
         today = date.today()
         start_date = date(REGRESSION_START_DATE_YEAR, REGRESSION_START_DATE_MONTH, REGRESSION_START_DATE_DAY)
-       
+        known_ids = set()
+        if not refresh:
+            last_start = activity_repository.latest_start_time(self._engine)
+            if last_start is not None:
+                start_date = last_start.date()
+                known_ids = activity_repository.list_activity_ids_since(
+                    self._engine, datetime.combine(start_date, datetime.min.time())
+                )
+
         activity_data = client.get_activities_by_date(start_date.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'))
-        regression_data = pd.DataFrame()
-        
+        new_activity_ids = []
+
         for activity in activity_data:
             activity_type = activity.get('activityType', {}).get('typeKey', '').lower()
             # Only include running activities
-            if activity_type in ['running']:
-                activity_id = activity['activityId']
-                activity_data = self.get_activity_data(client, activity_id)
-                regression_data = pd.concat([regression_data, activity_data], ignore_index=True)
+            if activity_type in ['running'] and activity['activityId'] not in known_ids:
+                new_activity_ids.append(activity['activityId'])
+
+        records = self.feature_pipeline.run(client, new_activity_ids)
+        new_data = FeatureRowBuilder().extend(records).to_dataframe()
+        activity_repository.save_features(self._engine, new_data)
+        print(f"Stored features for {len(new_data)} new activities")
+        return len(new_data)
+
+    def get_regression_data(self, client, refresh: bool = False):
+        print("Getting regression data")
+        self.sync_activity_features(client, refresh=refresh)
+        regression_data = activity_repository.load_features(self._engine)
         regression_data = regression_data.drop(columns=['activity_id', 'activity_name', 'start_time', 'finish_time', 'longitude', 'latitude'])
         return regression_data
 
     # -------- Predictive Pacing Model --------
     def train_pacing_model(self, client) -> Dict[str, Any]:
         """
-        Build regression dataset, train the pacing model, analyze, and store it.
-        Returns basic metrics for display.
+        Build regression dataset, train the pacing model, analyze, and store it
+        (in memory and as a saved artifact). Returns basic metrics for display.
         """
+        from back_end.predictive_models.regression_predictive_model import PredictivePacingModel
+
         df = self.get_regression_data(client)
         model = PredictivePacingModel()
         model.train_model(df)
@@ -102,12 +208,106 @@ class ReportManager:
         except Exception:
             metrics = {}
         self.pacing_model = model
+        self.pacing_predictor = FusedLinearPredictor.from_model(model)
+        self.pacing_model_metrics = metrics
+        model_store.save_model(PACING_MODEL_ARTIFACT, model, activity_repository.features_fingerprint(self._engine), metrics)
+        return metrics
+
+    def train_pacing_model_pca(self, client) -> Dict[str, Any]:
+        """Same as train_pacing_model, for the PCA + LR variant."""
+        from back_end.predictive_models.pca_predictive_model import PredictivePacingModelPCA
+
+        df = self.get_regression_data(client)
+        model = PredictivePacingModelPCA()
+        model.train_model(df)
+        metrics: Dict[str, Any] = {}
+        try:
+            accuracy, coef_df, r_squared_train, r_squared_test = model.analyze_model()
+            metrics = {
+                'accuracy_within_15s_percent': accuracy,
+                'r_squared_train': r_squared_train,
+                'r_squared_test': r_squared_test,
+                'coefficients': coef_df.to_dict(orient='records'),
+            }
+        except Exception:
+            metrics = {}
+        self.pacing_model_pca = model
+        self.pacing_model_pca_metrics = metrics
+        model_store.save_model(PACING_MODEL_PCA_ARTIFACT, model, activity_repository.features_fingerprint(self._engine), metrics)
         return metrics
 
+    def load_pacing_model(self, client=None, max_staleness_seconds: float = MODEL_FRESHNESS_CHECK_SECONDS) -> 'PredictivePacingModel':
+        """
+        Return the pacing model: the one already in memory, else the saved artifact, else a fresh train.
+        See _load_saved_model for when a saved artifact is considered current.
+        """
+        with self._pacing_lock:
+            if self.pacing_model is None:
+                loaded = self._load_saved_model(client, PACING_MODEL_ARTIFACT, max_staleness_seconds)
+                if loaded is not None:
+                    self.pacing_model, meta = loaded
+                    self.pacing_model_metrics = meta.get('metrics', {})
+                else:
+                    self.train_pacing_model(client)
+            return self.pacing_model
+
+    def load_pacing_model_pca(self, client=None, max_staleness_seconds: float = MODEL_FRESHNESS_CHECK_SECONDS) -> 'PredictivePacingModelPCA':
+        """Same as load_pacing_model, for the PCA + LR variant."""
+        with self._pacing_lock:
+            if self.pacing_model_pca is None:
+                loaded = self._load_saved_model(client, PACING_MODEL_PCA_ARTIFACT, max_staleness_seconds)
+                if loaded is not None:
+                    self.pacing_model_pca, meta = loaded
+                    self.pacing_model_pca_metrics = meta.get('metrics', {})
+                else:
+                    self.train_pacing_model_pca(client)
+            return self.pacing_model_pca
+
+    def load_pacing_predictor(self, client=None, max_staleness_seconds: float = MODEL_FRESHNESS_CHECK_SECONDS) -> FusedLinearPredictor:
+        """
+        Return the pacing model in fused, NumPy-only form for serving predictions. Prefers the saved
+        .npz (no scikit-learn import); falls back to folding the trained model, training if needed.
+        """
+        with self._pacing_lock:
+            if self.pacing_predictor is None:
+                loaded = None
+                if self.pacing_model is None:
+                    loaded = self._load_saved_model(
+                        client, PACING_MODEL_ARTIFACT, max_staleness_seconds,
+                        model_store.load_predictor_metadata, model_store.load_predictor,
+                    )
+                if loaded is not None:
+                    self.pacing_predictor, meta = loaded
+                    self.pacing_model_metrics = meta.get('metrics', {})
+                else:
+                    self.pacing_predictor = FusedLinearPredictor.from_model(self.load_pacing_model(client, max_staleness_seconds))
+            return self.pacing_predictor
+
+    def _load_saved_model(self, client, name: str, max_staleness_seconds: float,
+                          load_metadata=model_store.load_metadata, load=model_store.load_model):
+        """
+        Load a saved artifact if it is still current. An artifact checked within the last
+        max_staleness_seconds (or any artifact, when there is no client to check with) is used
+        as-is; otherwise new activities are synced first and the artifact is only used if the
+        stored training data's fingerprint is unchanged. Returns (model, metadata) or None.
+        """
+        meta = load_metadata(name)
+        if meta is not None and (client is None or time.time() - meta['checked_at'] < max_staleness_seconds):
+            return load(name)
+        if client is None:
+            return None
+        self.sync_activity_features(client)
+        loaded = load(name, activity_repository.features_fingerprint(self._engine))
+        if loaded is not None:
+            model_store.mark_checked(name)
+        return loaded
+
     def predict_pace(self, current_data: Dict[str, Any]) -> float:
-        if self.pacing_model is None:
-            raise RuntimeError("Pacing model not trained. Call train_pacing_model(client) first.")
-        return float(self.pacing_model.predict_pace(current_data))
+        if self.pacing_predictor is None:
+            if self.pacing_model is None:
+                raise RuntimeError("Pacing model not trained. Call load_pacing_predictor(client) first.")
+            self.pacing_predictor = FusedLinearPredictor.from_model(self.pacing_model)
+        return self.pacing_predictor.predict_pace(current_data)
 
     def predict_plan_day_pace(self, client, df_plan: pd.DataFrame, week: int, day_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -164,10 +364,9 @@ class ReportManager:
         # Sleep (previous night)
         try:
             sleep_date_str = (pd.Timestamp(run_date)).strftime('%Y-%m-%d')
-            sleep_data = client.get_sleep_data(sleep_date_str)
-            hrv_data = client.get_hrv_data(sleep_date_str)
-            hrv = hrv_data['hrvSummary']['lastNightAvg']
-            resting_heart_rate = sleep_data.get('restingHeartRate')
+            wellness = get_wellness_cache().get(client, sleep_date_str)
+            hrv = wellness['hrv']
+            resting_heart_rate = wellness['resting_heart_rate']
             print("HRV: ", hrv)
             print("Resting Heart Rate: ", resting_heart_rate)
         except Exception:
@@ -179,8 +378,7 @@ class ReportManager:
         print("Required: ", required)
         if any(x is None for x in required):
             return None
-        if self.pacing_model is None:
-            self.train_pacing_model(client)
+        self.load_pacing_predictor(client)
         features = {
             'distance_miles': float(distance_miles),
             'avg_hr': float(avg_hr),
@@ -207,10 +405,7 @@ class ReportManager:
 
     # -------- Marathon Plan Management (multi-plan) --------
     def list_plans(self) -> List[str]:
-        names = plan_repository.list_plan_names(self._engine)
-        # include in-memory plans that may not be saved yet
-        names.extend([n for n in self.marathon_plans.keys() if n not in names])
-        return sorted(names)
+        return plan_repository.list_plan_names(self._engine)
 
     def load_plan(self, name: Optional[str] = None) -> Optional[Tuple[str, date, date, pd.DataFrame]]:
         if name is None:
@@ -218,27 +413,29 @@ class ReportManager:
             if not names:
                 return None
             name = names[0]
-        if name in self.marathon_plans:
-            plan_obj: MarathonPlan = self.marathon_plans[name]
-        else:
-            plan_obj = plan_repository.load_plan(self._engine, name)
-            if plan_obj is None:
-                return None
-            self.marathon_plans[name] = plan_obj
-        marathon_name, start, end, df = plan_obj.get_plan()
-        if isinstance(start, datetime):
-            start = start.date()
-        if isinstance(end, datetime):
-            end = end.date()
-        return marathon_name, start, end, df
+        return self.load_plans([name]).get(name)
+
+    def load_plans(self, names: Optional[List[str]] = None) -> Dict[str, Tuple[str, date, date, pd.DataFrame]]:
+        """
+        Load several plans (default: all saved plans) through the process-wide plan cache: one
+        updated_at check, then one query for any that changed or were never loaded.
+        Returns {name: (name, start, race, df)} for the plans that exist.
+        """
+        if names is None:
+            names = self.list_plans()
+        plans = {}
+        for name, plan_obj in get_plan_cache().get_many(self._engine, names).items():
+            marathon_name, start, end, df = plan_obj.get_plan()
+            if isinstance(start, datetime):
+                start = start.date()
+            if isinstance(end, datetime):
+                end = end.date()
+            plans[name] = (marathon_name, start, end, df)
+        return plans
 
     def save_plan(self, name: str, start: date, race: date, df: pd.DataFrame) -> None:
-        if name not in self.marathon_plans:
-            self.marathon_plans[name] = MarathonPlan(name, start, race)
-        plan_obj: MarathonPlan = self.marathon_plans[name]
-        plan_obj.name = name
-        plan_obj.start = start
-        plan_obj.end = race
+        plan_obj = MarathonPlan(name, start, race)
         plan_obj.from_dataframe(df.copy())
         plan_obj.df = plan_obj.to_dataframe()
-        plan_repository.save_plan(self._engine, plan_obj)
\ No newline at end of file
+        updated_at = plan_repository.save_plan(self._engine, plan_obj)
+        get_plan_cache().put(name, plan_obj, updated_at)
\ No newline at end of file
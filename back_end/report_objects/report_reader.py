@@ -6,66 +6,216 @@ from garminconnect import (
 )
 import garminconnect
 import datetime
+import functools
+import time
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import os
 import garth
 from garth.exc import GarthHTTPError
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from back_end.json_cache import JsonFileCache
+from back_end.report_objects.throttling import TokenBucket, backoff_delay, parse_retry_after
+from back_end.constants import (
+    LOCAL_CACHE_DIR,
+    WEATHER_CACHE_COORD_DECIMALS,
+    WEATHER_CACHE_TTL_SECONDS,
+    HTTP_POOL_SIZE,
+    HTTP_TIMEOUT_SECONDS,
+    HTTP_MAX_RETRIES,
+    OPENWEATHERMAP_RATE_PER_SECOND,
+    OPENWEATHERMAP_BURST,
+    GARMIN_RATE_PER_SECOND,
+    GARMIN_BURST,
+)
+
+# Process-wide rate limits, shared by every ReportReader and Garmin client in the process.
+_OPENWEATHERMAP_BUCKET = TokenBucket(OPENWEATHERMAP_RATE_PER_SECOND, OPENWEATHERMAP_BURST)
+_GARMIN_BUCKET = TokenBucket(GARMIN_RATE_PER_SECOND, GARMIN_BURST)
+
+
+@lru_cache(maxsize=1)
+def get_weather_cache() -> JsonFileCache:
+    """Process-wide weather cache shared by every ReportReader, persisted under LOCAL_CACHE_DIR."""
+    return JsonFileCache(os.path.join(LOCAL_CACHE_DIR, "weather_cache.json"), ttl_seconds=WEATHER_CACHE_TTL_SECONDS)
+
+
+class ThrottledGarminClient:
+    """
+    Wraps a garminconnect.Garmin client so every get_* API call first takes a token from the
+    shared Garmin bucket, and is retried with exponential backoff on rate-limit or connection
+    errors. Every other attribute is passed straight through to the wrapped client.
+    """
+
+    def __init__(self, client: Garmin, bucket: TokenBucket = _GARMIN_BUCKET, max_retries: int = HTTP_MAX_RETRIES):
+        self._client = client
+        self._bucket = bucket
+        self._max_retries = max_retries
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not name.startswith('get_') or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def throttled(*args, **kwargs):
+            for attempt in range(self._max_retries + 1):
+                self._bucket.acquire()
+                try:
+                    return attr(*args, **kwargs)
+                except (GarminConnectTooManyRequestsError, GarminConnectConnectionError) as err:
+                    if attempt == self._max_retries:
+                        raise
+                    delay = backoff_delay(attempt)
+                    print(f"Garmin {name} failed ({err}); retrying in {delay:.1f}s")
+                    time.sleep(delay)
+
+        return throttled
+
 
 class ReportReader:
-    def __init__(self):
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE):
         self.report = {}
+        # One keep-alive session per reader so repeated weather calls reuse TLS connections.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
 
     def fetch_weather_data_openweathermap(self, latitude, longitude, start_date, end_date):
         """
         Fetch weather data using OpenWeatherMap API (requires API key)
+
+        Readings are served from the local weather cache (keyed by rounded lat/lon and hour)
+        when present; only cache misses hit the API.
         """
-        api_key = os.getenv("OPENWEATHERMAP_API_KEY")
-        
-        if not api_key:
-            raise Exception("OPENWEATHERMAP_API_KEY not found in environment variables")
-        
+        api_key = self._get_openweathermap_api_key()
+
         # Convert dates to Unix timestamps
         start_timestamp = int(start_date.timestamp())
         end_timestamp = int(end_date.timestamp())
-        url = "https://api.openweathermap.org/data/2.5/weather"
-        
+
         weather_data = []
         current_timestamp = start_timestamp
-        
+        cache = get_weather_cache()
+
         # OpenWeatherMap has a limit of 1000 calls per day for free tier
         # We'll fetch daily data to stay within limits
         while current_timestamp <= end_timestamp:
-            params = {
-                "lat": latitude,
-                "lon": longitude,
-                "dt": current_timestamp,
-                "appid": api_key,
-                "units": "imperial"  # Fahrenheit, mph, etc.
-            }
-            
-            response = requests.get(url, params=params)
-            
-            if response.status_code == 200:
-                data = response.json()
+            key = self.weather_cache_key(latitude, longitude, current_timestamp)
+            data = cache.get(key)
+            if data is None:
+                data = self._request_weather(latitude, longitude, current_timestamp, api_key)
+                if data is not None:
+                    cache.set(key, data)
+            if data is not None:
                 weather_data.append(data)
+
+            # Move to next day
+            current_timestamp += 86400  # 24 hours in seconds
+
+        return weather_data
+
+    def fetch_weather_bulk(self, points: Sequence[Tuple[float, float, Any]], max_workers: int = 1) -> List[Optional[dict]]:
+        """
+        Resolve weather for many (latitude, longitude, datetime) points at once.
+
+        Points are collapsed to distinct (rounded lat/lon, hour) keys; cached keys cost nothing
+        and each missing key is fetched exactly once (up to max_workers in parallel), so a whole
+        history build makes one call per distinct hour and location rather than one per activity.
+        Returns one reading (or None if it could not be fetched) per input point, in order. If a
+        request raises, readings fetched so far are cached before the error is re-raised.
+        """
+        keys = [self.weather_cache_key(lat, lon, int(when.timestamp())) for lat, lon, when in points]
+        cache = get_weather_cache()
+        resolved: Dict[str, Optional[dict]] = {}
+        missing: Dict[str, Tuple[float, float, int]] = {}
+        for key, (lat, lon, when) in zip(keys, points):
+            if key in resolved or key in missing:
+                continue
+            cached = cache.get(key)
+            if cached is not None:
+                resolved[key] = cached
+            else:
+                missing[key] = (lat, lon, int(when.timestamp()))
+
+        if missing:
+            api_key = self._get_openweathermap_api_key()
+            fetched: Dict[str, Optional[dict]] = {}
+            error: Optional[BaseException] = None
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                futures = {key: pool.submit(self._request_weather, *args, api_key) for key, args in missing.items()}
+                for key, future in futures.items():
+                    try:
+                        fetched[key] = future.result()
+                    except Exception as e:
+                        error = error or e
+            # Keep what was fetched even if one request failed, so a retry only asks for the rest
+            cache.set_many({key: data for key, data in fetched.items() if data is not None})
+            if error is not None:
+                raise error
+            resolved.update(fetched)
+
+        return [resolved.get(key) for key in keys]
+
+    @staticmethod
+    def weather_cache_key(latitude, longitude, timestamp: int) -> str:
+        decimals = WEATHER_CACHE_COORD_DECIMALS
+        hour = int(timestamp) - int(timestamp) % 3600
+        return f"{float(latitude):.{decimals}f},{float(longitude):.{decimals}f},{hour}"
+
+    def _get_openweathermap_api_key(self) -> str:
+        api_key = os.getenv("OPENWEATHERMAP_API_KEY")
+
+        if not api_key:
+            raise Exception("OPENWEATHERMAP_API_KEY not found in environment variables")
+        return api_key
+
+    def _request_weather(self, latitude, longitude, timestamp: int, api_key: str) -> Optional[dict]:
+        url = "https://api.openweathermap.org/data/2.5/weather"
+        params = {
+            "lat": latitude,
+            "lon": longitude,
+            "dt": timestamp,
+            "appid": api_key,
+            "units": "imperial"  # Fahrenheit, mph, etc.
+        }
+
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            _OPENWEATHERMAP_BUCKET.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=HTTP_TIMEOUT_SECONDS)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == HTTP_MAX_RETRIES:
+                    raise
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            if (response.status_code == 429 or response.status_code >= 500) and attempt < HTTP_MAX_RETRIES:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                time.sleep(backoff_delay(attempt, retry_after))
+                continue
+
+            if response.status_code == 200:
+                return response.json()
             elif response.status_code == 401:
                 raise Exception("Invalid OpenWeatherMap API key")
             elif response.status_code == 429:
                 raise Exception("OpenWeatherMap API rate limit exceeded")
             else:
-                print(f"Warning: Failed to fetch weather data for {datetime.datetime.fromtimestamp(current_timestamp).strftime('%Y-%m-%d')}: {response.status_code}")
-            
-            # Move to next day
-            current_timestamp += 86400  # 24 hours in seconds
-        
-        return weather_data
+                print(f"Warning: Failed to fetch weather data for {datetime.datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')}: {response.status_code}")
+                return None
 
     def fetch_garmin_data(self):
         """
         Fetch Garmin client with persistent auth using garth token management.
-        Based on example.py implementation.
+        Based on example.py implementation. The client is returned wrapped in a
+        ThrottledGarminClient so its API calls share the process-wide Garmin rate limit.
         """
         email = os.getenv("GARMIN_EMAIL")
         password = os.getenv("GARMIN_PASSWORD")
@@ -77,7 +227,7 @@ class ReportReader:
             garmin = garminconnect.Garmin()
             garmin.login(tokenstore)
             print(f"Logged in as: {garmin.display_name}")
-            return garmin
+            return ThrottledGarminClient(garmin)
 
         except (FileNotFoundError, GarthHTTPError, GarminConnectAuthenticationError):
             # Session is expired or doesn't exist. Need to log in again
@@ -106,7 +256,7 @@ class ReportReader:
                 # Re-login Garmin API with tokens (following example.py pattern)
                 garmin.login(tokenstore)
                 print(f"Logged in as: {garmin.display_name}")
-                return garmin
+                return ThrottledGarminClient(garmin)
 
             except (
                 FileNotFoundError,
@@ -0,0 +1,119 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional
+
+from back_end.json_cache import JsonFileCache
+from back_end.constants import (
+    FEATURE_PIPELINE_MAX_GARMIN_CALLS,
+    LOCAL_CACHE_DIR,
+    WELLNESS_CACHE_INCOMPLETE_TTL_SECONDS,
+    WELLNESS_CACHE_TODAY_TTL_SECONDS,
+)
+
+
+def _to_date_str(day) -> str:
+    if isinstance(day, str):
+        return day
+    if isinstance(day, datetime):
+        return day.date().isoformat()
+    if isinstance(day, date):
+        return day.isoformat()
+    raise TypeError("day must be a datetime, date, or 'YYYY-MM-DD' string")
+
+
+class WellnessCache:
+    """
+    Day-level cache of the sleep/HRV fields the app uses (resting_heart_rate, sleep_score, hrv),
+    keyed by calendar date and persisted to disk.
+
+    Past nights never change, so complete entries are kept permanently. Today (and any future
+    date) is cached only briefly, so a later call picks up the finished night. A past night
+    without HRV or resting HR may simply not have synced yet, so it expires too. A failed HRV
+    request is recorded as hrv=None under that same short TTL; a failed sleep request raises.
+    """
+
+    def __init__(self, cache: JsonFileCache):
+        self._cache = cache
+
+    def get(self, client, day) -> Dict[str, Any]:
+        date_str = _to_date_str(day)
+        wellness = self._cache.get(date_str)
+        if wellness is None:
+            wellness = self._fetch(client, date_str)
+            self._cache.set(date_str, wellness, ttl_seconds=self._ttl_for(date_str, wellness))
+        return wellness
+
+    def prefetch(self, client, start_date, end_date, max_workers: int = FEATURE_PIPELINE_MAX_GARMIN_CALLS) -> int:
+        """Fill the cache for every day in [start_date, end_date]; returns how many days were fetched."""
+        start = date.fromisoformat(_to_date_str(start_date))
+        end = date.fromisoformat(_to_date_str(end_date))
+        return self.prefetch_days(client, (start + timedelta(days=i) for i in range((end - start).days + 1)), max_workers)
+
+    def prefetch_days(self, client, days: Iterable, max_workers: int = FEATURE_PIPELINE_MAX_GARMIN_CALLS) -> int:
+        """
+        Fetch every day not already cached, in parallel, and store them with one write. If a fetch
+        fails, the days that succeeded are still stored before the first error is re-raised.
+        """
+        missing = sorted({d for d in (_to_date_str(day) for day in days) if d not in self._cache})
+        if not missing:
+            return 0
+        fetched: Dict[str, Dict[str, Any]] = {}
+        error: Optional[BaseException] = None
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {d: pool.submit(self._fetch, client, d) for d in missing}
+            for d, future in futures.items():
+                try:
+                    fetched[d] = future.result()
+                except Exception as e:
+                    error = error or e
+        by_ttl: Dict[Optional[float], Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        for d, w in fetched.items():
+            by_ttl[self._ttl_for(d, w)][d] = w
+        for ttl_seconds, entries in by_ttl.items():
+            self._cache.set_many(entries, ttl_seconds=ttl_seconds)
+        if error is not None:
+            raise error
+        return len(fetched)
+
+    @staticmethod
+    def _ttl_for(date_str: str, wellness: Dict[str, Any]) -> Optional[float]:
+        if date.fromisoformat(date_str) >= date.today():
+            return WELLNESS_CACHE_TODAY_TTL_SECONDS
+        if wellness['hrv'] is None or wellness['resting_heart_rate'] is None:
+            return WELLNESS_CACHE_INCOMPLETE_TTL_SECONDS
+        return None
+
+    @staticmethod
+    def _fetch(client, date_str: str) -> Dict[str, Any]:
+        sleep_data = client.get_sleep_data(date_str)
+        # Garmin answers a night without HRV with no body (None). A failed HRV request must not
+        # lose the sleep fields already fetched; hrv=None keeps the entry on the incomplete TTL.
+        try:
+            hrv_data = client.get_hrv_data(date_str)
+        except Exception:
+            hrv_data = None
+        hrv = ((hrv_data or {}).get('hrvSummary') or {}).get('lastNightAvg')
+
+        resting_heart_rate = sleep_data.get('restingHeartRate') if isinstance(sleep_data, dict) else None
+        sleep_score = None
+        if isinstance(sleep_data, dict):
+            sleep_score = (
+                (sleep_data.get('dailySleepDTO') or {})
+                .get('sleepScores', {})
+                .get('overall', {})
+                .get('value')
+            )
+        return {
+            'resting_heart_rate': resting_heart_rate,
+            'sleep_score': sleep_score,
+            'hrv': hrv,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_wellness_cache() -> WellnessCache:
+    """Process-wide wellness cache shared by ReportBuilder, ReportManager and MarathonPlan."""
+    return WellnessCache(JsonFileCache(os.path.join(LOCAL_CACHE_DIR, "wellness_cache.json")))
@@ -12,8 +12,9 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from back_end.report_objects.report_reader import ReportReader
-from back_end.report_objects.report_manager import ReportManager
 from back_end.marathon_objects.marathon_plan_manager import MarathonPlan
+from front_end.data_layer import clear_garmin_data, get_report_manager, load_personal_records, load_weekly_mileage
+from front_end.warmup import FAILED, start_warmup
 
 # Configuration constants
 WEEKS_FOR_WEEKLY_MILEAGE = 14
@@ -76,15 +77,23 @@ def main():
                         client = reader.fetch_garmin_data()
                         st.session_state.garmin_client = client
                         st.session_state.user_name = client.display_name
+                        # Prefetch tab data and the pace model while the user looks around
+                        st.session_state.warmup_job = start_warmup(client.display_name, client, *weekly_mileage_range())
                         st.success(f"Connected as {client.display_name}!")
                         st.rerun()
                     except Exception as e:
                         st.error(f"Failed to connect: {str(e)}")
         else:
             st.success(f"Connected as {st.session_state.user_name}")
+            show_warmup_status()
+            if st.button("Refresh Garmin Data", help="Drop cached mileage and PRs and fetch them again"):
+                clear_garmin_data()
+                st.rerun()
             if st.button("Disconnect"):
+                clear_garmin_data()
                 st.session_state.garmin_client = None
                 st.session_state.user_name = None
+                st.session_state.warmup_job = None
                 st.rerun()
     
     # Main content
@@ -108,25 +117,58 @@ def main():
         show_pace_prediction_tab()
 
 
+def weekly_mileage_range():
+    """(start_date, end_date) shown on the Weekly Mileage tab; the warm-up prefetches the same range."""
+    end_date = datetime.now().date()
+    return end_date - timedelta(weeks=WEEKS_FOR_WEEKLY_MILEAGE), end_date
+
+
+def show_warmup_status():
+    job = st.session_state.get('warmup_job')
+    if job is None:
+        return
+    if job.done:
+        failed = [label for label, status, _ in job.snapshot() if status == FAILED]
+        if failed:
+            st.caption(f"Prefetch incomplete ({', '.join(failed)}); those tabs will load on demand.")
+        else:
+            st.caption("✅ Data prefetched")
+        return
+    _warmup_progress()
+
+
+@st.fragment(run_every=1)
+def _warmup_progress():
+    job = st.session_state.get('warmup_job')
+    if job is None:
+        return
+    if job.done:
+        # Full rerun so the tabs pick up the warmed caches and the poller stops
+        st.rerun()
+    st.progress(job.progress(), text="Preparing your data...")
+    for label, status, _ in job.snapshot():
+        icon = {'done': '✅', 'failed': '⚠️', 'running': '⏳'}.get(status, '•')
+        st.caption(f"{icon} {label}")
+
+
 def show_weekly_mileage_tab():
     st.header("📊 Weekly Mileage Analysis")
     
-    start_date = datetime.now().date() - timedelta(weeks=WEEKS_FOR_WEEKLY_MILEAGE)
-    end_date = datetime.now().date()    
-    week_period = 7
-    
-    
+    start_date, end_date = weekly_mileage_range()
+
+    # Keep the report on screen across reruns; the data comes from the cached data layer
     if st.button("Generate Weekly Mileage Report", type="primary"):
+        st.session_state.show_weekly_mileage = True
+
+    if st.session_state.get('show_weekly_mileage'):
         with st.spinner("Fetching weekly mileage data..."):
             try:
-                manager = ReportManager()
-                stats = manager.get_activity_statistics(
-                    client=st.session_state.garmin_client,
-                    start_date=start_date,
-                    end_date=end_date,
-                    week_period_days=week_period,
+                weekly_data = load_weekly_mileage(
+                    st.session_state.user_name,
+                    start_date,
+                    end_date,
+                    _client=st.session_state.garmin_client,
                 )
-                weekly_data = stats['weekly_mileage']
                 
                 if weekly_data.empty:
                     st.warning("No running activities found in the selected date range.")
@@ -201,16 +243,12 @@ def show_personal_records_tab():
     st.header("🏆 Personal Records")
     
     if st.button("Load Personal Records", type="primary"):
+        st.session_state.show_personal_records = True
+
+    if st.session_state.get('show_personal_records'):
         with st.spinner("Fetching personal records..."):
             try:
-                manager = ReportManager()
-                # Use same default range; dates unused for PRs
-                stats = manager.get_activity_statistics(
-                    client=st.session_state.garmin_client,
-                    start_date=(datetime.now().date() - timedelta(weeks=WEEKS_FOR_WEEKLY_MILEAGE)),
-                    end_date=datetime.now().date(),
-                )
-                pr_data = stats['personal_records']
+                pr_data = load_personal_records(st.session_state.user_name, _client=st.session_state.garmin_client)
                 
                 if pr_data.empty:
                     st.warning("No personal records found.")
@@ -300,7 +338,7 @@ def show_personal_records_tab():
 
 def show_marathon_plan_tab():
     st.header("📝 Marathon Plan")
-    report_mgr = ReportManager()
+    report_mgr = get_report_manager()
     plan_cls = MarathonPlan
     # --- 1. INITIALIZATION ---
     if 'mp_initialized' not in st.session_state:
@@ -311,8 +349,8 @@ def show_marathon_plan_tab():
             st.session_state.mp_name = name
             st.session_state.mp_start = start_d
             st.session_state.mp_race = race_d
-            # Store RAW plan (no totals) in session state
-            st.session_state.initial_df = df.copy()
+            # Store RAW plan (no totals) in session state; get_plan already returns a fresh frame
+            st.session_state.initial_df = df
         else:
             default_name = 'My Marathon Plan'
             default_start = datetime.now().date()
@@ -320,8 +358,7 @@ def show_marathon_plan_tab():
             st.session_state.mp_name = default_name
             st.session_state.mp_start = default_start
             st.session_state.mp_race = default_race
-            gen_df = plan_cls(default_name, default_start, default_race).df
-            st.session_state.initial_df = gen_df.copy()
+            st.session_state.initial_df = plan_cls(default_name, default_start, default_race).df
 
         st.session_state.mp_initialized = True
         
@@ -350,8 +387,8 @@ def show_marathon_plan_tab():
         if st.button("Create/Reset Plan", type="primary"):
             gen_df = plan_cls(st.session_state.mp_name, st.session_state.mp_start, st.session_state.mp_race).df
             # Overwrite session state with new RAW plan data
-            st.session_state.initial_df = gen_df.copy()
-            st.session_state.edited_df = st.session_state.initial_df.copy()
+            st.session_state.initial_df = gen_df
+            st.session_state.edited_df = gen_df
     
     with c2:
         # Load selected plan (if changed)
@@ -362,36 +399,15 @@ def show_marathon_plan_tab():
                 st.session_state.mp_name = name
                 st.session_state.mp_start = start_d
                 st.session_state.mp_race = race_d
-                st.session_state.initial_df = df.copy()
-                st.session_state.edited_df = st.session_state.initial_df.copy()
+                st.session_state.initial_df = df
+                st.session_state.edited_df = df
 
     # --- 4. PLAN EDITOR ---
     st.subheader("Plan Editor")
     st.caption("Format each day as '#: Description' (e.g., '8: Easy'). Only the number before ':' is summed into Weekly Total.")
     
-    # Ensure expected columns exist in state
-    def ensure_columns(df: pd.DataFrame) -> pd.DataFrame:
-        dfc = df.copy()
-        expected = ['Week', 'First_Monday', *plan_cls.distance_columns(), *plan_cls.type_columns(), *plan_cls.notes_columns()]
-        for col in expected:
-            if col not in dfc.columns:
-                if col.endswith('_Dist'):
-                    dfc[col] = 0.0
-                elif col.endswith('_Type'):
-                    dfc[col] = plan_cls.RUN_TYPES[0]
-                elif col.endswith('_Notes'):
-                    dfc[col] = ''
-        # Coerce dtypes to match editor configs
-        for col in plan_cls.distance_columns():
-            if col in dfc.columns:
-                dfc[col] = pd.to_numeric(dfc[col], errors='coerce').fillna(0.0)
-        for col in plan_cls.type_columns():
-            if col in dfc.columns:
-                dfc[col] = dfc[col].fillna(plan_cls.RUN_TYPES[0]).astype(str)
-        for col in plan_cls.notes_columns():
-            if col in dfc.columns:
-                dfc[col] = dfc[col].fillna('').astype(str)
-        return dfc[expected]
+    # Ensure expected columns exist in state (returns the same frame when it already conforms)
+    ensure_columns = plan_cls.normalize_plan_df
 
     st.session_state.initial_df = ensure_columns(st.session_state.initial_df)
 
@@ -415,9 +431,8 @@ def show_marathon_plan_tab():
     )
     st.session_state.edited_df = ensure_columns(edited_df)
     
-    # Build totals and readable view
-    totals_view_df = plan_cls.compute_weekly_totals_df(st.session_state.edited_df.copy())
-    readable_df = plan_cls.build_readable_view(st.session_state.edited_df.copy())
+    # Build readable view (includes weekly totals; does not modify edited_df)
+    readable_df = plan_cls.build_readable_view(st.session_state.edited_df)
 
 
     # Readable table
@@ -440,7 +455,7 @@ def show_marathon_plan_tab():
 
 def show_pace_prediction_tab():
     st.header("⚡ Pace Prediction")
-    report_mgr = ReportManager()
+    report_mgr = get_report_manager()
 
     if 'garmin_client' not in st.session_state or st.session_state.garmin_client is None:
         st.info("👈 Please authenticate in the sidebar to use pace prediction.")
@@ -483,15 +498,14 @@ def show_pace_prediction_tab():
 
     if st.button("Predict Pace", type="primary"):
         run_date = today_date
-        # Ensure model is trained once
-        if getattr(report_mgr, 'pacing_model', None) is None:
-            with st.spinner("Training model for prediction..."):
-                report_mgr.train_pacing_model(st.session_state.garmin_client)
-        with st.spinner("Predicting pace... may take 1-2 minutes"):
+        # Load the saved model; only retrains (1-2 minutes) when new activities have arrived
+        with st.spinner("Loading pace model..."):
+            predictor = report_mgr.load_pacing_predictor(st.session_state.garmin_client)
+        with st.spinner("Predicting pace..."):
             result = plan_obj.predict_pace_for_run_date(
                 client=st.session_state.garmin_client,
                 run_date=pd.Timestamp(run_date).date(),
-                model=report_mgr.pacing_model,
+                model=predictor,
             )
         if result is None:
             st.warning("Skipped: Rest day, zero distance, or missing data.")
@@ -525,27 +539,20 @@ def show_pace_prediction_tab():
             st.metric("🎯 Target HR (bpm)", f"{int(result['inputs']['avg_hr'])}")
         # Optional: show model analysis metrics in a dropdown
         with st.expander("📊 Model Metrics"):
-            # Ensure model exists
-            if getattr(report_mgr, 'pacing_model', None) is None:
-                with st.spinner("Training model to compute metrics..."):
-                    report_mgr.train_pacing_model(st.session_state.garmin_client)
-            try:
-                res = report_mgr.pacing_model.analyze_model()
-                if len(res) == 5:
-                    _, accuracy, coef_df, r2_train, r2_test = res  # ignore VIF
-                else:
-                    accuracy, coef_df, r2_train, r2_test = res
+            # Metrics were computed when the model was trained and saved with it
+            metrics = report_mgr.pacing_model_metrics
+            if not metrics:
+                st.warning("No metrics were recorded for this model.")
+            else:
                 m1, m2, m3 = st.columns(3)
                 with m1:
-                    st.metric("🎯 Accuracy (within 10s)", f"{accuracy}%")
+                    st.metric("🎯 Accuracy (within 10s)", f"{metrics['accuracy_within_10s_percent']}%")
                 with m2:
-                    st.metric("📈 R² Train", f"{r2_train:.3f}")
+                    st.metric("📈 R² Train", f"{metrics['r_squared_train']:.3f}")
                 with m3:
-                    st.metric("🧪 R² Test", f"{r2_test:.3f}")
+                    st.metric("🧪 R² Test", f"{metrics['r_squared_test']:.3f}")
                 st.caption("Standardized Coefficients")
-                st.dataframe(coef_df, hide_index=True, use_container_width=True)
-            except Exception as e:
-                st.warning(f"Could not compute metrics: {e}")
+                st.dataframe(pd.DataFrame(metrics['coefficients']), hide_index=True, use_container_width=True)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,43 @@
+"""
+Cached data access for the Streamlit tabs.
+
+Streamlit re-executes app.py on every interaction, and every tab renders on every rerun. The
+loaders below sit between the tabs and ReportManager so each dataset is fetched separately and at
+most once per TTL, and is then shared by all tabs, reruns and browser sessions:
+
+- get_report_manager: one ReportManager per server process (st.cache_resource)
+- load_weekly_mileage: keyed by (user, start_date, end_date)
+- load_personal_records: keyed by user
+
+The Garmin client is passed as `_client`; Streamlit does not hash arguments that start with an
+underscore, so the cache key is only the user and the date range. clear_garmin_data drops
+everything fetched from Garmin (the Refresh button and Disconnect use it).
+"""
+
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from back_end.constants import UI_PERSONAL_RECORDS_TTL_SECONDS, UI_WEEKLY_MILEAGE_TTL_SECONDS
+from back_end.report_objects.report_manager import ReportManager
+
+
+@st.cache_resource(show_spinner=False)
+def get_report_manager() -> ReportManager:
+    return ReportManager()
+
+
+@st.cache_data(ttl=UI_WEEKLY_MILEAGE_TTL_SECONDS, show_spinner=False)
+def load_weekly_mileage(user: str, start_date: date, end_date: date, _client) -> pd.DataFrame:
+    return get_report_manager().get_weekly_mileage(_client, start_date, end_date)
+
+
+@st.cache_data(ttl=UI_PERSONAL_RECORDS_TTL_SECONDS, show_spinner=False)
+def load_personal_records(user: str, _client) -> pd.DataFrame:
+    return get_report_manager().get_personal_records(_client)
+
+
+def clear_garmin_data() -> None:
+    load_weekly_mileage.clear()
+    load_personal_records.clear()
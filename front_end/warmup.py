@@ -0,0 +1,82 @@
+"""
+Background warm-up after connecting to Garmin.
+
+start_warmup launches one daemon thread per session that fills the same caches the tabs read, so
+the first click on any tab is served from memory instead of waiting on cold Garmin/weather calls
+or a model train:
+
+- weekly mileage and personal records: the data_layer loaders (st.cache_data)
+- today's sleep/HRV: the wellness cache
+- the current hour's weather at the default location: the weather cache
+- the pacing predictor: loaded (or trained) on the shared ReportManager
+
+Steps run in order, cheapest first; a failed step is recorded and the rest still run. The
+thread is given the starting script's ScriptRunContext, so the st.cache_data loaders run as they
+would on the script thread (no "missing ScriptRunContext" warnings). It never calls Streamlit UI
+functions. The sidebar polls WarmupJob.snapshot() to show progress.
+"""
+
+import threading
+from datetime import date, datetime
+from typing import Callable, List, Tuple
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+
+from back_end.constants import DEFAULT_LATITUDE, DEFAULT_LONGITUDE
+from back_end.report_objects.report_reader import ReportReader
+from back_end.report_objects.wellness_cache import get_wellness_cache
+from front_end.data_layer import get_report_manager, load_personal_records, load_weekly_mileage
+
+PENDING, RUNNING, DONE, FAILED = 'pending', 'running', 'done', 'failed'
+
+
+class WarmupJob:
+    def __init__(self, user: str, client, start_date: date, end_date: date):
+        self.user = user
+        self.steps: List[Tuple[str, Callable[[], None]]] = [
+            ("Personal records", lambda: load_personal_records(user, _client=client)),
+            ("Today's sleep/HRV", lambda: get_wellness_cache().get(client, date.today())),
+            ("Today's weather", lambda: ReportReader().fetch_weather_bulk([(DEFAULT_LATITUDE, DEFAULT_LONGITUDE, datetime.now())])),
+            ("Recent activities", lambda: load_weekly_mileage(user, start_date, end_date, _client=client)),
+            ("Pace model", lambda: get_report_manager().load_pacing_predictor(client)),
+        ]
+        self._status = {label: (PENDING, '') for label, _ in self.steps}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=f"warmup-{user}", daemon=True)
+
+    def start(self) -> 'WarmupJob':
+        # Called from the script thread: hand its context to the warm-up thread for st.cache_data
+        add_script_run_ctx(self._thread)
+        self._thread.start()
+        return self
+
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    def snapshot(self) -> List[Tuple[str, str, str]]:
+        """(step label, status, error message) for each step, in order."""
+        with self._lock:
+            return [(label, *self._status[label]) for label, _ in self.steps]
+
+    def progress(self) -> float:
+        finished = sum(1 for _, status, _ in self.snapshot() if status in (DONE, FAILED))
+        return finished / len(self.steps)
+
+    def _set(self, label: str, status: str, message: str = '') -> None:
+        with self._lock:
+            self._status[label] = (status, message)
+
+    def _run(self) -> None:
+        for label, step in self.steps:
+            self._set(label, RUNNING)
+            try:
+                step()
+                self._set(label, DONE)
+            except Exception as e:
+                print(f"Warm-up step '{label}' failed: {e}")
+                self._set(label, FAILED, str(e))
+
+
+def start_warmup(user: str, client, start_date: date, end_date: date) -> WarmupJob:
+    return WarmupJob(user, client, start_date, end_date).start()